@@ -1,5 +1,5 @@
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord import app_commands
 
 
@@ -12,265 +12,84 @@ import re
 import asyncio
 import logging
 import copy
+import base64
 import functools
+import hashlib
+import math
 import pytz
 import aiohttp
 
 from threading import Thread
 from datetime import time as dtime
 from datetime import datetime, date, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
 from typing import Optional
+from urllib.parse import parse_qs, urlparse
 
 from dotenv import load_dotenv
 import firebase_admin
 from firebase_admin import credentials, db
 
 from io import BytesIO
-from PIL import Image, ImageDraw, ImageFont
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+
+import rank_render
 
 import logging
 logging.basicConfig(level=logging.INFO)
 
-
 # =========================
-# Rank card rendering (Pillow)
+# Rank card output cache
 # =========================
 
-_ASSET_DIR = os.path.join(os.path.dirname(__file__), "assets")
-_BG_PATH = os.path.join(_ASSET_DIR, "rank_bg.png")
-_FONT_PATH = os.path.join(_ASSET_DIR, "fonts", "Donoun Medium.ttf")  # 네가 넣은 폰트명에 맞춤
-
-_BG_TEMPLATE = None  # type: Optional[Image.Image]
-_FONT_CACHE = {}     # size -> ImageFont.FreeTypeFont
-
-_QUEST_BG_PATH = os.path.join(_ASSET_DIR, "quest_banner_bg.png")
-_QUEST_BG_TEMPLATE = None  # type: Optional[Image.Image]
-
-def _get_quest_bg_template() -> Image.Image:
-    global _QUEST_BG_TEMPLATE
-    if _QUEST_BG_TEMPLATE is None:
-        try:
-            bg = Image.open(_QUEST_BG_PATH).convert("RGBA")
-        except Exception:
-            # 파일 없으면 rank_bg로 폴백
-            bg = _get_bg_template()
-        _QUEST_BG_TEMPLATE = bg
-    return _QUEST_BG_TEMPLATE
-
-
-def _get_bg_template() -> Image.Image:
-    global _BG_TEMPLATE
-    if _BG_TEMPLATE is None:
-        bg = Image.open(_BG_PATH).convert("RGBA")
-        _BG_TEMPLATE = bg
-    return _BG_TEMPLATE
-
-
-def _get_font(size: int) -> ImageFont.FreeTypeFont:
-    font = _FONT_CACHE.get(size)
-    if font is None:
-        font = ImageFont.truetype(_FONT_PATH, size)
-        _FONT_CACHE[size] = font
-    return font
-
-
-def _format_int(n: int) -> str:
-    try:
-        return f"{int(n):,}"
-    except Exception:
-        return str(n)
-
-
-def _clamp01(x: float) -> float:
-    if x < 0.0:
-        return 0.0
-    if x > 1.0:
-        return 1.0
-    return x
-
-
-def _ellipsize(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> str:
-    if not text:
-        return ""
-    if draw.textlength(text, font=font) <= max_width:
-        return text
-
-    ell = "…"
-    lo, hi = 0, len(text)
-    # 이진 탐색으로 최대 길이 찾기
-    while lo < hi:
-        mid = (lo + hi) // 2
-        cand = text[:mid] + ell
-        if draw.textlength(cand, font=font) <= max_width:
-            lo = mid + 1
-        else:
-            hi = mid
-    cut = max(0, lo - 1)
-    return text[:cut] + ell
-
-
-def _circle_crop(im: Image.Image, size: int) -> Image.Image:
-    # 정사각으로 맞춘 뒤 원형 마스크
-    im = im.convert("RGBA")
-    w, h = im.size
-    s = min(w, h)
-    left = (w - s) // 2
-    top = (h - s) // 2
-    im = im.crop((left, top, left + s, top + s))
-
-    resample = getattr(Image, "Resampling", None)
-    if resample is not None:
-        im = im.resize((size, size), resample=resample.LANCZOS)
-    else:
-        im = im.resize((size, size), resample=Image.LANCZOS)
-
-    mask = Image.new("L", (size, size), 0)
-    md = ImageDraw.Draw(mask)
-    md.ellipse((0, 0, size - 1, size - 1), fill=255)
-
-    out = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    out.paste(im, (0, 0), mask)
-    return out
-
-
-def render_rank_card(
-    *,
-    display_name: str,
-    level: int,
-    total_xp: int,
-    cur_xp: int,
-    need_xp: int,
-    pct: float,
-    avatar_bytes: Optional[bytes] = None,
-) -> BytesIO:
-    """
-    디스코드/DB와 무관한 순수 렌더러.
-    - 입력: 가공된 수치 + 아바타 이미지 bytes
-    - 출력: PNG(BytesIO)
-    """
-    bg = _get_bg_template()
-    img = bg.copy()
-    draw = ImageDraw.Draw(img)
-
-    # ===== 레이아웃 (600x240 기준) =====
-    AVATAR_SIZE = 96
-    AVATAR_X, AVATAR_Y = 36, 72
-
-    TEXT_X = 155
-    NAME_Y = 60
-    STAT_Y = 102
-    XP_Y = 130
-
-    BAR_X, BAR_Y = 150, 180
-    BAR_W, BAR_H = 300, 22
-    BAR_RADIUS = 11  # BAR_H//2
-
-    # ===== 아바타 =====
-    if avatar_bytes:
-        try:
-            av = Image.open(BytesIO(avatar_bytes))
-            av = _circle_crop(av, AVATAR_SIZE)
-            img.paste(av, (AVATAR_X, AVATAR_Y), av)
-        except Exception:
-            # 아바타 실패 시 회색 원으로 대체
-            fallback = Image.new("RGBA", (AVATAR_SIZE, AVATAR_SIZE), (0, 0, 0, 0))
-            fd = ImageDraw.Draw(fallback)
-            fd.ellipse((0, 0, AVATAR_SIZE - 1, AVATAR_SIZE - 1), fill=(120, 120, 120, 255))
-            img.paste(fallback, (AVATAR_X, AVATAR_Y), fallback)
-
-    # ===== 폰트 =====
-    font_name = _get_font(28)
-    font_stat = _get_font(22)
-    font_small = _get_font(18)
-
-    # ===== 닉네임 =====
-    name_max_w = 600 - TEXT_X - 30
-    safe_name = _ellipsize(draw, display_name, font_name, name_max_w)
-    draw.text((TEXT_X, NAME_Y), safe_name, font=font_name, fill=(0x05, 0x44, 0x6B, 255))
-
-    # ===== 레벨 / XP =====
-    draw.text((TEXT_X, STAT_Y), f"Lv. {int(level)}", font=font_stat, fill=(0xFF, 0xFF, 0xFF, 255))
-    draw.text((TEXT_X, XP_Y), f"XP  {_format_int(total_xp)}", font=font_stat, fill=(0x9E, 0x9E, 0x9E, 255))
-
-    # ===== 진행도 바 =====
-    pct = _clamp01(float(pct))
-    # 바 배경
-    draw.rounded_rectangle(
-        (BAR_X, BAR_Y, BAR_X + BAR_W, BAR_Y + BAR_H),
-        radius=BAR_RADIUS,
-        fill=(0xED, 0xF8, 0xFC, 255),
-    )
-    # 바 채움
-    fill_w = int(BAR_W * pct)
-    if fill_w > 0:
-        draw.rounded_rectangle(
-            (BAR_X, BAR_Y, BAR_X + fill_w, BAR_Y + BAR_H),
-            radius=BAR_RADIUS,
-            fill=(0x05, 0x44, 0x6B, 255),
-        )
-
-    # 진행도 텍스트
-    # 예: "123 / 456 (27%)"
-    pct_int = int(round(pct * 100))
-    prog_text = f"{_format_int(cur_xp)} / {_format_int(need_xp)} ({pct_int}%)"
-    draw.text((BAR_X, BAR_Y - 22), prog_text, font=font_small, fill=(60, 60, 60, 255))
-
-    # ===== PNG 출력 =====
-    buf = BytesIO()
-    img.save(buf, format="PNG")
-    buf.seek(0)
-    return buf
-
-def render_daily_quest_banner(
-    *,
-    display_name: str,
-    pct_int: int,
-    height: int = 70,
-    reward_pct: int = 1,
-) -> BytesIO:
-    """
-    채팅 한 줄 체감용 초슬림 배너 (아이콘 없음, 단일 행)
-    레이아웃:
-    [일일 퀘스트 성공!  경험치 1% 지급   |   서버 닉네임 님의   |   현재 경험치 37%]
-    """
-    bg = _get_quest_bg_template()
-    w = bg.size[0]
-    h = int(height)
-
-    base = bg.crop((0, 0, w, min(h, bg.size[1]))).copy()
-    if base.size[1] != h:
-        img = Image.new("RGBA", (w, h), (245, 245, 245, 255))
-        img.paste(base, (0, 0))
-    else:
-        img = base
-
-    draw = ImageDraw.Draw(img)
-    font = _get_font(16)
+# 카드에 누적 XP가 정확한 값으로 찍히므로 XP 구간 폭은 1(정확히 같은 XP일 때만 재사용)입니다.
+RANK_CARD_CACHE_MAX = int(os.getenv("RANK_CARD_CACHE_MAX", "512"))
+_RANK_CARD_CACHE = OrderedDict()  # key -> rank_render.EncodedImage
+_RANK_CARD_STATS = {"hits": 0, "misses": 0, "renders": 0, "render_ms_total": 0.0, "render_ms_max": 0.0}
 
-    x = 18
-    max_w = w - (x * 2)
 
-    title = "일일 퀘스트 성공!"
-    reward = f"경험치 {reward_pct}% 지급"
-    nick = f"{display_name} 님의"
-    prog = f"현재 경험치 {max(0, min(100, int(pct_int)))}%"
+def rank_card_cache_key(uid: str, level: int, total_xp: int, display_name: str, avatar_key: Optional[str]) -> tuple:
+    return (str(uid), int(level), int(total_xp), display_name, avatar_key or "")
 
-    sep = "   |   "
-    line = f"{title}  {reward}{sep}{nick}{sep}{prog}"
 
-    safe_line = _ellipsize(draw, line, font, max_w)
-    
-    bbox = draw.textbbox((0, 0), safe_line, font=font)
-    text_h = bbox[3] - bbox[1]
-    y = (h - text_h) // 2 - bbox[1]
-    
-    draw.text((x, y), safe_line, font=font, fill=(0, 0, 0, 255))
+def rank_card_cache_get(key: tuple) -> Optional[rank_render.EncodedImage]:
+    data = _RANK_CARD_CACHE.get(key)
+    if data is None:
+        _RANK_CARD_STATS["misses"] += 1
+        return None
+    _RANK_CARD_CACHE.move_to_end(key)
+    _RANK_CARD_STATS["hits"] += 1
+    return data
+
+
+def rank_card_cache_put(key: tuple, data: rank_render.EncodedImage, render_ms: float):
+    # 같은 유저의 예전 카드는 다시 쓰일 일이 없으므로 바로 비웁니다.
+    for old in [k for k in _RANK_CARD_CACHE if k[0] == key[0]]:
+        _RANK_CARD_CACHE.pop(old, None)
+    _RANK_CARD_CACHE[key] = data
+    while len(_RANK_CARD_CACHE) > RANK_CARD_CACHE_MAX:
+        _RANK_CARD_CACHE.popitem(last=False)
+    _RANK_CARD_STATS["renders"] += 1
+    _RANK_CARD_STATS["render_ms_total"] += render_ms
+    _RANK_CARD_STATS["render_ms_max"] = max(_RANK_CARD_STATS["render_ms_max"], render_ms)
+
+
+def rank_card_stats() -> dict:
+    hits = _RANK_CARD_STATS["hits"]
+    lookups = hits + _RANK_CARD_STATS["misses"]
+    renders = _RANK_CARD_STATS["renders"]
+    return {
+        "cached": len(_RANK_CARD_CACHE),
+        "hits": hits,
+        "misses": _RANK_CARD_STATS["misses"],
+        "hit_rate": round(hits / lookups, 3) if lookups else None,
+        "renders": renders,
+        "render_ms_avg": round(_RANK_CARD_STATS["render_ms_total"] / renders, 1) if renders else None,
+        "render_ms_max": round(_RANK_CARD_STATS["render_ms_max"], 1),
+    }
 
-    buf = BytesIO()
-    img.save(buf, format="PNG")
-    buf.seek(0)
-    return buf
 
 
 # =======================================================================
@@ -379,16 +198,111 @@ def _safe_float(v, default: float = 0.0) -> float:
     except Exception:
         return default
 
+# ---- 출석 달력 비트셋 ----
+# days = {"y2025": base64(46바이트)} : 연도별로 1월 1일부터 하루당 1비트.
+# 누적 출석일은 base_days + 비트 수이고, 주/월 출석 수도 비트를 세어 구합니다.
+# base_days 는 비트셋 도입 전(또는 관리자 수정으로 생긴) 날짜를 알 수 없는 출석 수입니다.
+# 관리자가 누적값을 날짜 비트 수보다 낮게 고치면 음수가 될 수 있으며, 이때 누적은 0 아래로 내려가지 않습니다.
+_ATTENDANCE_YEAR_BYTES = 46  # 366일 → 368비트
+
+
+def _attendance_year_key(day: date) -> str:
+    return f"y{day.year}"
+
+
+def _decode_year_bits(encoded) -> bytearray:
+    bits = bytearray(_ATTENDANCE_YEAR_BYTES)
+    if isinstance(encoded, str) and encoded:
+        try:
+            raw = base64.b64decode(encoded)
+        except Exception:
+            raw = b""
+        bits[:len(raw[:_ATTENDANCE_YEAR_BYTES])] = raw[:_ATTENDANCE_YEAR_BYTES]
+    return bits
+
+
+def _encode_year_bits(bits: bytearray) -> str:
+    # 뒤쪽의 0 바이트는 저장하지 않습니다. 연초에는 레코드가 더 작아집니다.
+    return base64.b64encode(bytes(bits).rstrip(b"\x00")).decode("ascii")
+
+
+def _attendance_bits_popcount(days: dict) -> int:
+    return sum(
+        int.from_bytes(_decode_year_bits(encoded), "little").bit_count()
+        for encoded in (days or {}).values()
+    )
+
+
+def attendance_mark_day(ud: dict, day: date):
+    days = ud.setdefault("days", {})
+    key = _attendance_year_key(day)
+    bits = _decode_year_bits(days.get(key))
+    offset = day.timetuple().tm_yday - 1
+    bits[offset >> 3] |= 1 << (offset & 7)
+    days[key] = _encode_year_bits(bits)
+
+
+def attendance_count_between(ud: dict, start: date, end: date) -> int:
+    """start ~ end (양 끝 포함) 중 출석한 날 수."""
+    days = ud.get("days") or {}
+    count = 0
+    decoded: dict[str, bytearray] = {}
+    day = start
+    while day <= end:
+        key = _attendance_year_key(day)
+        if key not in decoded:
+            decoded[key] = _decode_year_bits(days.get(key))
+        offset = day.timetuple().tm_yday - 1
+        if decoded[key][offset >> 3] & (1 << (offset & 7)):
+            count += 1
+        day += timedelta(days=1)
+    return count
+
+
+def attendance_week_count(ud: dict, day: date) -> int:
+    monday = day - timedelta(days=day.weekday())
+    return attendance_count_between(ud, monday, monday + timedelta(days=6))
+
+
+def attendance_month_count(ud: dict, day: date) -> int:
+    first = day.replace(day=1)
+    last = (first + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    return attendance_count_between(ud, first, last)
+
+
+def recount_attendance_total(ud: dict):
+    ud["total_days"] = max(0, _safe_int(ud.get("base_days", 0), 0) + _attendance_bits_popcount(ud.get("days")))
+
+
+def _migrate_attendance_maps(ud: dict):
+    """
+    weekly/monthly 맵 레코드를 비트셋으로 옮깁니다.
+    맵에는 날짜가 없으므로, 확실히 아는 연속 출석 구간(last_date 부터 streak 일)만 비트로 찍고
+    나머지 누적분은 base_days 로 보존합니다.
+    """
+    total = max(0, _safe_int(ud.get("total_days", 0), 0))
+    streak = min(max(0, _safe_int(ud.get("streak", 0), 0)), total)
+    ud["days"] = {}
+    try:
+        last = datetime.strptime(str(ud.get("last_date") or ""), "%Y-%m-%d").date()
+    except ValueError:
+        last = None
+    if last is not None:
+        for back in range(streak):
+            attendance_mark_day(ud, last - timedelta(days=back))
+    ud["base_days"] = total - _attendance_bits_popcount(ud["days"])
+    ud.pop("weekly", None)
+    ud.pop("monthly", None)
+
+
 def normalize_attendance_record(ud: dict | None) -> dict:
     if not isinstance(ud, dict):
         ud = {}
     ud.setdefault("last_date", "")
     ud["total_days"] = max(0, _safe_int(ud.get("total_days", 0), 0))
     ud["streak"] = max(0, _safe_int(ud.get("streak", 0), 0))
-    if not isinstance(ud.get("weekly"), dict):
-        ud["weekly"] = {}
-    if not isinstance(ud.get("monthly"), dict):
-        ud["monthly"] = {}
+    if "base_days" not in ud or not isinstance(ud.get("days"), dict):
+        _migrate_attendance_maps(ud)
     return ud
 
 def _until_next_attendance(now_kst: datetime) -> tuple[int, int]:
@@ -396,10 +310,16 @@ def _until_next_attendance(now_kst: datetime) -> tuple[int, int]:
     h, m = divmod(int(until.total_seconds() // 60), 60)
     return h, m
 
-def _build_attendance_stats_line(total_days: int, streak: int, gain: int | None = None) -> str:
+def _build_attendance_stats_line(total_days: int, streak: int, gain: int | None = None,
+                                 week_days: int | None = None, month_days: int | None = None) -> str:
+    line = f"누적 {total_days}일 · 연속 {streak}일"
+    if week_days is not None:
+        line += f" · 이번 주 {week_days}일"
+    if month_days is not None:
+        line += f" · 이번 달 {month_days}일"
     if gain is None:
-        return f"누적 {total_days}일 · 연속 {streak}일"
-    return f"누적 {total_days}일 · 연속 {streak}일 · +{gain} XP"
+        return line
+    return f"{line} · +{gain} XP"
 
 SAFEGUARD_DISABLE_EXTERNAL_IO = os.getenv("SAFEGUARD_DISABLE_EXTERNAL_IO", "1") == "1"
 SAFEGUARD_MIN_INTERVAL_GLOBAL = float(os.getenv("SAFEGUARD_MIN_INTERVAL_GLOBAL", "1.0"))  # 전역 처리 간 최소 간격(초)
@@ -588,10 +508,14 @@ async def aload_exp_data():
     return await asyncio.to_thread(load_exp_data)
 
 async def asave_exp_data(data):
-    return await asyncio.to_thread(save_exp_data, data)
+    result = await asyncio.to_thread(save_exp_data, data)
+    exp_mirror.replace_all(data)
+    return result
 
 async def asave_user_exp(user_id, user_data):
-    return await asyncio.to_thread(save_user_exp, user_id, user_data)
+    result = await asyncio.to_thread(save_user_exp, user_id, user_data)
+    exp_mirror.apply_user(user_id, user_data)
+    return result
 
 async def aload_mission_data():
     return await asyncio.to_thread(load_mission_data)
@@ -606,21 +530,30 @@ async def aget_attendance_data():
     return await asyncio.to_thread(get_attendance_data)
 
 async def aset_attendance_data(user_id, data):
-    return await asyncio.to_thread(set_attendance_data, user_id, data)
+    result = await asyncio.to_thread(set_attendance_data, user_id, data)
+    attendance_mirror.apply_user(user_id, data)
+    return result
 
 async def aget_attendance_user(uid: str) -> dict:
     return await asyncio.to_thread(get_attendance_user, uid)
 
 async def aset_attendance_user(uid: str, data: dict):
-    return await asyncio.to_thread(set_attendance_user, uid, data)
+    result = await asyncio.to_thread(set_attendance_user, uid, data)
+    attendance_mirror.apply_user(uid, data)
+    return result
 
 async def abulk_update_attendance(updates: dict):
-    return await asyncio.to_thread(bulk_update_attendance, updates)
+    ok = await asyncio.to_thread(bulk_update_attendance, updates)
+    if ok:
+        _apply_root_updates_to_caches({f"{ATTENDANCE_DB_KEY}/{path}": value for path, value in updates.items()})
+    return ok
 
 
 # 같은 유저에게 여러 보상 루프가 동시에 접근할 때 발생하는 덮어쓰기를 막습니다.
 _USER_STATE_LOCKS: dict[str, asyncio.Lock] = {}
 _LEVEL100_AWARD_CACHE: set[tuple[str, str]] = set()
+_LEVEL100_AWARD_INDEX_LOADED: set[str] = set()   # season_completion 에서 지급 색인을 읽어 온 시즌
+_LEVEL100_AWARD_INDEX_LOCK = asyncio.Lock()
 _SEASON_OPERATION_LOCKS: dict[int, asyncio.Lock] = {}
 
 
@@ -674,6 +607,214 @@ def guard_background_task(name: str):
     return decorator
 
 
+# =========================
+# Background scheduler
+# =========================
+
+SCHEDULER_JITTER_SECONDS = float(os.getenv("SCHEDULER_JITTER_SECONDS", "2.0"))
+SCHEDULER_GUILD_STAGGER_SECONDS = float(os.getenv("SCHEDULER_GUILD_STAGGER_SECONDS", "10.0"))
+
+
+class ScheduledJob:
+    """반복 작업 하나의 다음 실행 시각 계산과 실행 지표를 관리합니다."""
+
+    def __init__(
+        self,
+        name: str,
+        func,
+        *,
+        interval: float | None = None,
+        offset: float = 0.0,
+        daily_at: dtime | None = None,
+        next_at=None,
+        min_gap: float = 0.0,
+        jitter: float = 0.0,
+    ):
+        if interval is None and daily_at is None and next_at is None:
+            raise ValueError("interval, daily_at, next_at 중 하나는 지정해야 합니다.")
+        self.name = name
+        self.func = func
+        self.interval = float(interval) if interval else None
+        self.offset = float(offset)
+        self.daily_at = daily_at
+        self.next_at = next_at
+        self.min_gap = max(0.0, float(min_gap))
+        self.jitter = max(0.0, float(jitter))
+        self.wake_event = asyncio.Event()
+        self.wakeups = 0
+        self.task: asyncio.Task | None = None
+        self.running = False
+        self.runs = 0
+        self.overruns = 0
+        self.merged_ticks = 0
+        self.next_run_at = 0.0
+        self.last_started_at = 0.0
+        self.last_start_latency = 0.0
+        self.max_start_latency = 0.0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self.total_duration = 0.0
+
+    def next_tick_after(self, ts: float) -> float:
+        """ts 이후의 첫 정규 실행 시각(epoch 초)을 반환합니다."""
+        if self.next_at is not None:
+            return float(self.next_at(ts))
+        if self.daily_at is not None:
+            at = self.daily_at.replace(tzinfo=None)
+            day = datetime.fromtimestamp(ts, KST).date()
+            candidate = KST.localize(datetime.combine(day, at)).timestamp()
+            if candidate <= ts:
+                candidate = KST.localize(datetime.combine(day + timedelta(days=1), at)).timestamp()
+            return candidate
+        ticks = math.floor((ts - self.offset) / self.interval) + 1
+        return ticks * self.interval + self.offset
+
+    def mark_started(self, started_at: float, latency: float):
+        self.running = True
+        self.runs += 1
+        self.last_started_at = started_at
+        self.last_start_latency = max(0.0, latency)
+        self.max_start_latency = max(self.max_start_latency, self.last_start_latency)
+
+    def mark_finished(self, duration: float):
+        self.running = False
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        self.total_duration += duration
+
+    def snapshot(self) -> dict:
+        return {
+            "running": self.running,
+            "runs": self.runs,
+            "overruns": self.overruns,
+            "merged_ticks": self.merged_ticks,
+            "wakeups": self.wakeups,
+            "next_run_at": round(self.next_run_at, 3),
+            "last_start_latency": round(self.last_start_latency, 3),
+            "max_start_latency": round(self.max_start_latency, 3),
+            "last_duration": round(self.last_duration, 3),
+            "max_duration": round(self.max_duration, 3),
+            "avg_duration": round(self.total_duration / self.runs, 3) if self.runs else 0.0,
+        }
+
+
+class BackgroundScheduler:
+    """
+    반복 작업을 한 곳에서 실행합니다.
+    - 같은 주기의 작업은 offset으로 주기 안에 분산하고, jitter로 매번 조금씩 흩뜨립니다.
+    - 작업마다 루프가 하나라 실행이 겹치지 않으며, 실행이 길어져 지나간 틱은 다음 틱 하나로 합칩니다.
+    """
+
+    def __init__(self):
+        self.jobs: dict[str, ScheduledJob] = {}
+
+    def every(self, name: str, func, *, seconds: float, offset: float = 0.0,
+              jitter: float = SCHEDULER_JITTER_SECONDS) -> ScheduledJob:
+        job = ScheduledJob(name, func, interval=seconds, offset=offset, jitter=jitter)
+        self.jobs[name] = job
+        return job
+
+    def daily(self, name: str, func, *, at: dtime) -> ScheduledJob:
+        """KST 기준 매일 at 시각에 실행합니다. 정시성이 중요하므로 jitter는 쓰지 않습니다."""
+        job = ScheduledJob(name, func, daily_at=at)
+        self.jobs[name] = job
+        return job
+
+    def dynamic(self, name: str, func, *, next_at, min_gap: float = 0.0) -> ScheduledJob:
+        """
+        실행이 끝날 때마다 next_at(now)으로 다음 실행 시각을 다시 계산합니다.
+        그 전에 wake()가 호출되면 min_gap을 지킨 뒤 바로 실행합니다.
+        """
+        job = ScheduledJob(name, func, next_at=next_at, min_gap=min_gap)
+        self.jobs[name] = job
+        return job
+
+    def wake(self, name: str, reason: str = ""):
+        job = self.jobs.get(name)
+        if job is None:
+            return
+        job.wakeups += 1
+        job.wake_event.set()
+        logging.info("[scheduler:%s] wake requested reason=%s", name, reason or "-")
+
+    def start(self):
+        """재접속으로 on_ready가 다시 호출돼도 작업 루프를 중복 생성하지 않습니다."""
+        for job in self.jobs.values():
+            if job.task is None or job.task.done():
+                job.task = asyncio.create_task(self._run(job), name=f"scheduler:{job.name}")
+
+    def snapshot(self) -> dict:
+        return {name: job.snapshot() for name, job in self.jobs.items()}
+
+    async def _sleep_until(self, job: ScheduledJob, fire_at: float) -> float:
+        """fire_at까지 기다리되 wake()가 오면 일찍 깨어나 실제 기준 시각을 반환합니다."""
+        delay = fire_at - time.time()
+        if delay <= 0:
+            return fire_at
+        try:
+            await asyncio.wait_for(job.wake_event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            return fire_at
+        return time.time()
+
+    async def _run(self, job: ScheduledJob):
+        scheduled = job.next_tick_after(time.time())
+        last_finished = 0.0
+        while True:
+            job.next_run_at = scheduled
+            fire_at = scheduled + (random.uniform(0.0, job.jitter) if job.jitter else 0.0)
+            fire_at = await self._sleep_until(job, fire_at)
+            gap_left = (last_finished + job.min_gap) - time.time()
+            if last_finished and gap_left > 0:
+                await asyncio.sleep(gap_left)
+                fire_at = time.time()
+            # 실행 중에 들어온 wake()는 지우지 않고 다음 실행으로 이어지게 합니다.
+            job.wake_event.clear()
+
+            started = time.time()
+            job.mark_started(started, started - fire_at)
+            try:
+                await job.func()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logging.exception("[scheduler:%s] run failed; next tick will continue", job.name)
+            finished = time.time()
+            last_finished = finished
+            job.mark_finished(finished - started)
+
+            if job.next_at is not None:
+                scheduled = max(job.next_tick_after(finished), finished + job.min_gap)
+                continue
+
+            next_tick = job.next_tick_after(scheduled)
+            if next_tick <= finished:
+                merged = 0
+                while next_tick <= finished:
+                    merged += 1
+                    next_tick = job.next_tick_after(next_tick)
+                job.overruns += 1
+                job.merged_ticks += merged
+                logging.warning(
+                    "[scheduler:%s] overrun duration=%.1fs merged_ticks=%s",
+                    job.name, finished - started, merged,
+                )
+            scheduled = next_tick
+
+
+background_scheduler = BackgroundScheduler()
+
+
+async def iter_guilds_staggered(guilds, spread: float = SCHEDULER_GUILD_STAGGER_SECONDS):
+    """서버별 작업 시작을 spread 초 안에 고르게 나눠 한 순간에 몰리지 않게 합니다."""
+    guilds = list(guilds)
+    step = spread / len(guilds) if len(guilds) > 1 and spread > 0 else 0.0
+    for idx, guild in enumerate(guilds):
+        if idx and step:
+            await asyncio.sleep(step)
+        yield guild
+
+
 def get_user_state_lock(uid: str | int) -> asyncio.Lock:
     key = str(uid)
     lock = _USER_STATE_LOCKS.get(key)
@@ -688,46 +829,46 @@ async def aupdate_user_exp_fields(uid: str, fields: dict):
     if not isinstance(fields, dict) or not fields:
         return
     await asyncio.to_thread(lambda: db.reference("exp_data").child(str(uid)).update(fields))
+    exp_mirror.apply_fields(uid, fields)
 
-async def aget_user_exp(uid: str):
-    def _get():
-        raw = db.reference("exp_data").child(uid).get()
+def normalize_user_exp(raw) -> dict:
+    # 1) 레코드 자체가 없으면 기본값
+    if not isinstance(raw, dict):
+        return {"exp": 0, "level": 1, "voice_minutes": 0}
 
-        # 1) 레코드 자체가 없으면 기본값
-        if not isinstance(raw, dict):
-            return {"exp": 0, "level": 1, "voice_minutes": 0}
+    # 2) exp 보정 (없거나 타입 이상하면 0)
+    exp = raw.get("exp", 0)
+    try:
+        exp = int(exp)
+    except Exception:
+        exp = 0
+    if exp < 0:
+        exp = 0
 
-        # 2) exp 보정 (없거나 타입 이상하면 0)
-        exp = raw.get("exp", 0)
-        try:
-            exp = int(exp)
-        except Exception:
-            exp = 0
-        if exp < 0:
-            exp = 0
+    # 3) 나머지 키도 기본값 보장
+    vm = raw.get("voice_minutes", 0)
+    try:
+        vm = int(vm)
+    except Exception:
+        vm = 0
+    if vm < 0:
+        vm = 0
 
-        # 3) 나머지 키도 기본값 보장
-        vm = raw.get("voice_minutes", 0)
-        try:
-            vm = int(vm)
-        except Exception:
-            vm = 0
-        if vm < 0:
-            vm = 0
+    lvl = raw.get("level", 1)
+    try:
+        lvl = int(lvl)
+    except Exception:
+        lvl = 1
 
-        lvl = raw.get("level", 1)
-        try:
-            lvl = int(lvl)
-        except Exception:
-            lvl = 1
+    # 4) 반환값은 “항상 완전한 스키마”
+    raw["exp"] = exp
+    raw["voice_minutes"] = vm
+    raw["level"] = lvl
+    return raw
 
-        # 4) 반환값은 “항상 완전한 스키마”
-        raw["exp"] = exp
-        raw["voice_minutes"] = vm
-        raw["level"] = lvl
-        return raw
 
-    return await asyncio.to_thread(_get)
+async def aget_user_exp(uid: str):
+    return await asyncio.to_thread(lambda: normalize_user_exp(db.reference("exp_data").child(uid).get()))
 
 
 async def aget_user_mission(uid: str, today: str):
@@ -888,8 +1029,10 @@ def bulk_update_attendance(updates: dict):
     """attendance_data 루트에 대해 update(부분 갱신)"""
     try:
         db.reference(ATTENDANCE_DB_KEY).update(updates)
+        return True
     except Exception as e:
         print(f"❌ bulk_update_attendance 실패: {e}")
+        return False
 
 
 def save_exp_data_strict(data: dict):
@@ -911,6 +1054,7 @@ def firebase_root_update_strict(updates: dict):
 
 async def asave_exp_data_strict(data: dict):
     await asyncio.to_thread(save_exp_data_strict, data)
+    exp_mirror.replace_all(data)
 
 
 async def asave_mission_data_strict(data: dict):
@@ -919,124 +1063,853 @@ async def asave_mission_data_strict(data: dict):
 
 async def afirebase_root_update_strict(updates: dict):
     await asyncio.to_thread(firebase_root_update_strict, updates)
-
-def load_json(path):
-    """로컬 JSON 파일 로드 (없으면 빈 dict)"""
-    if not os.path.exists(path):
-        return {}
-    with open(path, 'r') as f:
-        return json.load(f)
+    _apply_root_updates_to_caches(updates)
 
 
-def save_json(path, data):
-    """로컬 JSON 파일 저장"""
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=2)
+def _apply_root_updates_to_caches(updates: dict):
+    """다중 경로 갱신이 성공한 뒤 같은 변경을 프로세스 내 캐시에 반영합니다."""
+    season_patch: dict[str, object] = {}
+    for path, value in updates.items():
+        parts = [p for p in str(path).split("/") if p]
+        if not parts:
+            continue
+        if parts[0] == "season_state":
+            if len(parts) == 1:
+                season_state_cache.replace(value)
+            else:
+                season_patch["/".join(parts[1:])] = value
+        elif parts[0] == "user_titles":
+            invalidate_user_titles(parts[1] if len(parts) > 1 else None)
+        elif parts[0] == "season_completion":
+            _apply_completion_update_to_award_index(parts, value)
+        elif parts[0] == "season_rewards":
+            _invalidate_season_reward(parts[1] if len(parts) > 1 else None)
+        elif parts[0] == "leaderboards":
+            _apply_leaderboard_snapshot_update(parts, value)
+        elif parts[0] == "season_records" and len(parts) > 1:
+            invalidate_season_archive(parts[1])
+        elif parts[0] in ("exp_data", ATTENDANCE_DB_KEY):
+            mirror = exp_mirror if parts[0] == "exp_data" else attendance_mirror
+            if len(parts) == 1:
+                mirror.replace_all(value)
+            elif len(parts) == 2:
+                mirror.apply_user(parts[1], value)
+            else:
+                mirror.apply_fields(parts[1], {"/".join(parts[2:]): value})
+    if season_patch:
+        season_state_cache.apply_patch(season_patch)
 
 
-# ---- 유틸 함수 ----
-# === 시즌패스 레벨 계산: 1~100 동일 간격 ===
+# =========================
+# Record mirrors / rank indexes
+# =========================
 
-def calculate_level(exp: int) -> int:
+class RecordMirror:
     """
-    시즌패스 레벨 계산.
-    - Lv.1은 0XP부터 시작
-    - Lv.2부터는 SEASON_XP_PER_LEVEL 단위로 상승
-    - 최대 Lv.100
+    uid -> 레코드 형태인 DB 루트(exp_data, attendance_data)의 프로세스 내 사본입니다.
+    재시작 후 처음 필요할 때 한 번 전체를 읽고, 이후에는 저장 계층을 지나는 쓰기로만 갱신합니다.
     """
-    try:
-        exp = int(exp)
-    except Exception:
-        exp = 0
 
-    exp = max(0, exp)
-    level = (exp // SEASON_XP_PER_LEVEL) + 1
-    return max(1, min(int(level), SEASON_MAX_LEVEL))
+    def __init__(self, name: str, loader):
+        self.name = name
+        self._loader = loader
+        self._data: dict[str, dict] = {}
+        self.loaded = False
+        self._loading = False
+        self._pending: list[tuple] = []  # 전체 로드 중 들어온 쓰기. 로드가 끝나면 다시 적용합니다.
+        self._load_lock = asyncio.Lock()
+        self._subscribers = []
+        self._watchers = []
+
+    def subscribe(self, callback):
+        """callback(uid, record_or_None) 은 유저 단위 변경, callback(None, None) 은 전체 교체를 뜻합니다."""
+        self._subscribers.append(callback)
+
+    def watch(self, callback):
+        """
+        미러 로드 여부와 관계없이 쓰기마다 callback(uid) 를 부릅니다(전체 교체는 None).
+        미러 밖에서 유저 일부만 캐시하는 쪽의 무효화용입니다.
+        """
+        self._watchers.append(callback)
+
+    def _touch(self, uid: Optional[str]):
+        for callback in self._watchers:
+            try:
+                callback(uid)
+            except Exception as e:
+                logging.warning(f"[mirror:{self.name}] watcher failed: {e!r}")
 
+    def _notify(self, uid: Optional[str], record: Optional[dict]):
+        for callback in self._subscribers:
+            try:
+                callback(uid, record)
+            except Exception as e:
+                logging.warning(f"[mirror:{self.name}] subscriber failed: {e!r}")
 
-def get_level_progress(exp: int) -> tuple[int, int, int, float]:
-    """
-    현재 시즌패스 진행도 계산.
-    반환값:
-    - level: 현재 레벨
-    - cur_xp: 현재 레벨 구간 내 경험치
-    - need_xp: 다음 레벨까지 필요한 기준 경험치
-    - pct: 현재 레벨 구간 진행률
-    """
-    try:
-        exp = int(exp)
-    except Exception:
-        exp = 0
+    async def ensure_loaded(self):
+        if self.loaded:
+            return
+        async with self._load_lock:
+            if self.loaded:
+                return
+            self._loading = True
+            try:
+                data = await self._loader()
+            except Exception:
+                self._loading = False
+                self._pending.clear()
+                raise
+            self._loading = False
+            self.loaded = True
+            self._set_all(data)
+            pending, self._pending = self._pending, []
+            for op, args in pending:
+                getattr(self, op)(*args)
+            logging.info(f"[mirror:{self.name}] loaded users={len(self._data)}")
+
+    def _set_all(self, data):
+        self._data = {
+            str(uid): copy.deepcopy(record)
+            for uid, record in (data or {}).items()
+            if isinstance(record, dict)
+        } if isinstance(data, dict) else {}
+        self._notify(None, None)
+
+    def replace_all(self, data):
+        self._touch(None)
+        if self._loading:
+            self._pending.append(("replace_all", (copy.deepcopy(data),)))
+            return
+        if not self.loaded:
+            return
+        self._set_all(data)
 
-    exp = max(0, exp)
-    level = calculate_level(exp)
+    def apply_user(self, uid, record):
+        self._touch(str(uid))
+        if self._loading:
+            self._pending.append(("apply_user", (uid, copy.deepcopy(record))))
+            return
+        if not self.loaded:
+            return
+        key = str(uid)
+        if isinstance(record, dict):
+            self._data[key] = copy.deepcopy(record)
+        else:
+            self._data.pop(key, None)
+        self._notify(key, self._data.get(key))
+
+    def apply_fields(self, uid, fields: dict):
+        """'a/b' 형태의 하위 경로를 지원하는 부분 갱신입니다. 값이 None이면 삭제합니다."""
+        self._touch(str(uid))
+        if self._loading:
+            self._pending.append(("apply_fields", (uid, copy.deepcopy(fields))))
+            return
+        if not self.loaded or not isinstance(fields, dict):
+            return
+        key = str(uid)
+        record = self._data.setdefault(key, {})
+        for path, value in fields.items():
+            parts = [p for p in str(path).split("/") if p]
+            if not parts:
+                continue
+            node = record
+            for part in parts[:-1]:
+                child = node.get(part)
+                if not isinstance(child, dict):
+                    child = node[part] = {}
+                node = child
+            if value is None:
+                node.pop(parts[-1], None)
+            else:
+                node[parts[-1]] = copy.deepcopy(value)
+        self._notify(key, record)
 
-    if level >= SEASON_MAX_LEVEL:
-        return SEASON_MAX_LEVEL, SEASON_XP_PER_LEVEL, SEASON_XP_PER_LEVEL, 1.0
+    def get(self, uid) -> Optional[dict]:
+        return self._data.get(str(uid))
 
-    current_level_start = (level - 1) * SEASON_XP_PER_LEVEL
-    cur_xp = max(0, exp - current_level_start)
-    need_xp = SEASON_XP_PER_LEVEL
-    pct = cur_xp / need_xp if need_xp > 0 else 0.0
+    def items(self):
+        return self._data.items()
 
-    return level, cur_xp, need_xp, _clamp01(pct)
+    def __len__(self):
+        return len(self._data)
 
 
-def get_level_progress_percent(exp: int) -> int:
-    """현재 레벨 구간 진행률을 0~100 정수로 반환."""
-    _, _, _, pct = get_level_progress(exp)
-    return int(round(_clamp01(pct) * 100))
+ATTENDANCE_SCAN_PAGE_SIZE = int(os.getenv("ATTENDANCE_SCAN_PAGE_SIZE", "500"))
 
 
-_TITLE_SUFFIX_RE = re.compile(r"\s*\[[^\[\]]+\]\s*$")
+def _load_attendance_paged() -> dict:
+    """attendance_data 를 키 순서로 나눠 읽습니다. 한 번에 큰 응답을 받지 않도록 페이지 단위로 스캔합니다."""
+    ref = db.reference(ATTENDANCE_DB_KEY)
+    data: dict = {}
+    last_key = None
+    while True:
+        query = ref.order_by_key()
+        if last_key is not None:
+            query = query.start_at(last_key)
+        page = query.limit_to_first(ATTENDANCE_SCAN_PAGE_SIZE + (1 if last_key is not None else 0)).get() or {}
+        keys = [k for k in page.keys() if k != last_key]
+        for key in keys:
+            data[key] = page[key]
+        if len(keys) < ATTENDANCE_SCAN_PAGE_SIZE:
+            return data
+        last_key = keys[-1]
 
-def strip_title_suffix(name: str) -> str:
-    """
-    닉네임 뒤에 붙은 칭호/진행도 태그를 제거합니다.
-    예:
-    - 홍길동 [ Lv. 17 : 한여름의 항해 ] → 홍길동
-    - 홍길동 [ 봄의 개척자 ] → 홍길동
-    """
-    if not name:
-        return ""
-    return _TITLE_SUFFIX_RE.sub("", name).strip()
 
+async def _aload_attendance_paged() -> dict:
+    return await asyncio.to_thread(_load_attendance_paged)
 
-def generate_nickname(base: str, level: int) -> str:
-    """
-    시즌패스 진행도 칭호를 닉네임 뒤에 붙입니다.
-    형식: 닉네임 [ Lv. n : 시즌이름 ]
-    """
-    clean = strip_title_suffix(base)
-    if not clean:
-        clean = base.strip() if base else "Unknown"
 
-    tag = f" [ Lv. {int(level)} : {CURRENT_SEASON_NAME} ]"
+exp_mirror = RecordMirror("exp_data", aload_exp_data)
+attendance_mirror = RecordMirror(ATTENDANCE_DB_KEY, _aload_attendance_paged)
 
-    # Discord 닉네임 32자 제한 대응
-    max_base_len = 32 - len(tag)
-    if max_base_len < 1:
-        # 시즌명이 너무 긴 경우에도 최소한 닉네임 변경 실패를 줄이기 위한 보호
-        short_tag = f" [ Lv. {int(level)} ]"
-        max_base_len = max(1, 32 - len(short_tag))
-        return (clean[:max_base_len] + short_tag)[:32]
 
-    return (clean[:max_base_len] + tag)[:32]
-    
-# =========================
-# Legacy Level 보존 유틸
-# =========================
-from bisect import bisect_right
+# ---- 서버원(봇 제외) ID 집합 ----
+# 명령마다 guild.members 를 훑지 않도록 입장/퇴장 이벤트와 청크 완료 시점에 유지합니다.
+_GUILD_HUMAN_IDS: dict[int, set[int]] = {}
 
-LEGACY_LEVEL_MAX = 99
 
-LEGACY_STAGES = [
-    (1,   5,  200,   1.040, 1.00),
-    (6,  10,  None,  1.045, 1.10),
-    (11, 15,  None,  1.050, 1.11),
-    (16, 20,  None,  1.056, 1.12),
-    (21, 25,  None,  1.063, 1.12),
-    (26, 30,  None,  1.071, 1.13),
+def rebuild_human_member_ids(guild: discord.Guild) -> set[int]:
+    ids = {member.id for member in guild.members if not member.bot}
+    _GUILD_HUMAN_IDS[guild.id] = ids
+    return ids
+
+
+def human_member_ids(guild: discord.Guild) -> set[int]:
+    """현재 서버에 있는 사람 서버원 ID 집합(int). 호출 측에서 수정하지 마세요."""
+    ids = _GUILD_HUMAN_IDS.get(guild.id)
+    if ids is None:
+        if not guild.chunked:
+            # 청크 전 guild.members 는 일부뿐이므로 저장하지 않고, 청크가 끝난 뒤 이벤트에서 다시 만듭니다.
+            return {member.id for member in guild.members if not member.bot}
+        ids = rebuild_human_member_ids(guild)
+    return ids
+
+
+def track_member_join(member: discord.Member):
+    ids = _GUILD_HUMAN_IDS.get(member.guild.id)
+    if ids is not None and not member.bot:
+        ids.add(member.id)
+
+
+def track_member_remove(member: discord.Member):
+    ids = _GUILD_HUMAN_IDS.get(member.guild.id)
+    if ids is not None:
+        ids.discard(member.id)
+
+
+def drop_human_member_ids(guild_id: int):
+    _GUILD_HUMAN_IDS.pop(int(guild_id), None)
+
+
+def refresh_guild_member_ids(guild: discord.Guild):
+    """서버원 ID 집합을 청크 상태에 맞춰 다시 만들고, 그 집합으로 만든 순위 색인을 버립니다."""
+    if guild.chunked:
+        rebuild_human_member_ids(guild)
+    else:
+        drop_human_member_ids(guild.id)
+    leaderboard_index.drop_guild(guild.id)
+    attendance_rank_index.drop_guild(guild.id)
+
+
+def _exp_of(record: Optional[dict]) -> int:
+    if not isinstance(record, dict):
+        return 0
+    return max(0, _safe_int(record.get("exp", 0), 0))
+
+
+def _exp_rank_key(record: dict) -> tuple:
+    return (-_exp_of(record),)
+
+
+def _attendance_rank_key(record: dict) -> tuple:
+    return (
+        -max(0, _safe_int(record.get("total_days", 0), 0)),
+        -max(0, _safe_int(record.get("streak", 0), 0)),
+    )
+
+
+class GuildRankIndex:
+    """
+    한 서버의 순위 색인입니다. (정렬 키..., uid) 리스트를 bisect로 유지합니다.
+    정렬 키는 작을수록 상위이며(예: (-exp,)), 동점은 uid 순입니다.
+    순위/상위 N 조회는 O(log n)이고, 갱신은 리스트 삽입/삭제(memmove)만 일어납니다.
+    현재 서버원(봇 제외) 중 레코드가 있는 유저만 순위에 들어갑니다.
+    """
+
+    def __init__(self, guild_id: int):
+        self.guild_id = int(guild_id)
+        self.members: set[int] = set()
+        self._keys: list[tuple] = []
+        self._score: dict[int, tuple] = {}
+
+    def _remove_key(self, uid: int):
+        score = self._score.pop(uid, None)
+        if score is None:
+            return
+        key = (*score, uid)
+        idx = bisect_left(self._keys, key)
+        if idx < len(self._keys) and self._keys[idx] == key:
+            del self._keys[idx]
+
+    def upsert(self, uid: int, score: tuple):
+        uid = int(uid)
+        if uid not in self.members:
+            return
+        if self._score.get(uid) == score:
+            return
+        self._remove_key(uid)
+        self._score[uid] = score
+        insort(self._keys, (*score, uid))
+
+    def remove(self, uid: int):
+        self._remove_key(int(uid))
+
+    def add_member(self, uid: int, score: Optional[tuple]):
+        self.members.add(int(uid))
+        if score is not None:
+            self.upsert(uid, score)
+
+    def remove_member(self, uid: int):
+        self.members.discard(int(uid))
+        self.remove(uid)
+
+    def bulk_load(self, entries):
+        """[(uid, 정렬 키), ...] 로 한 번에 채웁니다. 하나씩 insort 하는 것보다 빠릅니다."""
+        for uid, score in entries:
+            uid = int(uid)
+            self.members.add(uid)
+            self._score[uid] = tuple(score)
+        self._keys = sorted((*score, uid) for uid, score in self._score.items())
+
+    def rank_of(self, uid: int) -> Optional[tuple[int, tuple]]:
+        """(1부터 시작하는 순위, 정렬 키) 또는 None."""
+        uid = int(uid)
+        score = self._score.get(uid)
+        if score is None:
+            return None
+        return bisect_left(self._keys, (*score, uid)) + 1, score
+
+    def top(self, limit: int, offset: int = 0) -> list[tuple[int, tuple]]:
+        """[(uid, 정렬 키), ...] 을 순위 순으로 반환합니다."""
+        return [(key[-1], key[:-1]) for key in self._keys[offset:offset + limit]]
+
+    # ---- 커서 페이지 ----
+    # 커서는 (*정렬 키, uid) 그대로입니다. 페이지 사이에 순위가 바뀌어도 그 위치부터 이어서 보여줍니다.
+
+    def page_after(self, cursor: Optional[tuple], limit: int) -> tuple[int, list[tuple]]:
+        """cursor 다음부터 limit 개. (시작 순위, [(*정렬 키, uid), ...])"""
+        start = bisect_right(self._keys, cursor) if cursor is not None else 0
+        if start >= len(self._keys):
+            start = max(0, len(self._keys) - limit)
+        return start + 1, self._keys[start:start + limit]
+
+    def page_before(self, cursor: Optional[tuple], limit: int) -> tuple[int, list[tuple]]:
+        """cursor 바로 앞까지 limit 개."""
+        end = bisect_left(self._keys, cursor) if cursor is not None else 0
+        start = max(0, end - limit)
+        return start + 1, self._keys[start:start + limit]
+
+    def page_around(self, uid: int, limit: int) -> Optional[tuple[int, list[tuple]]]:
+        """uid 가 가운데 오도록 한 페이지. 순위가 없으면 None."""
+        mine = self.rank_of(uid)
+        if mine is None:
+            return None
+        start = max(0, min(mine[0] - 1 - limit // 2, len(self._keys) - limit))
+        return start + 1, self._keys[start:start + limit]
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class RankIndexRegistry:
+    """서버별 GuildRankIndex 를 미러에서 필요할 때 만들고, 미러 변경을 받아 증분 갱신합니다."""
+
+    def __init__(self, name: str, mirror: RecordMirror, key_fn):
+        self.name = name
+        self.mirror = mirror
+        self.key_fn = key_fn
+        self._guilds: dict[int, GuildRankIndex] = {}
+        self._warming: dict[int, asyncio.Task] = {}
+        mirror.subscribe(self._on_record_change)
+
+    def _score(self, record: Optional[dict]) -> Optional[tuple]:
+        return self.key_fn(record) if isinstance(record, dict) else None
+
+    def _on_record_change(self, uid: Optional[str], record: Optional[dict]):
+        if uid is None:
+            # 전체 교체(시즌 초기화 등)는 다음 조회 때 다시 만듭니다.
+            self._guilds.clear()
+            return
+        if not str(uid).isdigit():
+            return
+        score = self._score(record)
+        for index in self._guilds.values():
+            if score is None:
+                index.remove(int(uid))
+            else:
+                index.upsert(int(uid), score)
+
+    def peek(self, guild_id: int) -> Optional[GuildRankIndex]:
+        """이미 만들어진 색인만 돌려줍니다. 미러 로드를 일으키지 않습니다."""
+        return self._guilds.get(int(guild_id))
+
+    def is_warm(self, guild_id: int) -> bool:
+        return int(guild_id) in self._guilds or self.mirror.loaded
+
+    def warm_in_background(self, guild: discord.Guild):
+        task = self._warming.get(guild.id)
+        if task is None or task.done():
+            self._warming[guild.id] = asyncio.create_task(
+                self.aget(guild), name=f"rank-index:{self.name}:{guild.id}"
+            )
+
+    async def aget(self, guild: discord.Guild) -> GuildRankIndex:
+        index = self._guilds.get(guild.id)
+        if index is not None:
+            return index
+        await self.mirror.ensure_loaded()
+        index = self._guilds.get(guild.id)
+        if index is not None:
+            return index
+        index = GuildRankIndex(guild.id)
+        for uid in human_member_ids(guild):
+            index.add_member(uid, self._score(self.mirror.get(uid)))
+        if not guild.chunked:
+            # 일부 서버원으로 만든 색인은 이번 요청에만 쓰고 저장하지 않습니다.
+            return index
+        self._guilds[guild.id] = index
+        logging.info(f"[rank-index:{self.name}] built guild={guild.id} ranked={len(index)}")
+        return index
+
+    def on_member_join(self, member: discord.Member):
+        index = self._guilds.get(member.guild.id)
+        if index is not None and not member.bot:
+            index.add_member(member.id, self._score(self.mirror.get(member.id)))
+
+    def on_member_remove(self, member: discord.Member):
+        self.remove_member_id(member.guild.id, member.id)
+
+    def remove_member_id(self, guild_id: int, uid: int):
+        index = self._guilds.get(int(guild_id))
+        if index is not None:
+            index.remove_member(uid)
+
+    def drop_guild(self, guild_id: int):
+        self._guilds.pop(int(guild_id), None)
+
+
+leaderboard_index = RankIndexRegistry("exp", exp_mirror, _exp_rank_key)
+attendance_rank_index = RankIndexRegistry("attendance", attendance_mirror, _attendance_rank_key)
+
+
+class LastActivityIndex:
+    """
+    exp_data 미러의 last_activity 를 (시각, uid) 정렬 목록으로 유지합니다.
+    미접속 점검은 기준 시각보다 오래된 구간만 잘라 보므로 비용이 대상자 수에 비례합니다.
+    활동 기록이 없는(0) 유저는 기존 점검과 같이 대상에서 제외합니다.
+    """
+
+    def __init__(self, mirror: RecordMirror):
+        self.mirror = mirror
+        self._keys: list[tuple[float, str]] = []
+        self._ts: dict[str, float] = {}
+        mirror.subscribe(self._on_record_change)
+
+    def _remove(self, uid: str):
+        ts = self._ts.pop(uid, None)
+        if ts is None:
+            return
+        idx = bisect_left(self._keys, (ts, uid))
+        if idx < len(self._keys) and self._keys[idx] == (ts, uid):
+            del self._keys[idx]
+
+    def _set(self, uid: str, record: Optional[dict]):
+        ts = _safe_float(record.get("last_activity"), 0) if isinstance(record, dict) else 0.0
+        if self._ts.get(uid) == ts:
+            return
+        self._remove(uid)
+        if ts > 0:
+            self._ts[uid] = ts
+            insort(self._keys, (ts, uid))
+
+    def _on_record_change(self, uid: Optional[str], record: Optional[dict]):
+        if uid is None:
+            self._ts = {}
+            for key, rec in self.mirror.items():
+                ts = _safe_float(rec.get("last_activity"), 0) if isinstance(rec, dict) else 0.0
+                if ts > 0:
+                    self._ts[key] = ts
+            self._keys = sorted((ts, key) for key, ts in self._ts.items())
+            return
+        self._set(str(uid), record)
+
+    async def ensure_loaded(self):
+        await self.mirror.ensure_loaded()
+
+    def older_than(self, threshold_ts: float) -> list[tuple[str, float]]:
+        """last_activity < threshold_ts 인 [(uid, 시각), ...] 을 오래된 순으로."""
+        end = bisect_left(self._keys, (threshold_ts, ""))
+        return [(uid, ts) for ts, uid in self._keys[:end]]
+
+    def newer_than(self, threshold_ts: float) -> list[str]:
+        """last_activity >= threshold_ts 인 uid 목록."""
+        start = bisect_left(self._keys, (threshold_ts, ""))
+        return [uid for _ts, uid in self._keys[start:]]
+
+    def __len__(self):
+        return len(self._keys)
+
+
+last_activity_index = LastActivityIndex(exp_mirror)
+
+
+# =========================
+# Member resolution
+# =========================
+
+MEMBER_NEGATIVE_TTL = float(os.getenv("MEMBER_NEGATIVE_TTL", "600"))  # 서버에 없는 유저로 판정한 결과 유지 시간(초)
+MEMBER_NEGATIVE_MAX = int(os.getenv("MEMBER_NEGATIVE_MAX", "10000"))
+_QUERY_MEMBERS_MAX_IDS = 100  # Gateway Request Guild Members 한 번에 보낼 수 있는 user_ids 상한
+
+
+class MemberResolver:
+    """
+    캐시에 없는 서버원을 한 번의 Gateway 요청(query_members(user_ids=...))으로 모아서 찾습니다.
+    찾지 못한 유저는 TTL 동안 '서버에 없음'으로 기억하고 순위 색인에서도 뺍니다.
+    기록은 판정 시각 순으로 쌓이므로 추가할 때 앞쪽의 만료분을 지우고, 최대 개수를 넘으면 오래된 것부터 버립니다.
+    """
+
+    def __init__(self):
+        self._missing: dict[tuple[int, int], float] = {}
+        self.gateway_queries = 0
+        self.rest_fallbacks = 0
+
+    def _is_known_missing(self, guild_id: int, uid: int) -> bool:
+        ts = self._missing.get((guild_id, uid))
+        if ts is None:
+            return False
+        if time.time() - ts >= MEMBER_NEGATIVE_TTL:
+            self._missing.pop((guild_id, uid), None)
+            return False
+        return True
+
+    def _mark_missing(self, guild_id: int, uid: int):
+        now = time.time()
+        self._missing.pop((guild_id, uid), None)
+        self._missing[(guild_id, uid)] = now
+        while self._missing:
+            key, ts = next(iter(self._missing.items()))
+            if now - ts < MEMBER_NEGATIVE_TTL and len(self._missing) <= MEMBER_NEGATIVE_MAX:
+                break
+            self._missing.pop(key, None)
+        leaderboard_index.remove_member_id(guild_id, uid)
+        attendance_rank_index.remove_member_id(guild_id, uid)
+
+    def forget(self, guild_id: int, uid: int) -> bool:
+        """'서버에 없음' 기록을 지웁니다. 기록이 있었으면 True."""
+        return self._missing.pop((int(guild_id), int(uid)), None) is not None
+
+    async def _query(self, guild: discord.Guild, uids: list[int]) -> dict[int, discord.Member]:
+        found: dict[int, discord.Member] = {}
+        for start in range(0, len(uids), _QUERY_MEMBERS_MAX_IDS):
+            chunk = uids[start:start + _QUERY_MEMBERS_MAX_IDS]
+            try:
+                self.gateway_queries += 1
+                members = await guild.query_members(user_ids=chunk, limit=len(chunk), cache=True)
+                found.update({m.id: m for m in members})
+            except Exception as e:
+                # Members 인텐트가 없거나 Gateway 응답이 늦으면 REST로 동시에 조회합니다.
+                logging.warning(f"[member-resolver] query_members failed, using REST: {e!r}")
+                self.rest_fallbacks += 1
+
+                async def _fetch(uid: int):
+                    try:
+                        return await guild.fetch_member(uid)
+                    except discord.NotFound:
+                        return None
+
+                results = await asyncio.gather(*(_fetch(uid) for uid in chunk), return_exceptions=True)
+                for uid, member in zip(chunk, results):
+                    if isinstance(member, discord.Member):
+                        found[uid] = member
+                    elif isinstance(member, BaseException):
+                        # 알 수 없는 실패는 '없음'으로 단정하지 않습니다.
+                        found.setdefault(uid, None)
+        return found
+
+    async def resolve(self, guild: discord.Guild, uids) -> dict[int, Optional[discord.Member]]:
+        result: dict[int, Optional[discord.Member]] = {}
+        need: list[int] = []
+        for uid in uids:
+            uid = int(uid)
+            member = guild.get_member(uid)
+            if member is not None:
+                result[uid] = member
+            elif self._is_known_missing(guild.id, uid):
+                result[uid] = None
+            else:
+                need.append(uid)
+
+        if need:
+            found = await self._query(guild, need)
+            for uid in need:
+                member = found.get(uid)
+                result[uid] = member
+                if uid not in found:
+                    self._mark_missing(guild.id, uid)
+        return result
+
+
+member_resolver = MemberResolver()
+
+
+# =========================
+# Leaderboard snapshots
+# =========================
+# leaderboards/{gid}/{season_id} = {
+#   "updated_at": epoch,
+#   "exp":        {"total": n, "top": [[uid, exp], ...], "histogram": {"width": 10, "counts": [...]}},
+#   "attendance": {"total": n, "top": [[uid, total_days, streak], ...], "histogram": {...}},
+# }
+# 메모리 색인이 아직 없을 때(재시작 직후, 다른 인스턴스) 한 번의 작은 GET으로 랭킹을 보여주기 위한 사본입니다.
+# 출석 순위는 시즌과 무관하지만 한 번에 읽히도록 같은 노드에 둡니다.
+
+LEADERBOARD_SNAPSHOT_INTERVAL = int(os.getenv("LEADERBOARD_SNAPSHOT_INTERVAL", "300"))
+LEADERBOARD_SNAPSHOT_TOP_K = int(os.getenv("LEADERBOARD_SNAPSHOT_TOP_K", "50"))
+LEADERBOARD_SNAPSHOT_READ_TTL = 60
+# 히스토그램 구간: 경험치는 레벨 10단위, 출석은 누적 30일 단위. 마지막 구간은 그 이상 전부입니다.
+_LEADERBOARD_HISTOGRAM = {
+    "exp": (10, 11, lambda values: calculate_level(values[0])),
+    "attendance": (30, 13, lambda values: values[0]),
+}
+
+_LEADERBOARD_SNAPSHOT_CACHE: dict[tuple[str, str], tuple[float, dict]] = {}
+_LEADERBOARD_SNAPSHOT_DIGEST: dict[tuple[str, str], str] = {}
+
+
+def _leaderboards_ref(guild_id, season_id):
+    return db.reference(f"leaderboards/{guild_id}/{season_id}")
+
+
+def _apply_leaderboard_snapshot_update(parts: list[str], value):
+    if len(parts) >= 3:
+        key = (parts[1], parts[2])
+        if len(parts) == 3 and isinstance(value, dict):
+            _LEADERBOARD_SNAPSHOT_CACHE[key] = (time.time(), value)
+        else:
+            _LEADERBOARD_SNAPSHOT_CACHE.pop(key, None)
+    elif len(parts) == 2:
+        for key in [k for k in _LEADERBOARD_SNAPSHOT_CACHE if k[0] == parts[1]]:
+            _LEADERBOARD_SNAPSHOT_CACHE.pop(key, None)
+    else:
+        _LEADERBOARD_SNAPSHOT_CACHE.clear()
+
+
+def build_rank_snapshot(kind: str, index: GuildRankIndex, top_k: int) -> dict:
+    """색인의 정렬 키(음수 값)를 양수로 되돌려 상위 top_k 와 구간별 인원 수를 만듭니다."""
+    width, buckets, bucket_value = _LEADERBOARD_HISTOGRAM[kind]
+    counts = [0] * buckets
+    for key in index._keys:
+        values = [-v for v in key[:-1]]
+        counts[min(max(0, bucket_value(values)) // width, buckets - 1)] += 1
+    return {
+        "total": len(index),
+        "top": [[str(uid), *(-v for v in key)] for uid, key in index.top(top_k)],
+        "histogram": {"width": width, "counts": counts},
+    }
+
+
+def snapshot_rows(section: dict, limit: int) -> list[tuple[int, tuple]]:
+    """스냅샷의 top 을 색인 top() 과 같은 [(uid, 정렬 키), ...] 형태로 바꿉니다."""
+    rows = []
+    for entry in (section or {}).get("top") or []:
+        if not isinstance(entry, list) or len(entry) < 2 or not str(entry[0]).isdigit():
+            continue
+        rows.append((int(entry[0]), tuple(-_safe_int(v, 0) for v in entry[1:])))
+        if len(rows) >= limit:
+            break
+    return rows
+
+
+def snapshot_rank_of(section: dict, uid: int) -> Optional[tuple[int, tuple]]:
+    for rank, (row_uid, key) in enumerate(snapshot_rows(section, LEADERBOARD_SNAPSHOT_TOP_K), start=1):
+        if row_uid == int(uid):
+            return rank, key
+    return None
+
+
+def approx_rank_from_histogram(section: dict, kind: str, values: list[int]) -> Optional[tuple[int, int]]:
+    """상위 K 밖인 유저의 대략적인 순위 범위 (최고, 최저) 를 히스토그램으로 계산합니다."""
+    hist = (section or {}).get("histogram") or {}
+    counts = [_safe_int(c, 0) for c in hist.get("counts") or []]
+    if not counts:
+        return None
+    width, buckets, bucket_value = _LEADERBOARD_HISTOGRAM[kind]
+    bucket = min(max(0, bucket_value(values)) // width, len(counts) - 1)
+    above = sum(counts[bucket + 1:])
+    return above + 1, above + max(1, counts[bucket])
+
+
+async def aget_leaderboard_snapshot(guild_id: int, season_id: str) -> dict:
+    key = (str(guild_id), str(season_id))
+    hit = _LEADERBOARD_SNAPSHOT_CACHE.get(key)
+    if hit is not None and time.time() - hit[0] < LEADERBOARD_SNAPSHOT_READ_TTL:
+        return hit[1]
+    data = await asyncio.to_thread(lambda: _leaderboards_ref(*key).get() or {})
+    if not isinstance(data, dict):
+        data = {}
+    _LEADERBOARD_SNAPSHOT_CACHE[key] = (time.time(), data)
+    return data
+
+
+def leaderboard_season_id(state: dict) -> str:
+    return str(state.get("current_season_id") or get_calendar_season_info(datetime.now(KST))["season_id"])
+
+
+async def write_leaderboard_snapshot(guild: discord.Guild, state: dict) -> bool:
+    """상위 목록과 히스토그램이 바뀐 경우에만 씁니다. 썼으면 True."""
+    season_id = leaderboard_season_id(state)
+    payload = {}
+    if state.get("first_season_started"):
+        payload["exp"] = build_rank_snapshot("exp", await leaderboard_index.aget(guild), LEADERBOARD_SNAPSHOT_TOP_K)
+    payload["attendance"] = build_rank_snapshot(
+        "attendance", await attendance_rank_index.aget(guild), LEADERBOARD_SNAPSHOT_TOP_K
+    )
+    digest = hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+    key = (str(guild.id), season_id)
+    if _LEADERBOARD_SNAPSHOT_DIGEST.get(key) == digest:
+        return False
+    payload["updated_at"] = int(time.time())
+    await afirebase_root_update_strict({f"leaderboards/{guild.id}/{season_id}": payload})
+    _LEADERBOARD_SNAPSHOT_DIGEST[key] = digest
+    return True
+
+
+def load_json(path):
+    """로컬 JSON 파일 로드 (없으면 빈 dict)"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_json(path, data):
+    """로컬 JSON 파일 저장"""
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+# ---- 유틸 함수 ----
+# === 시즌패스 레벨 계산: 1~100 동일 간격 ===
+
+def calculate_level(exp: int) -> int:
+    """
+    시즌패스 레벨 계산.
+    - Lv.1은 0XP부터 시작
+    - Lv.2부터는 SEASON_XP_PER_LEVEL 단위로 상승
+    - 최대 Lv.100
+    """
+    try:
+        exp = int(exp)
+    except Exception:
+        exp = 0
+
+    exp = max(0, exp)
+    level = (exp // SEASON_XP_PER_LEVEL) + 1
+    return max(1, min(int(level), SEASON_MAX_LEVEL))
+
+
+def _clamp01(x: float) -> float:
+    if x < 0.0:
+        return 0.0
+    if x > 1.0:
+        return 1.0
+    return x
+
+
+def get_level_progress(exp: int) -> tuple[int, int, int, float]:
+    """
+    현재 시즌패스 진행도 계산.
+    반환값:
+    - level: 현재 레벨
+    - cur_xp: 현재 레벨 구간 내 경험치
+    - need_xp: 다음 레벨까지 필요한 기준 경험치
+    - pct: 현재 레벨 구간 진행률
+    """
+    try:
+        exp = int(exp)
+    except Exception:
+        exp = 0
+
+    exp = max(0, exp)
+    level = calculate_level(exp)
+
+    if level >= SEASON_MAX_LEVEL:
+        return SEASON_MAX_LEVEL, SEASON_XP_PER_LEVEL, SEASON_XP_PER_LEVEL, 1.0
+
+    current_level_start = (level - 1) * SEASON_XP_PER_LEVEL
+    cur_xp = max(0, exp - current_level_start)
+    need_xp = SEASON_XP_PER_LEVEL
+    pct = cur_xp / need_xp if need_xp > 0 else 0.0
+
+    return level, cur_xp, need_xp, _clamp01(pct)
+
+
+def get_level_progress_percent(exp: int) -> int:
+    """현재 레벨 구간 진행률을 0~100 정수로 반환."""
+    _, _, _, pct = get_level_progress(exp)
+    return int(round(_clamp01(pct) * 100))
+
+
+_TITLE_SUFFIX_RE = re.compile(r"\s*\[[^\[\]]+\]\s*$")
+
+def strip_title_suffix(name: str) -> str:
+    """
+    닉네임 뒤에 붙은 칭호/진행도 태그를 제거합니다.
+    예:
+    - 홍길동 [ Lv. 17 : 한여름의 항해 ] → 홍길동
+    - 홍길동 [ 봄의 개척자 ] → 홍길동
+    """
+    if not name:
+        return ""
+    return _TITLE_SUFFIX_RE.sub("", name).strip()
+
+
+def generate_nickname(base: str, level: int) -> str:
+    """
+    시즌패스 진행도 칭호를 닉네임 뒤에 붙입니다.
+    형식: 닉네임 [ Lv. n : 시즌이름 ]
+    """
+    clean = strip_title_suffix(base)
+    if not clean:
+        clean = base.strip() if base else "Unknown"
+
+    tag = f" [ Lv. {int(level)} : {CURRENT_SEASON_NAME} ]"
+
+    # Discord 닉네임 32자 제한 대응
+    max_base_len = 32 - len(tag)
+    if max_base_len < 1:
+        # 시즌명이 너무 긴 경우에도 최소한 닉네임 변경 실패를 줄이기 위한 보호
+        short_tag = f" [ Lv. {int(level)} ]"
+        max_base_len = max(1, 32 - len(short_tag))
+        return (clean[:max_base_len] + short_tag)[:32]
+
+    return (clean[:max_base_len] + tag)[:32]
+    
+# =========================
+# Legacy Level 보존 유틸
+# =========================
+from bisect import bisect_left, bisect_right, insort
+
+LEGACY_LEVEL_MAX = 99
+
+LEGACY_STAGES = [
+    (1,   5,  200,   1.040, 1.00),
+    (6,  10,  None,  1.045, 1.10),
+    (11, 15,  None,  1.050, 1.11),
+    (16, 20,  None,  1.056, 1.12),
+    (21, 25,  None,  1.063, 1.12),
+    (26, 30,  None,  1.071, 1.13),
     (31, 35,  None,  1.080, 1.14),
     (36, 40,  None,  1.090, 1.15),
     (41, 45,  None,  1.101, 1.16),
@@ -1318,58 +2191,247 @@ async def aset_legacy_migration_record(season_id: str, data: dict):
 async def aupdate_legacy_migration_record(season_id: str, data: dict):
     await asyncio.to_thread(lambda: _legacy_migration_ref(season_id).update(data))
 
-async def aget_effective_season_state() -> dict:
-    """달력 기준 상태를 계산하고 변경된 필드만 Firebase에 반영합니다."""
-    def _get_and_fix():
-        cal = get_calendar_season_info(datetime.now(KST))
-        ref = _season_state_ref()
-        state = ref.get()
-
-        if not isinstance(state, dict):
-            persisted = _default_season_state_from_calendar(cal)
-            ref.set(persisted)
-            return {**persisted, "calendar": cal}
-
-        patch: dict[str, object] = {}
-        defaults = _default_season_state_from_calendar(cal)
-        for key, value in defaults.items():
-            if key not in state:
-                patch[key] = value
-
-        effective = {**state, **patch}
-        if not effective.get("first_season_started"):
-            desired = {
-                "current_season_id": cal["season_id"],
-                "current_season_type": cal["season_type"],
-                "current_season_label": cal["season_label"],
-                "next_season_id": cal["next_season_id"],
-                "status": SEASON_STATUS_LOCKED,
-            }
-        elif effective.get("current_season_id") != cal["season_id"]:
-            desired = {
-                "status": SEASON_STATUS_LOCKED,
-                "next_season_id": cal["season_id"],
-            }
-        else:
-            desired = {
-                "status": cal["status"],
-                "current_season_type": cal["season_type"],
-                "current_season_label": cal["season_label"],
-                "next_season_id": cal["next_season_id"],
-            }
+def _season_state_patch(state: dict, cal: dict) -> dict:
+    """저장된 시즌 상태와 달력을 비교해 바뀌어야 하는 필드만 반환합니다."""
+    patch: dict[str, object] = {}
+    defaults = _default_season_state_from_calendar(cal)
+    for key, value in defaults.items():
+        if key not in state:
+            patch[key] = value
+
+    effective = {**state, **patch}
+    if not effective.get("first_season_started"):
+        desired = {
+            "current_season_id": cal["season_id"],
+            "current_season_type": cal["season_type"],
+            "current_season_label": cal["season_label"],
+            "next_season_id": cal["next_season_id"],
+            "status": SEASON_STATUS_LOCKED,
+        }
+    elif effective.get("current_season_id") != cal["season_id"]:
+        desired = {
+            "status": SEASON_STATUS_LOCKED,
+            "next_season_id": cal["season_id"],
+        }
+    else:
+        desired = {
+            "status": cal["status"],
+            "current_season_type": cal["season_type"],
+            "current_season_label": cal["season_label"],
+            "next_season_id": cal["next_season_id"],
+        }
+
+    for key, value in desired.items():
+        if effective.get(key) != value:
+            patch[key] = value
+    return patch
+
+
+# =========================
+# Season state cache
+# =========================
+
+SEASON_STATE_CACHE_TTL = float(os.getenv("SEASON_STATE_CACHE_TTL", "300"))  # 리스너가 없을 때만 사용
+SEASON_STATE_LISTENER_CHECK_SEC = float(os.getenv("SEASON_STATE_LISTENER_CHECK_SEC", "30"))
+SEASON_STATE_LISTENER_MAX_BACKOFF_SEC = float(os.getenv("SEASON_STATE_LISTENER_MAX_BACKOFF_SEC", "600"))
+
 
-        for key, value in desired.items():
-            if effective.get(key) != value:
-                patch[key] = value
-                effective[key] = value
+class SeasonStateCache:
+    """
+    season_state의 프로세스 내 단일 사본입니다.
+    - 시작 시 한 번 읽고, 봇이 쓰는 변경은 apply_patch로 즉시 반영합니다.
+    - 외부 수정은 RTDB 리스너로 반영하며, 리스너를 못 열면 TTL마다 다시 읽습니다.
+    - 리스너가 도중에 끊기면(cancel/auth_revoked 이벤트, 스트림 스레드 종료) TTL 읽기로 돌아가고 감시 태스크가 다시 엽니다.
+    - 값이 바뀌면 version을 올리고 구독자에게 (이전 상태, 새 상태)를 전달합니다.
+    """
+
+    def __init__(self):
+        self._raw: dict | None = None
+        self._loaded_at = 0.0
+        self._load_lock = asyncio.Lock()
+        self._listener = None
+        self._watchdog: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._subscribers: list = []
+        self.version = 0
+
+    def subscribe(self, callback):
+        """callback(old, new)는 동기 함수나 코루틴 함수 모두 가능합니다."""
+        self._subscribers.append(callback)
+
+    def _stale(self) -> bool:
+        if not self._loaded_at:
+            return True
+        return self._listener is None and (time.time() - self._loaded_at) >= SEASON_STATE_CACHE_TTL
+
+    async def load(self, *, force: bool = False):
+        async with self._load_lock:
+            if not force and not self._stale():
+                return
+            raw = await asyncio.to_thread(lambda: _season_state_ref().get())
+            self._loaded_at = time.time()
+            self._set(raw if isinstance(raw, dict) else None)
+
+    async def start(self):
+        """최초 로드 후 외부 수정을 받을 리스너를 엽니다. 여러 번 호출해도 안전합니다."""
+        self._loop = asyncio.get_running_loop()
+        await self.load()
+        await self._open_listener()
+        if self._watchdog is None or self._watchdog.done():
+            self._watchdog = asyncio.create_task(self._watch_listener(), name="season-state-listener-watchdog")
+
+    async def _open_listener(self) -> bool:
+        if self._listener is not None:
+            return True
+        try:
+            self._listener = await asyncio.to_thread(lambda: _season_state_ref().listen(self._on_listener_event))
+            logging.info("[season-state] listener started")
+            return True
+        except Exception as e:
+            self._listener = None
+            logging.warning(f"[season-state] listener unavailable, falling back to TTL reload: {e!r}")
+            return False
+
+    def _listener_alive(self) -> bool:
+        listener = self._listener
+        if listener is None:
+            return False
+        # ListenerRegistration은 스트림을 읽는 스레드가 끝나면 더는 이벤트를 전달하지 않습니다.
+        thread = getattr(listener, "_thread", None)
+        return thread is None or thread.is_alive()
+
+    def _drop_listener(self, reason: str):
+        """끊긴 리스너를 버리고 TTL 읽기로 돌아갑니다. 다시 여는 것은 감시 태스크가 맡습니다."""
+        listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        logging.warning(f"[season-state] listener lost ({reason}), falling back to TTL reload until it restarts")
+
+        def _close():
+            try:
+                listener.close()
+            except Exception:
+                pass
+
+        # close()는 스트림 스레드를 join하므로 이벤트 루프를 막지 않게 스레드에서 닫습니다.
+        asyncio.ensure_future(asyncio.to_thread(_close))
+
+    async def _watch_listener(self):
+        delay = SEASON_STATE_LISTENER_CHECK_SEC
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                if self._listener is not None and not self._listener_alive():
+                    self._drop_listener("stream thread exited")
+                if self._listener is not None:
+                    delay = SEASON_STATE_LISTENER_CHECK_SEC
+                    continue
+                # 다시 열리면 첫 put 이벤트로 전체 상태가 들어오므로 끊긴 동안의 외부 수정도 반영됩니다.
+                if await self._open_listener():
+                    delay = SEASON_STATE_LISTENER_CHECK_SEC
+                else:
+                    delay = min(delay * 2, SEASON_STATE_LISTENER_MAX_BACKOFF_SEC)
+            except Exception as e:
+                logging.warning(f"[season-state] listener watchdog failed: {e!r}")
+
+    def _on_listener_event(self, event):
+        # Firebase 리스너 스레드에서 호출되므로 이벤트 루프로 넘겨서 반영합니다.
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        event_type = getattr(event, "event_type", None)
+        if event_type in ("cancel", "auth_revoked"):
+            # 서버가 스트림을 닫았다는 뜻이므로 이후 이벤트는 오지 않습니다.
+            loop.call_soon_threadsafe(self._drop_listener, f"event={event_type}")
+            return
+        if event_type not in ("put", "patch"):
+            return
+        try:
+            path, data = event.path, event.data
+        except Exception as e:
+            loop.call_soon_threadsafe(self._drop_listener, f"unreadable event: {e!r}")
+            return
+        loop.call_soon_threadsafe(self._apply_event, event_type, path, data)
+
+    def _apply_event(self, event_type: str, path: str, data):
+        parts = [p for p in (path or "/").split("/") if p]
+        if not parts and event_type == "put":
+            self._set(data if isinstance(data, dict) else None)
+            return
+        if not parts:
+            self.apply_patch(data if isinstance(data, dict) else {})
+            return
+        key = "/".join(parts)
+        if event_type == "put":
+            self.apply_patch({key: data})
+        elif isinstance(data, dict):
+            self.apply_patch({f"{key}/{sub}": value for sub, value in data.items()})
+
+    def apply_patch(self, data: dict):
+        """RTDB update와 같은 의미로 부분 갱신을 반영합니다. 값이 None이면 필드를 지웁니다."""
+        if not isinstance(data, dict) or not data:
+            return
+        new = copy.deepcopy(self._raw) if isinstance(self._raw, dict) else {}
+        for path, value in data.items():
+            parts = [p for p in str(path).split("/") if p]
+            if not parts:
+                continue
+            node = new
+            for part in parts[:-1]:
+                if not isinstance(node.get(part), dict):
+                    node[part] = {}
+                node = node[part]
+            if value is None:
+                node.pop(parts[-1], None)
+            else:
+                node[parts[-1]] = copy.deepcopy(value)
+        self._set(new)
+
+    def replace(self, data):
+        self._set(copy.deepcopy(data) if isinstance(data, dict) else None)
 
+    def _set(self, new: dict | None):
+        old = self._raw
+        if new == old:
+            return
+        self._raw = new
+        self.version += 1
+        for callback in list(self._subscribers):
+            try:
+                result = callback(copy.deepcopy(old) if old else {}, copy.deepcopy(new) if new else {})
+                if asyncio.iscoroutine(result):
+                    asyncio.ensure_future(result)
+            except Exception:
+                logging.exception("[season-state] subscriber failed")
+
+    async def aget_raw(self) -> dict:
+        """저장된 그대로의 상태 사본을 반환합니다. 상태가 없으면 달력 기준 기본값을 저장합니다."""
+        await self.load()
+        if not isinstance(self._raw, dict):
+            persisted = _default_season_state_from_calendar(get_calendar_season_info(datetime.now(KST)))
+            await asyncio.to_thread(lambda: _season_state_ref().set(persisted))
+            self._set(persisted)
+        return copy.deepcopy(self._raw)
+
+    async def aget_effective(self) -> dict:
+        """달력 기준 상태를 계산하고, 달라진 필드가 있을 때만 Firebase에 반영합니다."""
+        state = await self.aget_raw()
+        cal = get_calendar_season_info(datetime.now(KST))
+        patch = _season_state_patch(state, cal)
         if patch:
-            ref.update(patch)
+            await asyncio.to_thread(lambda: _season_state_ref().update(patch))
+            self.apply_patch(patch)
+            state.update(patch)
+        state["calendar"] = cal
+        return state
 
-        effective["calendar"] = cal
-        return effective
 
-    return await asyncio.to_thread(_get_and_fix)
+season_state_cache = SeasonStateCache()
+
+
+async def aget_effective_season_state() -> dict:
+    """달력 기준 상태를 계산하고 변경된 필드만 Firebase에 반영합니다."""
+    return await season_state_cache.aget_effective()
 
 
 async def aseason_xp_enabled() -> bool:
@@ -1419,17 +2481,78 @@ def progress_title_text(level: int, state: dict) -> str:
     return "??? : 프리시즌"
 
 
+# =========================
+# User titles cache
+# =========================
+
+_USER_TITLES_CACHE = {}           # uid(str) -> 정규화된 user_titles 레코드
+_USER_TITLES_CACHE_TS = {}        # uid(str) -> float
+_USER_TITLES_TTL = 600.0          # seconds
+_USER_TITLES_BULK_TS = 0.0        # 마지막 전체 로드 시각. TTL 안이면 캐시에 없는 유저는 레코드가 없는 것입니다.
+
+
+def _normalize_user_titles(raw) -> dict:
+    if not isinstance(raw, dict):
+        raw = {}
+    if not isinstance(raw.get("owned"), dict):
+        raw["owned"] = {}
+    if not isinstance(raw.get("equipped"), dict):
+        raw["equipped"] = {"type": "progress"}
+    return raw
+
+
+def _prime_user_titles(all_titles: dict):
+    global _USER_TITLES_BULK_TS
+    now = time.time()
+    _USER_TITLES_CACHE.clear()
+    _USER_TITLES_CACHE_TS.clear()
+    if isinstance(all_titles, dict):
+        for uid, raw in all_titles.items():
+            _USER_TITLES_CACHE[str(uid)] = _normalize_user_titles(raw)
+            _USER_TITLES_CACHE_TS[str(uid)] = now
+    _USER_TITLES_BULK_TS = now
+
+
+def invalidate_user_titles(uid: str | int | None = None):
+    """uid를 주면 해당 유저만, 생략하면 칭호 캐시 전체를 비웁니다."""
+    global _USER_TITLES_BULK_TS
+    if uid is None:
+        _USER_TITLES_CACHE.clear()
+        _USER_TITLES_CACHE_TS.clear()
+        _USER_TITLES_BULK_TS = 0.0
+        return
+    key = str(uid)
+    _USER_TITLES_CACHE.pop(key, None)
+    _USER_TITLES_CACHE_TS.pop(key, None)
+    # 전체 로드 이후 이 유저만 빠진 상태가 "레코드 없음"으로 오인되지 않게 합니다.
+    _USER_TITLES_BULK_TS = 0.0
+
+
+async def aprime_user_titles_cache() -> int:
+    """대량 닉네임 갱신 전에 user_titles 전체를 한 번만 읽어 캐시를 채웁니다."""
+    if _USER_TITLES_BULK_TS and (time.time() - _USER_TITLES_BULK_TS) < _USER_TITLES_TTL:
+        return len(_USER_TITLES_CACHE)
+    all_titles = await asyncio.to_thread(lambda: db.reference("user_titles").get() or {})
+    _prime_user_titles(all_titles)
+    return len(_USER_TITLES_CACHE)
+
+
 async def aget_user_titles(uid: str) -> dict:
+    now = time.time()
+    key = str(uid)
+    ts = _USER_TITLES_CACHE_TS.get(key, 0.0)
+    if key in _USER_TITLES_CACHE and (now - ts) < _USER_TITLES_TTL:
+        return copy.deepcopy(_USER_TITLES_CACHE[key])
+    if _USER_TITLES_BULK_TS and (now - _USER_TITLES_BULK_TS) < _USER_TITLES_TTL:
+        return _normalize_user_titles({})
+
     def _get():
-        raw = _user_titles_ref(str(uid)).get()
-        if not isinstance(raw, dict):
-            raw = {}
-        if not isinstance(raw.get("owned"), dict):
-            raw["owned"] = {}
-        if not isinstance(raw.get("equipped"), dict):
-            raw["equipped"] = {"type": "progress"}
-        return raw
-    return await asyncio.to_thread(_get)
+        return _normalize_user_titles(_user_titles_ref(key).get())
+
+    titles = await asyncio.to_thread(_get)
+    _USER_TITLES_CACHE[key] = titles
+    _USER_TITLES_CACHE_TS[key] = now
+    return copy.deepcopy(titles)
 
 
 async def aset_user_equipped_title(uid: str, equipped: dict):
@@ -1437,11 +2560,13 @@ async def aset_user_equipped_title(uid: str, equipped: dict):
     await asyncio.to_thread(
         lambda: _user_titles_ref(str(uid)).child("equipped").set(equipped)
     )
+    cached = _USER_TITLES_CACHE.get(str(uid))
+    if cached is not None:
+        cached["equipped"] = copy.deepcopy(equipped)
 
 
-async def aget_equipped_title_text(uid: str, level: int) -> str:
-    state = await aget_effective_season_state()
-    titles = await aget_user_titles(uid)
+def equipped_title_text(titles: dict, level: int, state: dict) -> str:
+    """캐시된 칭호 레코드와 시즌 상태만으로 닉네임 칭호를 계산합니다(네트워크 없음)."""
     equipped = titles.get("equipped") or {"type": "progress"}
 
     if equipped.get("type") == "title":
@@ -1454,6 +2579,12 @@ async def aget_equipped_title_text(uid: str, level: int) -> str:
     return progress_title_text(level, state)
 
 
+async def aget_equipped_title_text(uid: str, level: int) -> str:
+    state = await aget_effective_season_state()
+    titles = await aget_user_titles(uid)
+    return equipped_title_text(titles, level, state)
+
+
 async def apply_member_title(member: discord.Member, level: int) -> bool:
     """닉네임 칭호 반영 성공 여부를 반환합니다."""
     if not member or member.id == getattr(member.guild, "owner_id", None):
@@ -1470,6 +2601,63 @@ async def apply_member_title(member: discord.Member, level: int) -> bool:
         return False
 
 
+def _rebuild_level100_award_index(season_id: str, completions) -> int:
+    """season_completion/{season_id} 스냅샷으로 해당 시즌의 지급 색인을 다시 만듭니다."""
+    sid = str(season_id)
+    for key in list(_LEVEL100_AWARD_CACHE):
+        if key[0] == sid:
+            _LEVEL100_AWARD_CACHE.discard(key)
+    count = 0
+    if isinstance(completions, dict):
+        for uid, completion in completions.items():
+            if isinstance(completion, dict) and completion.get("reward_given"):
+                _LEVEL100_AWARD_CACHE.add((sid, str(uid)))
+                count += 1
+    _LEVEL100_AWARD_INDEX_LOADED.add(sid)
+    return count
+
+
+async def aload_level100_award_index(season_id: str, *, force: bool = False) -> int:
+    """시즌별 Lv.100 지급 색인을 한 번만 읽어 옵니다. 재시작 직후에도 지급 완료 유저는 조회 없이 걸러집니다."""
+    sid = str(season_id or "")
+    if not sid:
+        return 0
+    if sid in _LEVEL100_AWARD_INDEX_LOADED and not force:
+        return sum(1 for key in _LEVEL100_AWARD_CACHE if key[0] == sid)
+    async with _LEVEL100_AWARD_INDEX_LOCK:
+        if sid in _LEVEL100_AWARD_INDEX_LOADED and not force:
+            return sum(1 for key in _LEVEL100_AWARD_CACHE if key[0] == sid)
+        completions = await asyncio.to_thread(
+            lambda: db.reference("season_completion").child(sid).get() or {}
+        )
+        count = _rebuild_level100_award_index(sid, completions)
+    logging.info(f"[season-award] award index loaded season={sid} awarded={count}")
+    return count
+
+
+def _apply_completion_update_to_award_index(parts: list[str], value):
+    if len(parts) < 2:
+        _LEVEL100_AWARD_CACHE.clear()
+        _LEVEL100_AWARD_INDEX_LOADED.clear()
+        return
+    sid = parts[1]
+    if len(parts) == 2:
+        if isinstance(value, dict):
+            _rebuild_level100_award_index(sid, value)
+        else:
+            _rebuild_level100_award_index(sid, {})
+            _LEVEL100_AWARD_INDEX_LOADED.discard(sid)
+        return
+    uid = parts[2]
+    if len(parts) == 3 and isinstance(value, dict) and value.get("reward_given"):
+        _LEVEL100_AWARD_CACHE.add((sid, uid))
+    elif len(parts) == 3 or (len(parts) == 4 and parts[3] == "reward_given"):
+        if value is True:
+            _LEVEL100_AWARD_CACHE.add((sid, uid))
+        else:
+            _LEVEL100_AWARD_CACHE.discard((sid, uid))
+
+
 async def maybe_award_level100(member: discord.Member, level: int, *, reason: str = "levelup") -> dict:
     if not member or level < SEASON_MAX_LEVEL:
         return {"awarded": False, "reason": "not_max_level"}
@@ -1485,14 +2673,19 @@ async def maybe_award_level100(member: discord.Member, level: int, *, reason: st
 
     uid = str(member.id)
     cache_key = (str(season_id), uid)
+    if str(season_id) not in _LEVEL100_AWARD_INDEX_LOADED:
+        try:
+            await aload_level100_award_index(season_id)
+        except Exception as e:
+            logging.warning(f"[season-award] award index load failed season={season_id}: {e!r}")
     if cache_key in _LEVEL100_AWARD_CACHE:
         return {"awarded": False, "reason": "already_owned_cached"}
 
     title_id = make_title_id(season_id)
+    reward = await _get_season_reward(season_id)
 
     def _award_sync():
         now = datetime.now(KST).isoformat()
-        reward = _season_rewards_ref(season_id).get() or {}
         title_name = reward.get("title_name")
         description = reward.get("description", "")
         completion_ref = _season_completion_ref(season_id, uid)
@@ -1567,6 +2760,8 @@ async def maybe_award_level100(member: discord.Member, level: int, *, reason: st
         result = await asyncio.to_thread(_award_sync)
         if result.get("reward_given"):
             _LEVEL100_AWARD_CACHE.add(cache_key)
+        if result.get("reason") in {"ok", "metadata_updated"}:
+            invalidate_user_titles(uid)
 
     if result.get("awarded"):
         dm_sent = False
@@ -1607,7 +2802,7 @@ async def update_existing_season_title_metadata(season_id: str, title_name: str,
     """이미 지급된 동일 시즌 칭호의 이름과 설명을 일괄 동기화합니다."""
     title_id = make_title_id(season_id)
 
-    def _sync() -> int:
+    def _sync() -> tuple[int, dict]:
         all_titles = db.reference("user_titles").get() or {}
         completions = db.reference("season_completion").child(season_id).get() or {}
         updates: dict[str, object] = {}
@@ -1623,6 +2818,12 @@ async def update_existing_season_title_metadata(season_id: str, title_name: str,
                 updates[f"user_titles/{uid}/owned/{title_id}/title_name"] = title_name
                 updates[f"user_titles/{uid}/owned/{title_id}/description"] = description
                 updates[f"user_titles/{uid}/owned/{title_id}/source_season_id"] = season_id
+                # 갱신 후 상태로 칭호 캐시를 다시 채울 수 있게 읽어 둔 사본에도 반영합니다.
+                owned[title_id].update({
+                    "title_name": title_name,
+                    "description": description,
+                    "source_season_id": season_id,
+                })
                 updated += 1
 
         if isinstance(completions, dict):
@@ -1632,18 +2833,22 @@ async def update_existing_season_title_metadata(season_id: str, title_name: str,
 
         if updates:
             firebase_root_update_strict(updates)
-        return updated
+        return updated, all_titles, completions
 
-    updated_count = await asyncio.to_thread(_sync)
-    for key in list(_LEVEL100_AWARD_CACHE):
-        if key[0] == str(season_id):
-            _LEVEL100_AWARD_CACHE.discard(key)
+    updated_count, all_titles, completions = await asyncio.to_thread(_sync)
+    _prime_user_titles(all_titles)
+    _rebuild_level100_award_index(season_id, completions)
     return updated_count
 
 
 async def reset_progress_title_members(guild: discord.Guild, *, level: int = 1) -> dict:
     updated = 0
     failed = 0
+    # 서버원마다 user_titles를 따로 읽지 않도록 한 번에 채워 둡니다. 실패해도 유저별 조회로 이어갑니다.
+    try:
+        await aprime_user_titles_cache()
+    except Exception as e:
+        logging.warning(f"[progress-title] user title cache prime failed: {e!r}")
     for member in guild.members:
         if member.bot or member.id == guild.owner_id:
             continue
@@ -1661,23 +2866,6 @@ async def reset_progress_title_members(guild: discord.Guild, *, level: int = 1)
     return {"updated": updated, "failed": failed}
 
 
-def get_week_key_kst(dt: datetime) -> str:
-    """
-    주 단위 키를 ISO 형식으로 반환합니다. 
-    예: 2025년 7월 22일 → '2025-W29'
-    """
-    iso_year, iso_week, _ = dt.isocalendar()
-    return f"{iso_year}-W{iso_week:02d}"
-
-def get_month_key_kst(dt: datetime) -> str:
-    """
-    월 단위 키를 'YYYY-M' 형식으로 반환합니다.
-    예: 2025년 7월 → '2025-7'
-    """
-    # 한 자리 월에는 앞에 ‘0’을 붙이지 않음
-    return f"{dt.year}-{dt.month}"
-
-
 async def update_role_and_nick(member: discord.Member, new_level: int) -> bool:
     """레벨 변화 시 현재 칭호를 즉시 반영합니다."""
     if not member or member.id == getattr(member.guild, "owner_id", None):
@@ -1776,13 +2964,17 @@ async def on_app_command_error(interaction: discord.Interaction, error: app_comm
 @bot.event
 async def on_ready():
 
-    # 2) 시즌 보이스 채널 업데이트 (예외 로깅)
+    # 1) 시즌 보이스 채널 업데이트 (예외 로깅)
     try:
         await update_season_voice_channels(bot)
     except Exception as e:
         print(f"[on_ready] update_season_voice_channels error: {e!r}")
 
 
+    # 2) 청크가 끝난 서버의 서버원 ID 집합을 새로 만듭니다.
+    for guild in bot.guilds:
+        refresh_guild_member_ids(guild)
+
     print(f"✅ {bot.user} 온라인")
     logging.info(f"[ready] logged in as {bot.user} (id={bot.user.id})")
     await bot.change_presence(activity=discord.Game("제가 오프라인이라면, 서버장에게 말해주세요!"))
@@ -1796,18 +2988,25 @@ async def on_ready():
         except Exception as e:
             print(f"❌ 슬래시 커맨드 동기화 실패: {e!r}")
 
-    # 4) 백그라운드 태스크 안전 시작(중복 방지)
-    for task in (voice_xp_task, reset_daily_missions, repeat_vc_mission_task, inactive_user_log_task, voice_count_channel_task, season_transition_task):
-        try:
-            if not task.is_running():
-                task.start()
-        except Exception as e:
-            print(f"[on_ready] task start error: {e!r}")
-            
+    # 4) 백그라운드 작업 스케줄러 시작(중복 방지)
+    try:
+        background_scheduler.start()
+    except Exception as e:
+        print(f"[on_ready] scheduler start error: {e!r}")
+
+    # 5) 재시작 전에 중단된 미접속 추방 작업 이어서 처리: 최초 1회만
+    if not getattr(bot, "_inactive_resume_started", False):
+        bot._inactive_resume_started = True
+        bot._inactive_resume_task = asyncio.create_task(resume_inactive_kick_jobs())
+
 
 # ---- on_member_update: 환영 메시지 및 역할 동기화 ----
 @bot.event
 async def on_member_update(before, after):
+    if member_resolver.forget(after.guild.id, after.id) and not after.bot:
+        # 일시적인 조회 실패로 '없음' 처리됐던 서버원을 순위 색인에 되돌립니다.
+        leaderboard_index.on_member_join(after)
+        attendance_rank_index.on_member_join(after)
     before_roles = {role.id for role in before.roles}
     after_roles = {role.id for role in after.roles}
     added = after_roles - before_roles
@@ -1852,8 +3051,303 @@ async def on_member_update(before, after):
         logging.exception(f"[on_member_update] initialization failed uid={uid}: {e}")
 
 
+@bot.event
+async def on_member_join(member: discord.Member):
+    member_resolver.forget(member.guild.id, member.id)
+    track_member_join(member)
+    leaderboard_index.on_member_join(member)
+    attendance_rank_index.on_member_join(member)
+
+
+@bot.event
+async def on_member_remove(member: discord.Member):
+    track_member_remove(member)
+    leaderboard_index.on_member_remove(member)
+    attendance_rank_index.on_member_remove(member)
+
+
+@bot.event
+async def on_guild_join(guild: discord.Guild):
+    if not guild.chunked:
+        try:
+            await guild.chunk(cache=True)
+        except Exception as e:
+            logging.warning(f"[guild-join] member chunk failed guild={guild.id}: {e!r}")
+    refresh_guild_member_ids(guild)
+
+
+@bot.event
+async def on_guild_available(guild: discord.Guild):
+    refresh_guild_member_ids(guild)
+
+
+@bot.event
+async def on_guild_remove(guild: discord.Guild):
+    drop_human_member_ids(guild.id)
+    leaderboard_index.drop_guild(guild.id)
+    attendance_rank_index.drop_guild(guild.id)
+
+
 # ---- 백그라운드 태스크 정의 ----
-@tasks.loop(time=dtime(hour=3, minute=0, tzinfo=pytz.FixedOffset(540)))
+async def find_inactive_members(guild: discord.Guild, threshold: datetime) -> list[tuple[discord.Member, float]]:
+    """
+    기준 시각 이전이 마지막 활동인 추방 대상 서버원과 마지막 활동 시각을 오래된 순으로 돌려줍니다.
+    봇, 서버장, 예외 역할 보유자는 제외합니다.
+    """
+    await last_activity_index.ensure_loaded()
+    humans = human_member_ids(guild)
+    exempt = set(EXEMPT_ROLE_IDS)
+    candidates: list[tuple[discord.Member, float]] = []
+    for uid, ts in last_activity_index.older_than(threshold.timestamp()):
+        if not uid.isdigit() or int(uid) not in humans or int(uid) == guild.owner_id:
+            continue
+        member = guild.get_member(int(uid))
+        if member is None or any(role.id in exempt for role in member.roles):
+            continue
+        candidates.append((member, ts))
+    return candidates
+
+
+# =========================
+# Inactive kick pipeline
+# =========================
+# 추방 작업은 inactive_kick_jobs/{gid}/{job_id} 에 서버원별 단계를 기록하며 진행합니다.
+#   meta:    status(running/done), created_at, threshold_ts, log_channel_id, log_sent
+#   members: {uid: {name, stage, error}}
+#   stage:   pending → dm_sent / dm_failed → kicked / kick_failed / left / skipped_active
+# 중간에 재시작돼도 마지막 작업을 이어서 처리하고, 로그는 끝난 뒤 요약 임베드 몇 개로 보냅니다.
+# DM 직후 기록 전에 중단되면 재개 시 DM이 한 번 더 갈 수 있습니다(추방은 중복되지 않음).
+# 끝난 작업은 INACTIVE_JOB_RETENTION_DAYS 가 지나면 매일 작업 전에 지웁니다.
+
+INACTIVE_DM_CONCURRENCY = int(os.getenv("INACTIVE_DM_CONCURRENCY", "2"))
+INACTIVE_KICK_CONCURRENCY = int(os.getenv("INACTIVE_KICK_CONCURRENCY", "1"))  # 같은 서버의 추방 경로는 한 버킷을 씁니다.
+INACTIVE_JOB_RETENTION_DAYS = int(os.getenv("INACTIVE_JOB_RETENTION_DAYS", "30"))
+_INACTIVE_LOG_LINES_PER_EMBED = 40
+_INACTIVE_TERMINAL_STAGES = {"kicked", "kick_failed", "left", "skipped_active"}
+_INACTIVE_JOB_LOCKS: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+def _inactive_jobs_ref(guild_id):
+    return db.reference(f"inactive_kick_jobs/{guild_id}")
+
+
+def _inactive_notice_embed() -> discord.Embed:
+    return discord.Embed(
+        title="📢 사계절, 그 사이 서버 안내",
+        description=(
+            "안녕하세요, '사계절, 그 사이' 서버 서버장입니다!\n\n"
+            f"최근 {INACTIVE_KICK_DAYS}일간 서버에 기록된 활동 내역이 없어,\n"
+            "공지해둔 규칙 사항에 따라 서버에서 추방 처리가 진행됩니다.\n\n"
+            "아래 링크를 통해 언제든 다시 서버에 입장하실 수 있습니다.\n\n"
+            "👉 https://discord.gg/Npuxrkf38G\n\n"
+            "- '사계절, 그 사이' 서버장 새벽녘 -"
+        ),
+        color=0x3498DB,
+    )
+
+
+async def aload_latest_inactive_job(guild_id: int) -> tuple[Optional[str], dict]:
+    """작업 ID는 시각 문자열이라 키 순서의 마지막이 가장 최근 작업입니다."""
+    def _get():
+        return _inactive_jobs_ref(guild_id).order_by_key().limit_to_last(1).get() or {}
+    data = await asyncio.to_thread(_get)
+    if not isinstance(data, dict) or not data:
+        return None, {}
+    job_id, job = next(iter(data.items()))
+    return job_id, job if isinstance(job, dict) else {}
+
+
+async def aprune_inactive_jobs(guild_id: int) -> int:
+    """보존 기간이 지난 끝난 작업을 지웁니다. 지운 개수를 반환합니다."""
+    cutoff_id = (datetime.now(KST) - timedelta(days=INACTIVE_JOB_RETENTION_DAYS)).strftime("%Y%m%d-%H%M%S")
+
+    def _prune() -> int:
+        ref = _inactive_jobs_ref(guild_id)
+        # 서버원 목록까지 받지 않도록 작업 ID만 읽습니다.
+        job_ids = sorted(job_id for job_id in (ref.get(shallow=True) or {}) if job_id < cutoff_id)
+        stale = [job_id for job_id in job_ids if ref.child(job_id).child("meta/status").get() == "done"]
+        if stale:
+            ref.update({job_id: None for job_id in stale})
+        return len(stale)
+
+    return await asyncio.to_thread(_prune)
+
+
+async def _checkpoint_inactive_member(guild_id: int, job_id: str, uid: str, fields: dict):
+    base = f"inactive_kick_jobs/{guild_id}/{job_id}/members/{uid}"
+    await afirebase_root_update_strict({f"{base}/{key}": value for key, value in fields.items()})
+
+
+class InactiveKickPipeline:
+    """한 서버의 추방 작업 하나를 DM → 추방 → 로그 단계로 처리합니다."""
+
+    def __init__(self, guild: discord.Guild, job_id: str, job: dict):
+        self.guild = guild
+        self.job_id = job_id
+        self.job = job
+        self.members: dict[str, dict] = {
+            str(uid): dict(record)
+            for uid, record in (job.get("members") or {}).items()
+            if isinstance(record, dict)
+        }
+        self._dm_sem = asyncio.Semaphore(max(1, INACTIVE_DM_CONCURRENCY))
+        self._kick_sem = asyncio.Semaphore(max(1, INACTIVE_KICK_CONCURRENCY))
+
+    async def _set_stage(self, uid: str, stage: str, **extra):
+        fields = {"stage": stage, **extra}
+        self.members[uid].update(fields)
+        try:
+            await _checkpoint_inactive_member(self.guild.id, self.job_id, uid, fields)
+        except Exception as e:
+            # 기록 실패는 이번 실행을 멈추지 않습니다. 재개 시 해당 단계가 다시 실행될 뿐입니다.
+            logging.warning(f"[inactive-job] checkpoint failed uid={uid} stage={stage}: {e!r}")
+
+    async def _process_member(self, uid: str):
+        record = self.members[uid]
+        if record.get("stage") in _INACTIVE_TERMINAL_STAGES:
+            return
+        member = self.guild.get_member(int(uid))
+        if member is None:
+            # 청킹 전 캐시에 없을 뿐일 수 있으므로 API로 확인하고, 없는 서버원일 때만 나간 것으로 봅니다.
+            try:
+                member = await self.guild.fetch_member(int(uid))
+            except discord.NotFound:
+                return await self._set_stage(uid, "left")
+            except Exception as e:
+                # 단계는 그대로 두어 다음 재개 때 다시 확인합니다.
+                logging.warning(f"[inactive-job] member lookup failed uid={uid}: {e!r}")
+                return
+        last_ts = _safe_float((exp_mirror.get(uid) or {}).get("last_activity"), 0)
+        if last_ts >= _safe_float(self.job.get("threshold_ts"), 0) > 0:
+            # 작업 생성 후 다시 활동한 서버원은 건너뜁니다.
+            return await self._set_stage(uid, "skipped_active")
+
+        if record.get("stage", "pending") == "pending":
+            async with self._dm_sem:
+                try:
+                    await member.send(embed=_inactive_notice_embed())
+                    dm_failed = False
+                except Exception:
+                    dm_failed = True
+            # 다음 단계에서 stage 가 덮이므로 DM 결과는 로그용으로 따로 남깁니다.
+            await self._set_stage(uid, "dm_failed" if dm_failed else "dm_sent", dm_failed=dm_failed)
+
+        async with self._kick_sem:
+            try:
+                await member.kick(reason=f"{INACTIVE_KICK_DAYS}일 미접속 자동 추방")
+            except Exception as e:
+                logging.exception(f"[inactive-job] kick failed uid={uid}: {e}")
+                return await self._set_stage(uid, "kick_failed", error=type(e).__name__)
+        await self._set_stage(uid, "kicked")
+
+    def _summary_embeds(self) -> list[discord.Embed]:
+        lines = []
+        counts: defaultdict[str, int] = defaultdict(int)
+        for uid, record in self.members.items():
+            name = record.get("name") or uid
+            stage = record.get("stage")
+            counts[stage] += 1
+            if stage == "kicked":
+                dm_note = " (DM 전송 실패)" if record.get("dm_failed") else ""
+                lines.append(f"👢 {name}{dm_note}")
+            elif stage == "kick_failed":
+                lines.append(f"❌ {name} 처리 실패: {record.get('error', '')}")
+
+        head = (
+            f"추방 {counts['kicked']}명 · 실패 {counts['kick_failed']}명 · "
+            f"이미 나감 {counts['left']}명 · 재활동으로 제외 {counts['skipped_active']}명"
+        )
+        chunks = [lines[i:i + _INACTIVE_LOG_LINES_PER_EMBED] for i in range(0, len(lines), _INACTIVE_LOG_LINES_PER_EMBED)] or [[]]
+        embeds = []
+        for idx, chunk in enumerate(chunks, start=1):
+            embed = discord.Embed(
+                title=f"👢 {INACTIVE_KICK_DAYS}일 미접속 자동 추방 결과"
+                + (f" ({idx}/{len(chunks)})" if len(chunks) > 1 else ""),
+                description="\n".join([head, ""] + chunk) if idx == 1 else "\n".join(chunk),
+                color=discord.Color.dark_orange(),
+            )
+            embed.set_footer(text=f"작업 {self.job_id}")
+            embeds.append(embed)
+        return embeds
+
+    async def _send_log(self):
+        base = f"inactive_kick_jobs/{self.guild.id}/{self.job_id}/meta"
+        log_error = ""
+        channel = self.guild.get_channel(_safe_int(self.job.get("log_channel_id"), 0))
+        if channel is None or not hasattr(channel, "send"):
+            log_error = "log_channel_missing"
+        else:
+            try:
+                embeds = self._summary_embeds()
+                for start in range(0, len(embeds), 10):
+                    await channel.send(embeds=embeds[start:start + 10])
+            except Exception as e:
+                logging.warning(f"[inactive-job] summary log failed guild={self.guild.id} job={self.job_id}: {e!r}")
+                log_error = type(e).__name__
+        # 로그 전송에 실패해도 추방 단계는 끝났으므로 작업을 닫아 무한 재개를 막습니다.
+        updates = {f"{base}/log_sent": not log_error, f"{base}/status": "done"}
+        if log_error:
+            updates[f"{base}/log_error"] = log_error
+        await afirebase_root_update_strict(updates)
+
+    async def run(self):
+        pending = [uid for uid, record in self.members.items() if record.get("stage") not in _INACTIVE_TERMINAL_STAGES]
+        if pending:
+            # 재활동 확인은 미러 기준이므로, 로드 전 0으로 읽혀 돌아온 서버원이 추방되지 않게 먼저 채웁니다.
+            await last_activity_index.ensure_loaded()
+            if not self.guild.chunked:
+                try:
+                    await self.guild.chunk()
+                except Exception as e:
+                    logging.warning(f"[inactive-job] guild chunk failed guild={self.guild.id}: {e!r}")
+            logging.info(f"[inactive-job] guild={self.guild.id} job={self.job_id} processing={len(pending)}")
+            await asyncio.gather(*(self._process_member(uid) for uid in pending))
+        await self._send_log()
+
+
+async def _start_inactive_job(guild: discord.Guild, log_channel, candidates) -> InactiveKickPipeline:
+    job_id = datetime.now(KST).strftime("%Y%m%d-%H%M%S")
+    job = {
+        "meta": {
+            "status": "running",
+            "created_at": datetime.now(KST).isoformat(),
+            "threshold_ts": (datetime.now(KST) - timedelta(days=INACTIVE_KICK_DAYS)).timestamp(),
+            "log_channel_id": str(log_channel.id),
+            "log_sent": False,
+        },
+        "members": {
+            str(member.id): {"name": member.display_name, "stage": "pending"}
+            for member, _last_ts in candidates
+        },
+    }
+    await afirebase_root_update_strict({f"inactive_kick_jobs/{guild.id}/{job_id}": job})
+    return InactiveKickPipeline(guild, job_id, {**job["meta"], "members": job["members"]})
+
+
+async def resume_inactive_kick_job(guild: discord.Guild) -> bool:
+    """끝나지 않은 마지막 작업이 있으면 이어서 처리합니다. 처리했으면 True."""
+    job_id, job = await aload_latest_inactive_job(guild.id)
+    meta = job.get("meta") or {}
+    if not job_id or meta.get("status") == "done":
+        return False
+    logging.warning(f"[inactive-job] resuming guild={guild.id} job={job_id}")
+    await InactiveKickPipeline(guild, job_id, {**meta, "members": job.get("members") or {}}).run()
+    return True
+
+
+async def resume_inactive_kick_jobs():
+    """재시작 후 한 번, 중단된 추방 작업을 이어서 처리합니다."""
+    if not INACTIVE_AUTO_KICK_ENABLED:
+        return
+    await exp_mirror.ensure_loaded()
+    for guild in bot.guilds:
+        try:
+            async with _INACTIVE_JOB_LOCKS[guild.id]:
+                await resume_inactive_kick_job(guild)
+        except Exception as e:
+            logging.exception(f"[inactive-job] resume failed guild={guild.id}: {e}")
+
+
 @guard_background_task("inactive_user_log")
 async def inactive_user_log_task():
     """매일 03:00(KST)에 장기 미접속 사용자 추방과 결과 로그를 처리합니다."""
@@ -1863,7 +3357,7 @@ async def inactive_user_log_task():
 
     threshold = datetime.now(KST) - timedelta(days=INACTIVE_KICK_DAYS)
 
-    for guild in bot.guilds:
+    async for guild in iter_guilds_staggered(bot.guilds):
         try:
             cfg = await aget_guild_config(guild.id)
         except Exception as e:
@@ -1875,57 +3369,39 @@ async def inactive_user_log_task():
         if not log_channel:
             continue
 
-        kicked: list[str] = []
-        for member in guild.members:
-            if member.bot or member.id == guild.owner_id:
-                continue
-            if any(role.id in EXEMPT_ROLE_IDS for role in member.roles):
-                continue
-
+        async with _INACTIVE_JOB_LOCKS[guild.id]:
             try:
-                user = await aget_user_exp(str(member.id))
-                last_ts = _safe_float(user.get("last_activity"), 0)
-                if last_ts <= 0:
-                    continue
-                last_active = datetime.fromtimestamp(last_ts, KST)
-                if last_active >= threshold:
-                    continue
+                await resume_inactive_kick_job(guild)
+            except Exception as e:
+                logging.exception(f"[inactive-job] resume failed guild={guild.id}: {e}")
+            try:
+                pruned = await aprune_inactive_jobs(guild.id)
+                if pruned:
+                    logging.info(f"[inactive-job] pruned guild={guild.id} jobs={pruned}")
+            except Exception as e:
+                logging.warning(f"[inactive-job] prune failed guild={guild.id}: {e!r}")
+            try:
+                candidates = await find_inactive_members(guild, threshold)
+            except Exception as e:
+                logging.exception(f"[inactive] candidate lookup failed guild={guild.id}: {e}")
+                continue
 
+            if not candidates:
                 try:
-                    embed = discord.Embed(
-                        title="📢 사계절, 그 사이 서버 안내",
-                        description=(
-                            "안녕하세요, '사계절, 그 사이' 서버 서버장입니다!\n\n"
-                            f"최근 {INACTIVE_KICK_DAYS}일간 서버에 기록된 활동 내역이 없어,\n"
-                            "공지해둔 규칙 사항에 따라 서버에서 추방 처리가 진행됩니다.\n\n"
-                            "아래 링크를 통해 언제든 다시 서버에 입장하실 수 있습니다.\n\n"
-                            "👉 https://discord.gg/Npuxrkf38G\n\n"
-                            "- '사계절, 그 사이' 서버장 새벽녘 -"
-                        ),
-                        color=0x3498DB,
+                    await log_channel.send(
+                        f"✅ 현재 {INACTIVE_KICK_DAYS}일 이상 미접속 중인 사용자가 없습니다."
                     )
-                    await member.send(embed=embed)
-                except Exception:
-                    await log_channel.send(f"❌ {member.display_name} 님에게 DM 전송 실패")
+                except Exception as e:
+                    logging.warning(f"[inactive] log send failed guild={guild.id}: {e!r}")
+                continue
 
-                await member.kick(reason=f"{INACTIVE_KICK_DAYS}일 미접속 자동 추방")
-                await log_channel.send(
-                    f"👢 {member.display_name} 님이 {INACTIVE_KICK_DAYS}일간 미접속으로 추방되었습니다."
-                )
-                kicked.append(member.display_name)
+            try:
+                pipeline = await _start_inactive_job(guild, log_channel, candidates)
+                await pipeline.run()
             except Exception as e:
-                logging.exception(f"[inactive] uid={member.id} error: {e}")
-                try:
-                    await log_channel.send(f"❌ {member.display_name} 님 미접속 처리 실패: {type(e).__name__}")
-                except Exception:
-                    pass
+                logging.exception(f"[inactive-job] guild={guild.id} job failed: {e}")
+
 
-        if not kicked:
-            await log_channel.send(
-                f"✅ 현재 {INACTIVE_KICK_DAYS}일 이상 미접속 중인 사용자가 없습니다."
-            )
-        
-@tasks.loop(time=dtime(hour=0, minute=0, tzinfo=pytz.FixedOffset(540)))
 @guard_background_task("reset_daily_missions")
 async def reset_daily_missions():
     """매일 자정(KST)에 일일 미션 데이터를 초기화합니다."""
@@ -1936,7 +3412,6 @@ async def reset_daily_missions():
     except Exception as e:
         logging.exception(f"[daily-mission-reset] failed: {e}")
 
-@tasks.loop(seconds=VOICE_COOLDOWN)
 @guard_background_task("voice_xp")
 async def voice_xp_task():
     """음성 채널 경험치 태스크."""
@@ -1944,7 +3419,7 @@ async def voice_xp_task():
         return
 
     now_ts = time.time()
-    for guild in bot.guilds:
+    async for guild in iter_guilds_staggered(bot.guilds):
         try:
             cfg = await aget_guild_config(guild.id)
         except Exception as e:
@@ -2001,17 +3476,6 @@ async def voice_xp_task():
                 except Exception as e:
                     logging.exception(f"[voice_xp_task] uid={getattr(member, 'id', '?')} error: {e}")
 
-@voice_xp_task.error
-async def voice_xp_task_error(error):
-    logging.exception(f"[voice_xp_task] crashed: {error}")
-    try:
-        # 예외로 루프가 중지됐으면 재시작 시도
-        if not voice_xp_task.is_running():
-            voice_xp_task.start()
-    except Exception as e2:
-        logging.exception(f"[voice_xp_task] restart failed: {e2}")
-        
-@tasks.loop(seconds=60)
 @guard_background_task("repeat_vc_mission")
 async def repeat_vc_mission_task():
     """5인 이상 음성방 반복 미션을 유저 단위로 안전하게 누적합니다."""
@@ -2019,7 +3483,7 @@ async def repeat_vc_mission_task():
         return
 
     today = datetime.now(KST).strftime("%Y-%m-%d")
-    for guild in bot.guilds:
+    async for guild in iter_guilds_staggered(bot.guilds):
         try:
             cfg = await aget_guild_config(guild.id)
         except Exception as e:
@@ -2095,10 +3559,9 @@ async def repeat_vc_mission_task():
     except Exception as e:
         logging.warning(f"[repeat_vc_mission] local backup failed: {e!r}")
 
-@tasks.loop(seconds=60)
 @guard_background_task("voice_count_channel")
 async def voice_count_channel_task():
-    for guild in bot.guilds:
+    async for guild in iter_guilds_staggered(bot.guilds):
         try:
             cfg = await aget_guild_config(guild.id)
             items = cfg.get("voice_count_channels", [])
@@ -2124,19 +3587,136 @@ async def voice_count_channel_task():
         except Exception as e:
             logging.exception(f"[voice-count] guild={guild.id} error: {e}")
 
-@tasks.loop(minutes=5)
+SEASON_TRANSITION_GRACE_SECONDS = 5
+SEASON_TRANSITION_RETRY_SECONDS = 300
+SEASON_TRANSITION_BUSY_RETRY_SECONDS = 15
+SEASON_TRANSITION_MAX_SLEEP_SECONDS = 6 * 3600
+_SEASON_TRANSITION_RETRY_REASONS = {"member_cache_incomplete", "notice_retry_failed"}
+
+# 마지막 실행이 계산한 다음 실행 시각(epoch 초). 0이면 시작 직후 한 번 바로 확인합니다.
+_season_transition_next_at = 0.0
+
+
+def next_season_boundary_at(now_kst: datetime) -> datetime:
+    """다음 프리시즌 시작 또는 다음 시즌 시작(KST 00:00) 중 가까운 시각을 반환합니다."""
+    cal = get_calendar_season_info(now_kst)
+    dates = _season_dates_for_type(cal["season_year"], cal["season_type"])
+    for d in (dates["preseason_start"], dates["preseason_end"] + timedelta(days=1)):
+        boundary = KST.localize(datetime(d.year, d.month, d.day))
+        if boundary > now_kst:
+            return boundary
+    return now_kst + timedelta(days=1)
+
+
+def season_recovery_pending(state: dict) -> bool:
+    """정산/시즌 시작 후처리나 공지 재시도가 남아 있는지 확인합니다."""
+    current_id = state.get("current_season_id")
+    if state.get("settlement_postprocess_pending") or state.get("settlement_notice_pending"):
+        return True
+    if current_id and state.get("season_start_postprocess_pending_for") == current_id:
+        return True
+    return bool(
+        current_id
+        and state.get("season_start_notice_pending_for") == current_id
+        and state.get("start_notice_sent_for") != current_id
+    )
+
+
+def request_season_transition_check(reason: str):
+    """시즌 관리 명령어가 상태를 바꾼 직후 전환 스케줄러를 깨웁니다."""
+    background_scheduler.wake("season_transition", reason)
+
+
+_SEASON_TRANSITION_WATCH_KEYS = (
+    "first_season_started",
+    "settled",
+    "next_ready",
+    "next_season_id",
+    "settlement_postprocess_pending",
+    "settlement_notice_pending",
+    "season_start_postprocess_pending_for",
+    "season_start_notice_pending_for",
+)
+
+
+def _wake_transition_on_state_change(old: dict, new: dict):
+    """콘솔 등 외부에서 전환 조건이 새로 켜지면 다음 경계까지 기다리지 않고 확인합니다."""
+    for key in _SEASON_TRANSITION_WATCH_KEYS:
+        if new.get(key) and new.get(key) != old.get(key):
+            request_season_transition_check(f"season_state:{key}")
+            return
+
+
+season_state_cache.subscribe(_wake_transition_on_state_change)
+
+
 @guard_background_task("season_transition")
 async def season_transition_task():
     """
     시즌 시작 자동 처리 태스크.
     정산 완료 + 다음 시즌 준비 완료 + 날짜상 다음 시즌 진입 시
     시즌 시작 공지와 진행도 칭호 갱신을 자동 처리합니다.
+    평소에는 다음 시즌 경계까지 잠들고, 복구 대기 중일 때만 짧게 재시도합니다.
     """
+    global _season_transition_next_at
+    now_ts = time.time()
+    # 중간에 예외가 나도 다음 실행이 무기한 미뤄지지 않도록 기본 재시도 시각을 먼저 둡니다.
+    _season_transition_next_at = now_ts + SEASON_TRANSITION_RETRY_SECONDS
+
+    results: list[dict] = []
     try:
-        for guild in bot.guilds:
-            await process_season_start_if_needed(guild)
+        async for guild in iter_guilds_staggered(bot.guilds):
+            results.append(await process_season_start_if_needed(guild))
     except Exception as e:
         logging.exception(f"[season_transition_task] error: {e}")
+        return
+
+    # 경계 시각의 상태 전환(정규 시즌 → 프리시즌)도 여기서 한 번 반영됩니다.
+    state = await aget_effective_season_state()
+    now_ts = time.time()
+    next_at = next_season_boundary_at(datetime.now(KST)).timestamp() + SEASON_TRANSITION_GRACE_SECONDS
+    reasons = {str(result.get("reason", "")) for result in results if isinstance(result, dict)}
+    if "season_operation_busy" in reasons:
+        next_at = min(next_at, now_ts + SEASON_TRANSITION_BUSY_RETRY_SECONDS)
+    elif season_recovery_pending(state) or reasons & _SEASON_TRANSITION_RETRY_REASONS:
+        next_at = min(next_at, now_ts + SEASON_TRANSITION_RETRY_SECONDS)
+    _season_transition_next_at = min(next_at, now_ts + SEASON_TRANSITION_MAX_SLEEP_SECONDS)
+    logging.info(
+        "[season_transition_task] next check at %s",
+        datetime.fromtimestamp(_season_transition_next_at, KST).isoformat(),
+    )
+
+
+@guard_background_task("leaderboard_snapshot")
+async def leaderboard_snapshot_task():
+    """서버별 랭킹 스냅샷(상위 K명 + 구간 히스토그램)을 바뀐 경우에만 저장합니다."""
+    state = await aget_effective_season_state()
+    written = 0
+    async for guild in iter_guilds_staggered(bot.guilds):
+        try:
+            if await write_leaderboard_snapshot(guild, state):
+                written += 1
+        except Exception as e:
+            logging.warning(f"[leaderboard-snapshot] guild={guild.id} failed: {e!r}")
+    if written:
+        logging.info(f"[leaderboard-snapshot] written guilds={written}")
+
+
+# 같은 1분 주기 작업은 주기 안에서 20초씩 어긋나게 시작합니다.
+background_scheduler.every("voice_xp", voice_xp_task, seconds=VOICE_COOLDOWN, offset=0)
+background_scheduler.every("repeat_vc_mission", repeat_vc_mission_task, seconds=60, offset=20)
+background_scheduler.every("voice_count_channel", voice_count_channel_task, seconds=60, offset=40)
+background_scheduler.dynamic(
+    "season_transition",
+    season_transition_task,
+    next_at=lambda _now: _season_transition_next_at,
+    min_gap=SEASON_TRANSITION_BUSY_RETRY_SECONDS,
+)
+background_scheduler.every(
+    "leaderboard_snapshot", leaderboard_snapshot_task, seconds=LEADERBOARD_SNAPSHOT_INTERVAL, offset=30
+)
+background_scheduler.daily("reset_daily_missions", reset_daily_missions, at=dtime(hour=0, minute=0))
+background_scheduler.daily("inactive_user_log", inactive_user_log_task, at=dtime(hour=3, minute=0))
 
 @bot.event
 async def on_message(message):
@@ -2250,17 +3830,19 @@ async def on_message(message):
                     allowed_mentions=ALLOW_NO_PING,
                 )
             try:
-                buf = await asyncio.wait_for(
-                    asyncio.to_thread(
-                        render_daily_quest_banner,
-                        display_name=message.author.display_name,
-                        pct_int=pct_int,
-                        height=40,
-                        reward_pct=1,
-                    ),
+                banner = await render_service.render(
+                    "quest_banner",
                     timeout=6,
+                    display_name=message.author.display_name,
+                    pct_int=pct_int,
+                    height=40,
+                    reward_pct=1,
+                )
+                await attachment_url_cache.send(
+                    message.channel.send,
+                    banner.data,
+                    f"daily_quest.{banner.ext}",
                 )
-                await message.channel.send(file=discord.File(fp=buf, filename="daily_quest.png"))
             except Exception:
                 await message.channel.send(
                     f"🎯 {message.author.mention} 일일 퀘스트 완료! "
@@ -2571,6 +4153,39 @@ async def analyze_info(interaction: discord.Interaction, member: discord.Member)
         inline=False,
     )
     await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+@app_commands.default_permissions(administrator=True)
+@app_commands.checks.has_permissions(administrator=True)
+@app_commands.guild_only()
+@bot.tree.command(name="미접속미리보기", description="자동 추방 기준으로 추방될 서버원을 미리 확인합니다.")
+async def inactive_preview(interaction: discord.Interaction):
+    await interaction.response.defer(ephemeral=True)
+    now = datetime.now(KST)
+    candidates = await find_inactive_members(interaction.guild, now - timedelta(days=INACTIVE_KICK_DAYS))
+
+    lines = []
+    for member, last_ts in candidates[:30]:
+        last_dt = datetime.fromtimestamp(last_ts, KST)
+        lines.append(
+            f"- {member.display_name} · 마지막 활동 {last_dt.strftime('%Y. %m. %d')} "
+            f"({(now - last_dt).days}일 전)"
+        )
+    if len(candidates) > 30:
+        lines.append(f"...외 {len(candidates) - 30}명")
+
+    embed = discord.Embed(
+        title=f"👀 {INACTIVE_KICK_DAYS}일 미접속 추방 대상 미리보기",
+        description="\n".join(lines) if lines else "현재 추방 대상이 없습니다.",
+        color=discord.Color.orange(),
+    )
+    embed.set_footer(
+        text=f"대상 {len(candidates)}명 · 자동 추방 "
+        f"{'켜짐' if INACTIVE_AUTO_KICK_ENABLED else '꺼짐'} · 실제 추방은 매일 03:00(KST)"
+    )
+    await interaction.followup.send(embed=embed, ephemeral=True)
+
+
 @app_commands.default_permissions(administrator=True)
 @app_commands.checks.has_permissions(administrator=True)
 @app_commands.guild_only()
@@ -2665,6 +4280,610 @@ async def deduct_xp(interaction: discord.Interaction, member: discord.Member, am
         f"✅ {member.mention}에게서 경험치 {amount}XP 차감 완료!",
         ephemeral=True,
     )
+
+# =========================
+# Command data gathering
+# =========================
+
+COMMAND_FETCH_BUDGET = float(os.getenv("COMMAND_FETCH_BUDGET", "5.0"))  # 명령어 하나의 조회 전체 기한(초)
+_NO_FALLBACK = object()
+
+
+async def gather_with_deadline(
+    fetches: dict,
+    *,
+    timeout: float = COMMAND_FETCH_BUDGET,
+    fallbacks: Optional[dict] = None,
+    label: str = "command",
+) -> dict:
+    """
+    서로 독립적인 조회를 동시에 실행하고 이름별 결과를 돌려줍니다.
+    - 전체가 하나의 기한을 공유하므로 지연은 가장 느린 조회 하나만큼입니다.
+    - fallbacks 에 값이 있는 조회는 실패하거나 기한을 넘기면 그 값으로 대체됩니다.
+    - 대체값이 없는 조회가 실패하면 나머지를 기다리지 않고 취소한 뒤 그 예외를 그대로 올립니다.
+    - 호출부가 취소돼도 남은 조회를 취소하고 정리한 뒤 빠져나갑니다.
+    """
+    fallbacks = fallbacks or {}
+    tasks = {name: asyncio.ensure_future(aw) for name, aw in fetches.items()}
+    if not tasks:
+        return {}
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    deadline = loop.time() + timeout
+    required = {task for name, task in tasks.items() if name not in fallbacks}
+    pending = set(tasks.values())
+    failure: Optional[BaseException] = None
+    try:
+        while pending:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task in required and not task.cancelled() and task.exception() is not None:
+                    failure = failure or task.exception()
+            if failure is not None or not done:
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    if failure is not None:
+        raise failure
+
+    results: dict = {}
+    for name, task in tasks.items():
+        if task in pending:
+            error: Optional[BaseException] = asyncio.TimeoutError(f"{label}:{name}")
+        elif task.cancelled():
+            error = asyncio.CancelledError()
+        else:
+            error = task.exception()
+        if error is None:
+            results[name] = task.result()
+            continue
+        fallback = fallbacks.get(name, _NO_FALLBACK)
+        if fallback is _NO_FALLBACK:
+            failure = failure or error
+            continue
+        logging.warning(f"[{label}] {name} fetch failed, using fallback: {error!r}")
+        results[name] = fallback
+
+    if failure is not None:
+        raise failure
+    logging.debug(f"[{label}] gathered {list(tasks)} in {(time.perf_counter() - started) * 1000:.1f}ms")
+    return results
+
+
+# =========================
+# Shared HTTP session / avatar cache
+# =========================
+
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", "20"))
+AVATAR_FETCH_SIZE = 256
+AVATAR_CACHE_MAX_BYTES = int(os.getenv("AVATAR_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+AVATAR_CACHE_DIR = os.getenv("AVATAR_CACHE_DIR", "").strip()  # 비우면 디스크 계층을 쓰지 않습니다.
+AVATAR_CACHE_DISK_MAX_BYTES = int(os.getenv("AVATAR_CACHE_DISK_MAX_BYTES", str(128 * 1024 * 1024)))
+
+_HTTP_SESSION: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """CDN 연결을 재사용하도록 프로세스 전체에서 하나의 세션을 씁니다."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        )
+        _HTTP_SESSION = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=5),
+            headers={"User-Agent": "Mozilla/5.0"},
+        )
+    return _HTTP_SESSION
+
+
+async def close_http_session():
+    global _HTTP_SESSION
+    if _HTTP_SESSION is not None and not _HTTP_SESSION.closed:
+        await _HTTP_SESSION.close()
+    _HTTP_SESSION = None
+
+
+class AvatarCache:
+    """아바타 해시 단위로 원본 바이트를 보관합니다. 메모리는 바이트 총량으로 제한하고 디스크 계층은 선택입니다."""
+
+    def __init__(self, max_bytes: int, disk_dir: str = "", disk_max_bytes: int = 0):
+        self.max_bytes = max(0, int(max_bytes))
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = max(0, int(disk_max_bytes))
+        self._items: OrderedDict[str, bytes] = OrderedDict()
+        self._bytes = 0
+        # 디스크 계층도 메모리와 같이 바이트 총량 LRU 로 관리합니다. 파일 경로 -> 크기
+        self._disk_items: OrderedDict[str, int] = OrderedDict()
+        self._disk_bytes = 0
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.disk_evictions = 0
+        if self.disk_dir:
+            try:
+                os.makedirs(self.disk_dir, exist_ok=True)
+                self._scan_disk()
+            except Exception as e:
+                logging.warning(f"[avatar-cache] disk tier disabled: {e!r}")
+                self.disk_dir = ""
+
+    def _scan_disk(self):
+        """재시작 시 기존 파일을 오래된 순으로 색인하고 상한을 넘는 만큼 지웁니다."""
+        entries = []
+        for name in os.listdir(self.disk_dir):
+            path = os.path.join(self.disk_dir, name)
+            if not name.endswith(".bin"):
+                continue
+            st = os.stat(path)
+            entries.append((st.st_mtime, path, st.st_size))
+        for _, path, size in sorted(entries):
+            self._disk_items[path] = size
+            self._disk_bytes += size
+        for path in self._disk_evict_candidates():
+            self._remove_disk_file(path)
+
+    @staticmethod
+    def key_for(user, size: int = AVATAR_FETCH_SIZE) -> str:
+        return f"{user.display_avatar.key}_{int(size)}"
+
+    def _remember(self, key: str, data: bytes):
+        old = self._items.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old)
+        if len(data) > self.max_bytes:
+            return
+        self._items[key] = data
+        self._bytes += len(data)
+        while self._bytes > self.max_bytes and self._items:
+            _, evicted = self._items.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def _disk_path(self, key: str) -> str:
+        safe = re.sub(r"[^0-9A-Za-z_.-]", "_", key)
+        return os.path.join(self.disk_dir, f"{safe}.bin")
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+    def _write_disk(self, key: str, data: bytes):
+        path = self._disk_path(key)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _remove_disk_file(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _disk_touch(self, key: str, size: Optional[int] = None):
+        """디스크 색인 갱신은 이벤트 루프에서만 합니다. size 가 있으면 새로 쓴 파일입니다."""
+        path = self._disk_path(key)
+        if size is None:
+            if path in self._disk_items:
+                self._disk_items.move_to_end(path)
+            return
+        self._disk_bytes -= self._disk_items.pop(path, 0)
+        self._disk_items[path] = size
+        self._disk_bytes += size
+
+    def _disk_evict_candidates(self) -> list[str]:
+        evicted = []
+        while self._disk_bytes > self.disk_max_bytes and self._disk_items:
+            path, size = self._disk_items.popitem(last=False)
+            self._disk_bytes -= size
+            evicted.append(path)
+        self.disk_evictions += len(evicted)
+        return evicted
+
+    async def _load(self, user, key: str, size: int) -> Optional[bytes]:
+        if self.disk_dir:
+            try:
+                data = await asyncio.to_thread(self._read_disk, key)
+            except Exception:
+                data = None
+            if data:
+                self.disk_hits += 1
+                self._disk_touch(key)
+                return data
+
+        self.misses += 1
+        url = user.display_avatar.replace(size=size).url
+        async with get_http_session().get(url) as resp:
+            logging.info(f"[avatar-cache] fetch resp={resp.status}")
+            if resp.status != 200:
+                return None
+            data = await resp.read()
+        if self.disk_dir and data:
+            try:
+                await asyncio.to_thread(self._write_disk, key, data)
+                self._disk_touch(key, len(data))
+                evicted = self._disk_evict_candidates()
+                if evicted:
+                    await asyncio.to_thread(lambda: [self._remove_disk_file(p) for p in evicted])
+            except Exception as e:
+                logging.warning(f"[avatar-cache] disk write failed: {e!r}")
+        return data
+
+    async def get(self, user, size: int = AVATAR_FETCH_SIZE) -> tuple[str, Optional[bytes]]:
+        """(캐시 키, 바이트)를 반환합니다. 같은 아바타를 동시에 요청하면 한 번만 내려받습니다."""
+        key = self.key_for(user, size)
+        data = self._items.get(key)
+        if data is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return key, data
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return key, await asyncio.shield(pending)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        data = None
+        try:
+            data = await self._load(user, key, size)
+            if data:
+                self._remember(key, data)
+            return key, data
+        finally:
+            # 예외나 취소(마감 시간 초과 등)로 끝나도 기다리는 호출부가 멈추지 않게 항상 결과를 채웁니다.
+            if self._inflight.get(key) is fut:
+                self._inflight.pop(key, None)
+            if not fut.done():
+                fut.set_result(data)
+
+    def stats(self) -> dict:
+        return {
+            "items": len(self._items),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "disk": bool(self.disk_dir),
+            "disk_bytes": self._disk_bytes,
+            "disk_max_bytes": self.disk_max_bytes,
+            "disk_evictions": self.disk_evictions,
+        }
+
+
+avatar_cache = AvatarCache(AVATAR_CACHE_MAX_BYTES, AVATAR_CACHE_DIR, AVATAR_CACHE_DISK_MAX_BYTES)
+
+
+# =========================
+# Rendering service (process pool)
+# =========================
+
+RENDER_BACKEND = os.getenv("RENDER_BACKEND", "process").strip().lower()  # process | thread
+RENDER_WORKERS = max(1, int(os.getenv("RENDER_WORKERS", "2")))
+RENDER_QUEUE_MAX = max(0, int(os.getenv("RENDER_QUEUE_MAX", "8")))
+# 이미지 종류별 인코딩 프로필 (png | fast_png | webp_lossless | small)
+# 기본값은 실측 기준: 두 이미지 모두 webp_lossless 가 무손실 중 가장 작고 CPU 는 png 와 비슷합니다.
+RENDER_ENCODE_PROFILES = {
+    "rank_card": os.getenv("RANK_CARD_ENCODE_PROFILE", "webp_lossless").strip(),
+    "quest_banner": os.getenv("QUEST_BANNER_ENCODE_PROFILE", "webp_lossless").strip(),
+}
+
+
+def percentile(values, q: float) -> Optional[float]:
+    """지연 시간 표본의 q 분위수(0~1)를 소수 첫째 자리까지. 표본이 없으면 None."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * q))], 1)
+
+
+class RenderQueueFull(Exception):
+    """대기열이 가득 차 렌더링을 받지 않을 때 발생합니다. 호출부는 텍스트 응답으로 대체합니다."""
+
+
+class RenderService:
+    """
+    Pillow 렌더링을 별도 프로세스에서 실행합니다.
+    - 워커 수만큼만 동시에 제출하고 나머지는 이 클래스의 대기열에서 기다립니다.
+    - 대기 중 기한이 지난 작업은 워커에 넘기지 않고 버립니다.
+    - 호출부가 기한 초과로 포기한 작업은 워커가 끝날 때까지 슬롯을 점유해 적체가 쌓이지 않게 합니다.
+    """
+
+    def __init__(self, backend: str, workers: int, queue_max: int):
+        self.backend = backend if backend in {"process", "thread"} else "process"
+        self.workers = workers
+        self.queue_max = queue_max
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots = asyncio.Semaphore(workers)
+        self._waiting = 0
+        self._running = 0
+        self._latency_ms = deque(maxlen=200)
+        self._wait_ms = deque(maxlen=200)
+        self.counters = defaultdict(int)
+        # 프로필별 인코딩 CPU 시간과 출력 크기 누계
+        self._encode_stats = defaultdict(lambda: {"count": 0, "cpu_ms": 0.0, "bytes": 0})
+
+    def start(self):
+        """
+        리스너/디스코드 스레드가 뜨기 전에 호출해 워커를 미리 fork 합니다.
+        spawn 방식은 main.py 최상위 코드(Firebase 초기화, Bot 생성)를 워커마다 다시 실행하므로 쓰지 않습니다.
+        """
+        if self.backend != "process" or self._executor is not None:
+            return
+        try:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=rank_render.warm_worker,
+            )
+            # fork 컨텍스트는 첫 제출 때 워커를 모두 띄우므로 여기서 한 번 제출해 둡니다.
+            self._executor.submit(rank_render.warm_worker)
+            logging.info(f"[render] process pool started workers={self.workers} queue_max={self.queue_max}")
+        except Exception as e:
+            logging.warning(f"[render] process pool unavailable, using threads: {e!r}")
+            self._executor = None
+            self.backend = "thread"
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _submit(self, kind: str, kwargs: dict) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        profile = RENDER_ENCODE_PROFILES.get(kind, "png")
+        if self._executor is not None:
+            return loop.run_in_executor(self._executor, rank_render.render_to_bytes, kind, kwargs, profile)
+        return loop.run_in_executor(None, rank_render.render_to_bytes, kind, kwargs, profile)
+
+    def _release(self, _fut=None):
+        self._running -= 1
+        self._slots.release()
+
+    async def render(self, kind: str, *, timeout: float, **kwargs) -> rank_render.EncodedImage:
+        """인코딩된 이미지를 반환합니다. 대기열 초과 시 RenderQueueFull, 기한 초과 시 asyncio.TimeoutError."""
+        if self._waiting + self._running >= self.workers + self.queue_max:
+            self.counters["rejected"] += 1
+            raise RenderQueueFull(kind)
+
+        loop = asyncio.get_running_loop()
+        queued_at = loop.time()
+        deadline = queued_at + timeout
+        self.counters["submitted"] += 1
+
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=max(0.0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            self.counters["expired_in_queue"] += 1
+            raise
+        finally:
+            self._waiting -= 1
+
+        self._running += 1
+        self._wait_ms.append((loop.time() - queued_at) * 1000)
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            self.counters["expired_in_queue"] += 1
+            self._release()
+            raise asyncio.TimeoutError()
+
+        try:
+            try:
+                fut = self._submit(kind, kwargs)
+            except BrokenProcessPool:
+                self._fallback_to_threads()
+                fut = self._submit(kind, kwargs)
+        except BaseException:
+            # 제출 전에 어떤 이유로든(취소 포함) 빠져나가면 슬롯을 바로 돌려줍니다.
+            self._release()
+            raise
+
+        try:
+            data = await asyncio.wait_for(asyncio.shield(fut), timeout=remaining)
+        except asyncio.TimeoutError:
+            # 실행 중인 렌더는 멈출 수 없으므로 끝날 때 슬롯을 돌려받습니다.
+            self.counters["timed_out"] += 1
+            fut.add_done_callback(self._release)
+            raise
+        except asyncio.CancelledError:
+            # 호출부가 취소돼도 렌더는 계속 돌므로 타임아웃과 같이 끝날 때 슬롯을 돌려받습니다.
+            self.counters["cancelled"] += 1
+            fut.add_done_callback(self._release)
+            raise
+        except BrokenProcessPool:
+            self.counters["failed"] += 1
+            self._release()
+            self._fallback_to_threads()
+            raise
+        except Exception:
+            self.counters["failed"] += 1
+            self._release()
+            raise
+
+        self._release()
+        self.counters["completed"] += 1
+        self._latency_ms.append((loop.time() - queued_at) * 1000)
+        encode = self._encode_stats[f"{kind}:{data.profile}"]
+        encode["count"] += 1
+        encode["cpu_ms"] += data.cpu_ms
+        encode["bytes"] += len(data.data)
+        return data
+
+    def _fallback_to_threads(self):
+        # 운영 중에는 스레드가 많아 다시 fork 하는 것이 안전하지 않으므로 스레드 실행으로 내려갑니다.
+        logging.warning("[render] process pool broken; falling back to threads")
+        self.counters["pool_broken"] += 1
+        executor, self._executor = self._executor, None
+        self.backend = "thread"
+        if executor is not None:
+            try:
+                executor.shutdown(wait=False, cancel_futures=True)
+            except Exception:
+                pass
+
+    def stats(self) -> dict:
+        return {
+            "backend": "process" if self._executor is not None else "thread",
+            "workers": self.workers,
+            "queue_max": self.queue_max,
+            "waiting": self._waiting,
+            "running": self._running,
+            "latency_ms_p95": percentile(self._latency_ms, 0.95),
+            "wait_ms_p95": percentile(self._wait_ms, 0.95),
+            "encode": {
+                name: {
+                    "count": v["count"],
+                    "cpu_ms_avg": round(v["cpu_ms"] / v["count"], 2),
+                    "bytes_avg": int(v["bytes"] / v["count"]),
+                }
+                for name, v in self._encode_stats.items() if v["count"]
+            },
+            **self.counters,
+        }
+
+
+render_service = RenderService(RENDER_BACKEND, RENDER_WORKERS, RENDER_QUEUE_MAX)
+
+
+# =========================
+# Attachment URL reuse
+# =========================
+
+ATTACHMENT_URL_CACHE_MAX = int(os.getenv("ATTACHMENT_URL_CACHE_MAX", "1024"))
+ATTACHMENT_URL_MIN_REMAINING = 600  # 만료까지 이보다 적게 남은 URL은 쓰지 않습니다(초).
+
+
+class AttachmentUrlCache:
+    """
+    같은 바이트의 이미지를 다시 업로드하지 않도록 내용 해시 -> 첨부 URL을 기억합니다.
+    디스코드 CDN 첨부 URL은 `ex`(만료 시각, 16진수 유닉스초) 쿼리를 가지므로 그 값으로 유효성을 판단합니다.
+    원본 메시지가 지워지면 URL도 더 이상 열리지 않으므로 삭제 이벤트에서 해당 항목을 버립니다.
+    """
+
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self._items: OrderedDict[str, str] = OrderedDict()
+        self._source_ids: dict[str, int] = {}   # digest -> 업로드한 메시지 ID
+        self._by_message: dict[int, str] = {}   # 메시지 ID -> digest
+        self.hits = 0
+        self.uploads = 0
+        self.expired = 0
+        self.reuse_failed = 0
+        self.source_deleted = 0
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def _expires_at(url: str) -> Optional[int]:
+        try:
+            ex = parse_qs(urlparse(url).query).get("ex")
+            return int(ex[0], 16) if ex else None
+        except Exception:
+            return None
+
+    def lookup(self, digest: str) -> Optional[str]:
+        url = self._items.get(digest)
+        if url is None:
+            return None
+        expires_at = self._expires_at(url)
+        if expires_at is None or expires_at - time.time() < ATTACHMENT_URL_MIN_REMAINING:
+            self._drop(digest)
+            self.expired += 1
+            return None
+        self._items.move_to_end(digest)
+        return url
+
+    def _drop(self, digest: str):
+        self._items.pop(digest, None)
+        message_id = self._source_ids.pop(digest, None)
+        if message_id is not None:
+            self._by_message.pop(message_id, None)
+
+    def remember(self, digest: str, message):
+        attachments = getattr(message, "attachments", None) or []
+        if not attachments:
+            return
+        self._drop(digest)
+        self._items[digest] = attachments[0].url
+        message_id = getattr(message, "id", None)
+        if message_id is not None:
+            self._source_ids[digest] = message_id
+            self._by_message[message_id] = digest
+        while len(self._items) > self.max_items:
+            self._drop(next(iter(self._items)))
+
+    def forget_message(self, message_id: int):
+        """업로드 원본 메시지가 삭제됐을 때 그 URL을 더 쓰지 않도록 지웁니다."""
+        digest = self._by_message.get(int(message_id))
+        if digest is not None:
+            self._drop(digest)
+            self.source_deleted += 1
+
+    async def send(self, send, data: bytes, filename: str, **kwargs):
+        """
+        이전에 올린 같은 이미지가 있으면 그 URL을 가리키는 임베드로 보내고, 없거나 만료됐으면 새로 업로드합니다.
+        `send`는 file= 또는 embed= 를 받아 Message를 돌려주는 코루틴 함수여야 합니다.
+        """
+        digest = self.digest(data)
+        url = self.lookup(digest)
+        if url:
+            try:
+                message = await send(embed=discord.Embed().set_image(url=url), **kwargs)
+                self.hits += 1
+                return message
+            except discord.HTTPException as e:
+                logging.warning(f"[attachment-cache] reuse failed, uploading again: {e!r}")
+                self._drop(digest)
+                self.reuse_failed += 1
+
+        message = await send(file=discord.File(fp=BytesIO(data), filename=filename), **kwargs)
+        self.uploads += 1
+        self.remember(digest, message)
+        return message
+
+    def stats(self) -> dict:
+        return {
+            "items": len(self._items),
+            "hits": self.hits,
+            "uploads": self.uploads,
+            "expired": self.expired,
+            "reuse_failed": self.reuse_failed,
+            "source_deleted": self.source_deleted,
+        }
+
+
+attachment_url_cache = AttachmentUrlCache(ATTACHMENT_URL_CACHE_MAX)
+
+
+@bot.event
+async def on_raw_message_delete(payload: discord.RawMessageDeleteEvent):
+    attachment_url_cache.forget_message(payload.message_id)
+
+
+@bot.event
+async def on_raw_bulk_message_delete(payload: discord.RawBulkMessageDeleteEvent):
+    for message_id in payload.message_ids:
+        attachment_url_cache.forget_message(message_id)
+
+
 # ---- 기타 슬래시 커맨드 핸들러 (/정보, /퀘스트, /랭킹, /출석, /출석랭킹) ----
                                             
 @app_commands.guild_only()
@@ -2692,8 +4911,17 @@ async def info(interaction: discord.Interaction):
             )
             return
 
-        logging.info("[/정보] load user exp")
-        exp_data = await aget_user_exp(uid)
+        logging.info("[/정보] load user exp + fetch avatar")
+        gathered = await gather_with_deadline(
+            {
+                "exp": aget_user_exp(uid),
+                "avatar": avatar_cache.get(user),
+            },
+            fallbacks={"avatar": (None, None)},
+            label="/정보",
+        )
+        exp_data = gathered["exp"]
+        avatar_key, avatar_bytes = gathered["avatar"]
 
         total_xp = int(exp_data.get("exp", 0))
         level, cur_xp, need_xp, pct = get_level_progress(total_xp)
@@ -2701,37 +4929,48 @@ async def info(interaction: discord.Interaction):
         if exp_data.get("level") != level:
             await aupdate_user_exp_fields(uid, {"level": level})
 
-        logging.info("[/정보] fetch avatar")
-        avatar_bytes = None
-        try:
-            avatar_url = user.display_avatar.replace(size=256).url
-            timeout = aiohttp.ClientTimeout(total=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(avatar_url, headers={"User-Agent": "Mozilla/5.0"}) as resp:
-                    logging.info(f"[/정보] avatar resp={resp.status}")
-                    if resp.status == 200:
-                        avatar_bytes = await resp.read()
-        except Exception:
-            logging.exception("[/정보] avatar fetch failed")
-            avatar_bytes = None
-
-        logging.info("[/정보] render image")
-        buf = await asyncio.wait_for(
-            asyncio.to_thread(
-                render_rank_card,
-                display_name=strip_title_suffix(user.display_name),
-                level=level,
-                total_xp=total_xp,
-                cur_xp=cur_xp,
-                need_xp=need_xp,
-                pct=pct,
-                avatar_bytes=avatar_bytes,
-            ),
-            timeout=8,
-        )
+        display_name = strip_title_suffix(user.display_name)
+        card_key = rank_card_cache_key(uid, level, total_xp, display_name, avatar_key if avatar_bytes else None)
+        card = rank_card_cache_get(card_key)
+        if card is not None:
+            logging.info("[/정보] render cache hit")
+        else:
+            logging.info("[/정보] render image")
+            render_started = time.perf_counter()
+            try:
+                card = await render_service.render(
+                    "rank_card",
+                    timeout=8,
+                    display_name=display_name,
+                    level=level,
+                    total_xp=total_xp,
+                    cur_xp=cur_xp,
+                    need_xp=need_xp,
+                    pct=pct,
+                    avatar_bytes=avatar_bytes,
+                    avatar_key=avatar_key if avatar_bytes else None,
+                )
+            except (RenderQueueFull, asyncio.TimeoutError) as e:
+                logging.warning(f"[/정보] render shed: {type(e).__name__}")
+                await interaction.followup.send(
+                    f"**{display_name}** 님 · Lv. {level} · XP {total_xp:,}\n"
+                    f"다음 레벨까지 {cur_xp:,} / {need_xp:,} ({int(round(pct * 100))}%)\n"
+                    "-# 이미지 카드가 밀려 있어 텍스트로 안내합니다."
+                )
+                return
+            render_ms = (time.perf_counter() - render_started) * 1000
+            rank_card_cache_put(card_key, card, render_ms)
+            logging.info(
+                f"[/정보] rendered in {render_ms:.1f}ms "
+                f"({card.profile}, {len(card.data)} bytes, encode {card.cpu_ms:.1f}ms)"
+            )
 
         logging.info("[/정보] send file")
-        await interaction.followup.send(file=discord.File(fp=buf, filename="rank.png"))
+        await attachment_url_cache.send(
+            functools.partial(interaction.followup.send, wait=True),
+            card.data,
+            f"rank.{card.ext}",
+        )
         logging.info("[/정보] done")
 
     except asyncio.TimeoutError:
@@ -2754,7 +4993,15 @@ async def quest(interaction: discord.Interaction):
     await interaction.response.defer()
     uid = str(interaction.user.id)
     today = datetime.now(KST).strftime("%Y-%m-%d")
-    um = await aget_user_mission(uid, today)
+    gathered = await gather_with_deadline(
+        {
+            "mission": aget_user_mission(uid, today),
+            "attendance": aget_attendance_user(uid),
+        },
+        fallbacks={"attendance": None},
+        label="/퀘스트",
+    )
+    um = gathered["mission"]
     if not isinstance(um, dict) or um.get("date") != today:
         um = {
             "date": today,
@@ -2777,95 +5024,587 @@ async def quest(interaction: discord.Interaction):
         f"보상 횟수: {vc_minutes // REPEAT_VC_REQUIRED_MINUTES}회 지급"
     )
 
-    attendance = await aget_attendance_user(uid)
-    attended = isinstance(attendance, dict) and attendance.get("last_date") == today
-    attendance_status = f"상태: {'✅ 출석 완료' if attended else '❌ 출석 안됨'}"
+    attendance = gathered["attendance"]
+    if attendance is None:
+        attendance_status = "상태: ⚠️ 지금은 확인할 수 없습니다"
+    else:
+        attended = isinstance(attendance, dict) and attendance.get("last_date") == today
+        attendance_status = f"상태: {'✅ 출석 완료' if attended else '❌ 출석 안됨'}"
+
+    embed = discord.Embed(title="📜 퀘스트 현황", color=discord.Color.green())
+    embed.add_field(name="🗨️ 텍스트 미션", value=text_status, inline=False)
+    embed.add_field(name="📞 5인 이상 통화방 참여 미션", value=vc_status, inline=False)
+    embed.add_field(name="🗓️ 출석", value=attendance_status, inline=False)
+    await interaction.followup.send(embed=embed)
+
+
+RANKING_PAGE_SIZE = 10
+
+
+def _exp_rank_line(rank: int, name: str, key: tuple) -> str:
+    exp = -key[0]
+    return f"{rank}위. {strip_title_suffix(name)} - Lv. {calculate_level(exp)} ({exp:,} XP)"
+
+
+def _attendance_rank_line(rank: int, name: str, key: tuple) -> str:
+    return f"{rank}위. {strip_title_suffix(name)} - 누적 {-key[0]}일 / 연속 {-key[1]}일"
+
+
+class RankingPageView(discord.ui.View):
+    """
+    순위 색인에서 바로 페이지를 잘라 보여주는 랭킹 넘기기 메뉴입니다. 페이지 넘김에 DB 읽기는 없습니다.
+    현재 페이지의 첫/마지막 항목을 커서로 들고 있어 그 사이 순위가 바뀌어도 이어서 넘어갑니다.
+    """
+
+    def __init__(self, owner_id: int, guild: discord.Guild, registry: Optional[RankIndexRegistry],
+                 index: GuildRankIndex, embed: discord.Embed, format_line,
+                 empty_text: str = "랭킹 데이터가 없습니다."):
+        super().__init__(timeout=120)
+        self.owner_id = owner_id
+        self.guild = guild
+        self.registry = registry
+        self.index = index
+        self.embed = embed
+        self.format_line = format_line
+        self.empty_text = empty_text
+        self.message: discord.Message | None = None
+        self.first_key: Optional[tuple] = None
+        self.last_key: Optional[tuple] = None
+
+    def _current_index(self) -> GuildRankIndex:
+        # 미러 전체 교체로 색인이 다시 만들어졌으면 새 색인을 따라갑니다.
+        if self.registry is None:
+            return self.index
+        return self.registry.peek(self.guild.id) or self.index
+
+    async def render_page(self, page) -> discord.Embed:
+        index = self._current_index()
+        start_rank, keys = page(index)
+        members = await member_resolver.resolve(self.guild, [key[-1] for key in keys])
+        if any(members.get(key[-1]) is None and key[-1] not in index.members for key in keys):
+            # 떠난 유저가 색인에서 빠졌으니 같은 위치에서 한 번 더 자릅니다.
+            start_rank, keys = page(index)
+            members = await member_resolver.resolve(self.guild, [key[-1] for key in keys])
+
+        lines = []
+        for rank, key in enumerate(keys, start=start_rank):
+            member = members.get(key[-1])
+            line = self.format_line(rank, member.display_name if member else "Unknown", key[:-1])
+            lines.append(f"**{line}**" if key[-1] == self.owner_id else line)
+
+        if keys:
+            self.first_key, self.last_key = keys[0], keys[-1]
+        self.embed.description = "\n".join(lines) if lines else self.empty_text
+        total = len(index)
+        end_rank = start_rank + len(keys) - 1
+        self.embed.set_footer(text=f"{start_rank}~{end_rank}위 / 전체 {total}명" if keys else f"전체 {total}명")
+        self.prev_page.disabled = self.first_page.disabled = start_rank <= 1
+        self.next_page.disabled = end_rank >= total
+        return self.embed
+
+    async def _turn(self, interaction: discord.Interaction, page):
+        embed = await self.render_page(page)
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message("이 메뉴는 명령어를 실행한 본인만 사용할 수 있습니다.", ephemeral=True)
+            return False
+        return True
+
+    @discord.ui.button(label="처음", emoji="⏮️", style=discord.ButtonStyle.secondary)
+    async def first_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._turn(interaction, lambda index: index.page_after(None, RANKING_PAGE_SIZE))
+
+    @discord.ui.button(label="이전", emoji="◀️", style=discord.ButtonStyle.secondary)
+    async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        cursor = self.first_key
+        await self._turn(interaction, lambda index: index.page_before(cursor, RANKING_PAGE_SIZE))
+
+    @discord.ui.button(label="내 주변", emoji="📍", style=discord.ButtonStyle.primary)
+    async def around_me(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self._current_index().rank_of(self.owner_id) is None:
+            return await interaction.response.send_message("아직 랭킹에 기록이 없습니다.", ephemeral=True)
+        await self._turn(
+            interaction,
+            lambda index: index.page_around(self.owner_id, RANKING_PAGE_SIZE) or index.page_after(None, RANKING_PAGE_SIZE),
+        )
+
+    @discord.ui.button(label="다음", emoji="▶️", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        cursor = self.last_key
+        await self._turn(interaction, lambda index: index.page_after(cursor, RANKING_PAGE_SIZE))
+
+    async def on_timeout(self):
+        try:
+            for item in self.children:
+                item.disabled = True
+            if self.message:
+                await self.message.edit(view=self)
+        except Exception:
+            pass
+
+
+async def send_ranking_page(interaction: discord.Interaction, registry: RankIndexRegistry,
+                            embed: discord.Embed, format_line, my_rank: Optional[str],
+                            empty_text: str = "랭킹 데이터가 없습니다."):
+    """색인이 준비된 경우의 랭킹 응답. 첫 페이지와 넘기기 버튼을 함께 보냅니다."""
+    index = await registry.aget(interaction.guild)
+    view = RankingPageView(interaction.user.id, interaction.guild, registry, index, embed, format_line, empty_text)
+    await view.render_page(lambda idx: idx.page_after(None, RANKING_PAGE_SIZE))
+    if my_rank:
+        embed.add_field(name="📍 내 순위", value=my_rank, inline=False)
+    view.message = await interaction.followup.send(embed=embed, view=view, wait=True)
+
+
+@app_commands.guild_only()
+@bot.tree.command(name="랭킹", description="경험치 랭킹을 확인합니다.")
+async def ranking(interaction: discord.Interaction):
+    await interaction.response.defer()
+    state = await aget_effective_season_state()
+    if not state.get("first_season_started"):
+        return await interaction.followup.send(
+            "현재 시즌패스 준비 중입니다. 첫 시즌 시작 후 랭킹이 공개됩니다."
+        )
+
+    guild = interaction.guild
+    snapshot = None
+    if not leaderboard_index.is_warm(guild.id):
+        # 색인이 아직 없으면 저장된 스냅샷으로 먼저 답하고, 색인은 뒤에서 만듭니다.
+        try:
+            snapshot = (await aget_leaderboard_snapshot(guild.id, leaderboard_season_id(state))).get("exp")
+        except Exception as e:
+            logging.warning(f"[ranking] snapshot read failed: {e!r}")
+        if snapshot:
+            leaderboard_index.warm_in_background(guild)
+
+    if snapshot:
+        mine = snapshot_rank_of(snapshot, interaction.user.id)
+    else:
+        mine = (await leaderboard_index.aget(guild)).rank_of(interaction.user.id)
+
+    my_rank = None
+    if mine is not None:
+        rank, (neg_exp,) = mine
+        my_exp = -neg_exp
+        my_rank = (
+            f"당신의 순위: {rank}위 - 시즌패스 "
+            f"Lv. {calculate_level(my_exp)} ({my_exp:,} XP)"
+        )
+    elif snapshot:
+        my_exp = _safe_int((await aget_user_exp(str(interaction.user.id))).get("exp", 0), 0)
+        approx = approx_rank_from_histogram(snapshot, "exp", [my_exp])
+        if my_exp > 0 and approx:
+            my_rank = (
+                f"당신의 순위: 약 {approx[0]}~{approx[1]}위 - 시즌패스 "
+                f"Lv. {calculate_level(my_exp)} ({my_exp:,} XP)"
+            )
+
+    embed = discord.Embed(
+        title=f"🏆 시즌패스 랭킹 - {state.get('current_season_name', CURRENT_SEASON_NAME)}",
+        color=discord.Color.gold(),
+    )
+    if not snapshot:
+        return await send_ranking_page(interaction, leaderboard_index, embed, _exp_rank_line, my_rank)
+
+    top_rows = snapshot_rows(snapshot, RANKING_PAGE_SIZE)
+    members = await member_resolver.resolve(guild, [uid for uid, _ in top_rows])
+    desc_lines = [
+        _exp_rank_line(rank, members[uid].display_name if members.get(uid) else "Unknown", key)
+        for rank, (uid, key) in enumerate(top_rows, start=1)
+    ]
+    embed.description = "\n".join(desc_lines) if desc_lines else "랭킹 데이터가 없습니다."
+    if my_rank:
+        embed.add_field(name="📍 내 순위", value=my_rank, inline=False)
+    await interaction.followup.send(embed=embed)
+
+# =========================
+# Past season leaderboards
+# =========================
+# season_records/{season_id} 는 정산 때 한 번 쓰이고 바뀌지 않으므로,
+# 처음 조회할 때 정렬된 순위 목록을 만들어 메모리와 로컬 디스크에 둡니다.
+
+SEASON_ARCHIVE_DIR = os.path.join("data", "season_records")
+_SEASON_ID_RE = re.compile(r"^\d{4}_(spring|summer|fall|winter)$")
+_SEASON_ARCHIVE_INDEX: dict[str, GuildRankIndex] = {}
+_SEASON_ARCHIVE_LOCKS: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+def _prev_season_id_before(season_id: str) -> Optional[str]:
+    if not _SEASON_ID_RE.match(str(season_id or "")):
+        return None
+    year_str, season_type = season_id.split("_", 1)
+    idx = SEASON_TYPE_ORDER.index(season_type)
+    if idx == 0:
+        return f"{int(year_str) - 1}_{SEASON_TYPE_ORDER[-1]}"
+    return f"{year_str}_{SEASON_TYPE_ORDER[idx - 1]}"
+
+
+def season_id_label(season_id: str) -> str:
+    year_str, _, season_type = str(season_id).partition("_")
+    return f"{year_str} {SEASON_TYPE_LABELS.get(season_type, season_type)}".strip()
+
+
+def _season_archive_path(season_id: str) -> str:
+    return os.path.join(SEASON_ARCHIVE_DIR, f"{season_id}.json")
+
+
+def _build_season_archive_rows(records: dict) -> list[list]:
+    """[[uid, final_exp], ...] 를 순위 순으로 만듭니다."""
+    rows = []
+    for uid, record in (records or {}).items():
+        if not isinstance(record, dict) or not str(uid).isdigit():
+            continue
+        rows.append([str(uid), max(0, _safe_int(record.get("final_exp", 0), 0))])
+    rows.sort(key=lambda row: (-row[1], int(row[0])))
+    return rows
+
+
+def _load_season_archive_rows_sync(season_id: str) -> Optional[list]:
+    path = _season_archive_path(season_id)
+    try:
+        cached = load_json(path)
+    except Exception as e:
+        logging.warning(f"[season-archive] local cache unreadable season={season_id}: {e!r}")
+        cached = {}
+    if isinstance(cached, dict) and isinstance(cached.get("rows"), list):
+        return cached["rows"]
+
+    records = _season_records_ref(season_id).get() or {}
+    if not isinstance(records, dict) or not records:
+        # 아직 정산되지 않은 시즌은 캐시하지 않습니다.
+        return None
+    rows = _build_season_archive_rows(records)
+    try:
+        os.makedirs(SEASON_ARCHIVE_DIR, exist_ok=True)
+        save_json(path, {"season_id": season_id, "built_at": int(time.time()), "rows": rows})
+    except Exception as e:
+        logging.warning(f"[season-archive] local cache write failed season={season_id}: {e!r}")
+    return rows
+
+
+async def aget_season_archive_index(season_id: str) -> Optional[GuildRankIndex]:
+    index = _SEASON_ARCHIVE_INDEX.get(season_id)
+    if index is not None:
+        return index
+    async with _SEASON_ARCHIVE_LOCKS[season_id]:
+        index = _SEASON_ARCHIVE_INDEX.get(season_id)
+        if index is not None:
+            return index
+        rows = await asyncio.to_thread(_load_season_archive_rows_sync, season_id)
+        if rows is None:
+            return None
+        index = GuildRankIndex(0)
+        index.bulk_load(
+            (int(row[0]), (-_safe_int(row[1], 0),))
+            for row in rows
+            if isinstance(row, list) and len(row) >= 2 and str(row[0]).isdigit()
+        )
+        _SEASON_ARCHIVE_INDEX[season_id] = index
+        logging.info(f"[season-archive] indexed season={season_id} users={len(index)}")
+        return index
+
+
+def invalidate_season_archive(season_id: str):
+    """정산 기록을 다시 쓰는 경우(재정산 등)에만 호출됩니다."""
+    _SEASON_ARCHIVE_INDEX.pop(season_id, None)
+    if _SEASON_ID_RE.match(str(season_id)):
+        try:
+            os.remove(_season_archive_path(season_id))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning(f"[season-archive] local cache remove failed season={season_id}: {e!r}")
+
+
+def latest_archived_season_id(state: dict) -> Optional[str]:
+    current = state.get("current_season_id")
+    if not state.get("first_season_started") or not current:
+        return None
+    return current if state.get("settled") else _prev_season_id_before(current)
 
-    embed = discord.Embed(title="📜 퀘스트 현황", color=discord.Color.green())
-    embed.add_field(name="🗨️ 텍스트 미션", value=text_status, inline=False)
-    embed.add_field(name="📞 5인 이상 통화방 참여 미션", value=vc_status, inline=False)
-    embed.add_field(name="🗓️ 출석", value=attendance_status, inline=False)
-    await interaction.followup.send(embed=embed)
 
 @app_commands.guild_only()
-@bot.tree.command(name="랭킹", description="경험치 랭킹을 확인합니다.")
-async def ranking(interaction: discord.Interaction):
+@bot.tree.command(name="지난시즌랭킹", description="정산이 끝난 지난 시즌의 최종 랭킹을 확인합니다.")
+@app_commands.describe(시즌="시즌 ID (예: 2025_spring). 비우면 가장 최근에 정산된 시즌")
+async def past_season_ranking(interaction: discord.Interaction, 시즌: str = ""):
     await interaction.response.defer()
-    state = await aget_effective_season_state()
-    if not state.get("first_season_started"):
-        return await interaction.followup.send(
-            "현재 시즌패스 준비 중입니다. 첫 시즌 시작 후 랭킹이 공개됩니다."
-        )
-
-    data = await aload_exp_data()
-    if not isinstance(data, dict):
-        data = {}
-
-    current_member_ids = {
-        str(member.id) for member in interaction.guild.members if not member.bot
-    }
-    normalized = [
-        (str(uid), user_data)
-        for uid, user_data in data.items()
-        if str(uid) in current_member_ids and isinstance(user_data, dict)
-    ]
-    sorted_users = sorted(
-        normalized,
-        key=lambda item: _safe_int(item[1].get("exp", 0), 0),
-        reverse=True,
-    )
+    season_id = (시즌 or "").strip().lower()
+    if not season_id:
+        season_id = latest_archived_season_id(await aget_effective_season_state()) or ""
+    if not _SEASON_ID_RE.match(season_id):
+        return await interaction.followup.send("❌ 시즌 ID 형식이 올바르지 않습니다. 예: `2025_spring`")
 
-    desc_lines = []
-    for idx, (uid, user_data) in enumerate(sorted_users[:10], start=1):
-        member = interaction.guild.get_member(int(uid)) if uid.isdigit() else None
-        if member is None and uid.isdigit():
-            try:
-                member = await interaction.guild.fetch_member(int(uid))
-            except Exception:
-                member = None
-        name = member.display_name if member else "Unknown"
-        exp = max(0, _safe_int(user_data.get("exp", 0), 0))
-        desc_lines.append(
-            f"{idx}위. {strip_title_suffix(name)} - Lv. {calculate_level(exp)} ({exp:,} XP)"
-        )
+    index = await aget_season_archive_index(season_id)
+    if index is None:
+        return await interaction.followup.send(f"`{season_id}` 시즌의 정산 기록이 없습니다.")
 
     my_rank = None
-    me = str(interaction.user.id)
-    for idx, (uid, user_data) in enumerate(sorted_users, start=1):
-        if uid == me:
-            my_exp = max(0, _safe_int(user_data.get("exp", 0), 0))
-            my_rank = (
-                f"당신의 순위: {idx}위 - 시즌패스 "
-                f"Lv. {calculate_level(my_exp)} ({my_exp:,} XP)"
-            )
-            break
+    mine = index.rank_of(interaction.user.id)
+    if mine is not None:
+        rank, (neg_exp,) = mine
+        my_rank = f"당신의 최종 순위: {rank}위 - Lv. {calculate_level(-neg_exp)} ({-neg_exp:,} XP)"
 
     embed = discord.Embed(
-        title=f"🏆 시즌패스 랭킹 - {state.get('current_season_name', CURRENT_SEASON_NAME)}",
-        description="\n".join(desc_lines) if desc_lines else "랭킹 데이터가 없습니다.",
-        color=discord.Color.gold(),
+        title=f"📚 지난 시즌 랭킹 - {season_id_label(season_id)}",
+        color=discord.Color.dark_gold(),
     )
+    view = RankingPageView(interaction.user.id, interaction.guild, None, index, embed, _exp_rank_line)
+    await view.render_page(lambda idx: idx.page_after(None, RANKING_PAGE_SIZE))
     if my_rank:
         embed.add_field(name="📍 내 순위", value=my_rank, inline=False)
-    await interaction.followup.send(embed=embed)
+    view.message = await interaction.followup.send(embed=embed, view=view, wait=True)
+
+
+# =========================
+# Midnight attendance surge
+# =========================
+# 자정 직후에는 /출석이 몇 초 안에 몰립니다. 자정 전후 구간(미드나이트 모드)에는
+# - 23:57 에 최근 활동한 유저의 출석 레코드와 칭호 캐시를 미리 채워 두고 그 유저들의 읽기를 메모리에서 처리하며,
+# - 출석 저장을 짧은 간격으로 모아 한 번의 다중 경로 update 로 씁니다.
+# 구간이 끝나면 /출석 지연 시간 분포(p50/p95/p99)를 기록합니다.
+
+MIDNIGHT_SURGE_BEFORE_SECONDS = int(os.getenv("MIDNIGHT_SURGE_BEFORE_SECONDS", "180"))
+MIDNIGHT_SURGE_AFTER_SECONDS = int(os.getenv("MIDNIGHT_SURGE_AFTER_SECONDS", "300"))
+ATTENDANCE_BATCH_WINDOW_MS = int(os.getenv("ATTENDANCE_BATCH_WINDOW_MS", "250"))
+ATTENDANCE_BATCH_MAX = int(os.getenv("ATTENDANCE_BATCH_MAX", "200"))  # 한 번의 update 에 담을 출석 건수 상한
+MIDNIGHT_ACTIVE_WINDOW_HOURS = 72  # 미리 채울 '최근 활동' 기준
+MIDNIGHT_PREWARM_CONCURRENCY = 8
+_SURGE_LATENCY_MAX_SAMPLES = 5000
+
+
+class AttendanceSurge:
+    def __init__(self):
+        self._pending: list[tuple[dict, asyncio.Future]] = []
+        self._flusher: asyncio.Task | None = None
+        self.recent_active: set[str] = set()
+        # 출석 미러가 로드되지 않은 경우에만 쓰는 최근 활동 유저의 출석 레코드. 쓰기가 생기면 해당 유저를 버립니다.
+        self._attendance: dict[str, dict] = {}
+        # 미리 채우는 동안 쓰기가 생긴 uid. 진행 중이던 읽기가 쓰기 이전 레코드를 저장하지 않도록 결과를 버립니다.
+        self._touched: set[str] = set()
+        self._touched_all = False
+        self.prewarmed_at = 0.0
+        self.latencies_ms: list[float] = []
+        self.batches = 0
+        self.batched_claims = 0
+        self.max_batch = 0
+        self.batch_fallbacks = 0
+        self.mirror_reads = 0
+        self.last_report: dict = {}
+        attendance_mirror.watch(self._on_attendance_write)
+
+    def _on_attendance_write(self, uid: Optional[str]):
+        if uid is None:
+            self._touched_all = True
+            self._attendance.clear()
+        else:
+            self._touched.add(uid)
+            self._attendance.pop(uid, None)
+
+    @staticmethod
+    def active(now: datetime | None = None) -> bool:
+        now = now or datetime.now(KST)
+        sec = now.hour * 3600 + now.minute * 60 + now.second
+        return sec >= 86400 - MIDNIGHT_SURGE_BEFORE_SECONDS or sec < MIDNIGHT_SURGE_AFTER_SECONDS
+
+    async def prewarm(self):
+        """
+        자정 몇 분 전에 최근 활동 유저의 출석 레코드와 칭호 캐시를 채워, 몰리는 동안 그 유저들의 읽기가 없게 합니다.
+        최근 활동 유저는 last_activity 색인(exp 미러)에서 고르고, 출석 전체를 읽지 않도록 해당 유저만 가져옵니다.
+        """
+        await last_activity_index.ensure_loaded()
+        cutoff = time.time() - MIDNIGHT_ACTIVE_WINDOW_HOURS * 3600
+        self.recent_active = set(last_activity_index.newer_than(cutoff))
+
+        self._attendance.clear()
+        self._touched.clear()
+        self._touched_all = False
+        if not attendance_mirror.loaded:
+            sem = asyncio.Semaphore(MIDNIGHT_PREWARM_CONCURRENCY)
+
+            async def _fetch(uid: str):
+                async with sem:
+                    if self._touched_all or uid in self._touched:
+                        return
+                    try:
+                        record = await aget_attendance_user(uid)
+                    except Exception as e:
+                        logging.warning(f"[attendance-surge] prewarm read failed uid={uid}: {e!r}")
+                        return
+                    # 읽는 도중 /출석 등으로 쓰기가 있었다면 쓰기 이전 값일 수 있으므로 버리고 DB 읽기에 맡깁니다.
+                    if self._touched_all or uid in self._touched:
+                        return
+                    self._attendance[uid] = record
+
+            await asyncio.gather(*(_fetch(uid) for uid in self.recent_active))
+        try:
+            await aprime_user_titles_cache()
+        except Exception as e:
+            logging.warning(f"[attendance-surge] user title prime failed: {e!r}")
+        self.prewarmed_at = time.time()
+        logging.info(
+            f"[attendance-surge] prewarmed recent_active={len(self.recent_active)} "
+            f"attendance_records={len(self._attendance) if not attendance_mirror.loaded else 'mirror'}"
+        )
+
+    def read(self, uid: str) -> Optional[dict]:
+        """미리 채운 최근 활동 유저면 /출석에 필요한 두 레코드를 DB 읽기 없이 돌려줍니다. 아니면 None."""
+        if uid not in self.recent_active or not exp_mirror.loaded:
+            return None
+        if attendance_mirror.loaded:
+            attendance = attendance_mirror.get(uid) or {}
+        elif uid in self._attendance:
+            attendance = self._attendance[uid]
+        else:
+            return None
+        self.mirror_reads += 1
+        return {
+            "attendance": copy.deepcopy(attendance),
+            "exp": normalize_user_exp(copy.deepcopy(exp_mirror.get(uid))),
+        }
+
+    async def commit(self, updates: dict):
+        """다음 배치 저장이 끝날 때까지 기다립니다. 실패하면 호출부로 예외가 전달됩니다."""
+        fut = asyncio.get_running_loop().create_future()
+        self._pending.append((updates, fut))
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop(), name="attendance-surge-flush")
+        await fut
+
+    async def _flush_loop(self):
+        while self._pending:
+            await asyncio.sleep(ATTENDANCE_BATCH_WINDOW_MS / 1000)
+            batch = self._pending[:ATTENDANCE_BATCH_MAX]
+            del self._pending[:len(batch)]
+            merged: dict = {}
+            for updates, _ in batch:
+                merged.update(updates)
+            try:
+                await afirebase_root_update_strict(merged)
+                results = [None] * len(batch)
+            except Exception as e:
+                # 한 건의 잘못된 값이 배치 전체를 막지 않도록 개별 저장으로 다시 시도합니다.
+                logging.warning(f"[attendance-surge] batch write failed size={len(batch)}, retrying singly: {e!r}")
+                self.batch_fallbacks += 1
+                results = []
+                for updates, _ in batch:
+                    try:
+                        await afirebase_root_update_strict(updates)
+                        results.append(None)
+                    except Exception as single_error:
+                        results.append(single_error)
+            for (_, fut), error in zip(batch, results):
+                if fut.done():
+                    continue
+                if error is None:
+                    fut.set_result(None)
+                else:
+                    fut.set_exception(error)
+            self.batches += 1
+            self.batched_claims += len(batch)
+            self.max_batch = max(self.max_batch, len(batch))
+
+    def record_latency(self, seconds: float):
+        if len(self.latencies_ms) < _SURGE_LATENCY_MAX_SAMPLES:
+            self.latencies_ms.append(seconds * 1000)
+
+    def report(self) -> dict:
+        samples, self.latencies_ms = self.latencies_ms, []
+        self.last_report = {
+            "date": datetime.now(KST).strftime("%Y-%m-%d"),
+            "claims": len(samples),
+            "p50_ms": percentile(samples, 0.50),
+            "p95_ms": percentile(samples, 0.95),
+            "p99_ms": percentile(samples, 0.99),
+            "max_ms": round(max(samples), 1) if samples else None,
+            "batches": self.batches,
+            "max_batch": self.max_batch,
+        }
+        logging.info(f"[attendance-surge] report {self.last_report}")
+        return self.last_report
+
+    def stats(self) -> dict:
+        return {
+            "active": self.active(),
+            "prewarmed_at": round(self.prewarmed_at, 3),
+            "recent_active": len(self.recent_active),
+            "pending": len(self._pending),
+            "batches": self.batches,
+            "batched_claims": self.batched_claims,
+            "max_batch": self.max_batch,
+            "batch_fallbacks": self.batch_fallbacks,
+            "mirror_reads": self.mirror_reads,
+            "current_samples": len(self.latencies_ms),
+            "last_report": self.last_report,
+        }
+
+
+attendance_surge = AttendanceSurge()
+
+
+@guard_background_task("attendance_midnight_prewarm")
+async def attendance_midnight_prewarm_task():
+    await attendance_surge.prewarm()
+
+
+@guard_background_task("attendance_surge_report")
+async def attendance_surge_report_task():
+    attendance_surge.report()
+
+
+def _clock_at(seconds: int) -> dtime:
+    seconds %= 86400
+    return dtime(hour=seconds // 3600, minute=seconds % 3600 // 60, second=seconds % 60)
+
+
+background_scheduler.daily(
+    "attendance_midnight_prewarm",
+    attendance_midnight_prewarm_task,
+    at=_clock_at(-MIDNIGHT_SURGE_BEFORE_SECONDS),
+)
+# 구간이 끝나고 1분 뒤에 지연 시간 분포를 정리합니다.
+background_scheduler.daily(
+    "attendance_surge_report",
+    attendance_surge_report_task,
+    at=_clock_at(MIDNIGHT_SURGE_AFTER_SECONDS + 60),
+)
+
 
 @app_commands.guild_only()
 @bot.tree.command(name="출석", description="오늘의 출석을 기록합니다.")
 async def attend(interaction: discord.Interaction):
+    started = time.perf_counter()
+    surge = attendance_surge.active()
+    try:
+        await _attend_claim(interaction, surge)
+    finally:
+        if surge:
+            attendance_surge.record_latency(time.perf_counter() - started)
+
+
+async def _attend_claim(interaction: discord.Interaction, surge: bool):
     await interaction.response.defer()
     uid = str(interaction.user.id)
     now = datetime.now(KST)
     today_str = now.strftime("%Y-%m-%d")
     yesterday = (now - timedelta(days=1)).strftime("%Y-%m-%d")
-    week = get_week_key_kst(now)
-    month = get_month_key_kst(now)
 
     gain = ATTENDANCE_EXP_REWARD if await aseason_xp_enabled() else 0
     level_up = False
     final_level = 1
 
     async with get_user_state_lock(uid):
-        ud = normalize_attendance_record(await aget_attendance_user(uid))
+        gathered = attendance_surge.read(uid) if surge else None
+        if gathered is None:
+            # 출석과 EXP 레코드는 서로 독립이므로 함께 읽습니다. 둘 다 필수라 대체값은 두지 않습니다.
+            gathered = await gather_with_deadline(
+                {
+                    "attendance": aget_attendance_user(uid),
+                    "exp": aget_user_exp(uid),
+                },
+                label="/출석",
+            )
+        ud = normalize_attendance_record(gathered["attendance"])
         prev_last = ud.get("last_date", "")
 
         if prev_last == today_str:
@@ -2893,27 +5632,35 @@ async def attend(interaction: discord.Interaction):
 
         ud["streak"] = new_streak
         ud["last_date"] = today_str
-        ud["total_days"] = _safe_int(ud.get("total_days", 0), 0) + 1
-        ud.setdefault("weekly", {})[week] = _safe_int(ud["weekly"].get(week, 0), 0) + 1
-        ud.setdefault("monthly", {})[month] = _safe_int(ud["monthly"].get(month, 0), 0) + 1
+        attendance_mark_day(ud, now.date())
+        recount_attendance_total(ud)
 
-        ue = await aget_user_exp(uid)
+        ue = gathered["exp"]
         prev_level = calculate_level(ue.get("exp", 0))
         final_level = prev_level
+        # 레코드 전체를 덮어쓰지 않고 바뀐 하위 경로만 씁니다. 다른 곳에서 바꾼 필드를 지우지 않기 위함입니다.
+        att_base = f"{ATTENDANCE_DB_KEY}/{uid}"
         attendance_updates: dict[str, object] = {
-            f"{ATTENDANCE_DB_KEY}/{uid}": ud,
+            f"{att_base}/streak": ud["streak"],
+            f"{att_base}/last_date": ud["last_date"],
+            f"{att_base}/total_days": ud["total_days"],
+            f"{att_base}/base_days": ud["base_days"],
+            f"{att_base}/days": ud["days"],
+            # 비트셋으로 옮긴 예전 맵은 지웁니다(없으면 아무 일도 없음).
+            f"{att_base}/weekly": None,
+            f"{att_base}/monthly": None,
+            f"exp_data/{uid}/last_activity": time.time(),
         }
         if gain > 0:
             ue["exp"] = max(0, _safe_int(ue.get("exp", 0), 0)) + gain
             final_level = calculate_level(ue["exp"])
-            ue["level"] = final_level
-            ue["last_activity"] = time.time()
-            attendance_updates[f"exp_data/{uid}"] = ue
-        else:
-            # 프리시즌에는 EXP 전체 레코드를 덮어쓰지 않고 활동 시각만 갱신합니다.
-            attendance_updates[f"exp_data/{uid}/last_activity"] = time.time()
+            attendance_updates[f"exp_data/{uid}/exp"] = ue["exp"]
+            attendance_updates[f"exp_data/{uid}/level"] = final_level
 
-        await afirebase_root_update_strict(attendance_updates)
+        if surge:
+            await attendance_surge.commit(attendance_updates)
+        else:
+            await afirebase_root_update_strict(attendance_updates)
         level_up = final_level > prev_level
 
     if level_up:
@@ -2942,57 +5689,51 @@ async def attend(interaction: discord.Interaction):
                 streak=new_streak,
             )
         )
-    lines.append(_build_attendance_stats_line(ud["total_days"], ud["streak"], gain))
+    lines.append(_build_attendance_stats_line(
+        ud["total_days"], ud["streak"], gain,
+        week_days=attendance_week_count(ud, now.date()),
+        month_days=attendance_month_count(ud, now.date()),
+    ))
     await interaction.followup.send("\n".join(lines))
 
 @app_commands.guild_only()
 @bot.tree.command(name="출석랭킹", description="출석 랭킹을 확인합니다.")
 async def attend_ranking(interaction: discord.Interaction):
     await interaction.response.defer()
-    data = await aget_attendance_data()
-    if not isinstance(data, dict):
-        data = {}
-    current_member_ids = {
-        str(member.id) for member in interaction.guild.members if not member.bot
-    }
-    ranked = sorted(
-        [
-            (str(uid), ud)
-            for uid, ud in data.items()
-            if str(uid) in current_member_ids and isinstance(ud, dict)
-        ],
-        key=lambda item: (
-            -_safe_int(item[1].get("total_days", 0), 0),
-            -_safe_int(item[1].get("streak", 0), 0),
-        ),
-    )
+    guild = interaction.guild
+    snapshot = None
+    if not attendance_rank_index.is_warm(guild.id):
+        try:
+            state = await aget_effective_season_state()
+            snapshot = (await aget_leaderboard_snapshot(guild.id, leaderboard_season_id(state))).get("attendance")
+        except Exception as e:
+            logging.warning(f"[attend-ranking] snapshot read failed: {e!r}")
+        if snapshot:
+            attendance_rank_index.warm_in_background(guild)
 
-    lines = []
-    for idx, (uid, ud) in enumerate(ranked[:10], start=1):
-        member = interaction.guild.get_member(int(uid)) if uid.isdigit() else None
-        if member is None and uid.isdigit():
-            try:
-                member = await interaction.guild.fetch_member(int(uid))
-            except Exception:
-                member = None
-        name = member.display_name if member else "Unknown"
-        lines.append(
-            f"{idx}위. {strip_title_suffix(name)} - "
-            f"누적 {_safe_int(ud.get('total_days', 0), 0)}일 / "
-            f"연속 {_safe_int(ud.get('streak', 0), 0)}일"
-        )
+    if snapshot:
+        mine = snapshot_rank_of(snapshot, interaction.user.id)
+    else:
+        mine = (await attendance_rank_index.aget(guild)).rank_of(interaction.user.id)
 
     my_rank = None
-    for idx, (uid, _) in enumerate(ranked, start=1):
-        if uid == str(interaction.user.id):
-            my_rank = f"당신의 순위: {idx}위"
-            break
+    if mine is not None:
+        my_rank = f"당신의 순위: {mine[0]}위"
+
+    embed = discord.Embed(title="🏅 출석 랭킹", color=discord.Color.blue())
+    if not snapshot:
+        return await send_ranking_page(
+            interaction, attendance_rank_index, embed, _attendance_rank_line, my_rank,
+            empty_text="출석 데이터가 없습니다.",
+        )
 
-    embed = discord.Embed(
-        title="🏅 출석 랭킹",
-        description="\n".join(lines) if lines else "출석 데이터가 없습니다.",
-        color=discord.Color.blue(),
-    )
+    top_rows = snapshot_rows(snapshot, RANKING_PAGE_SIZE)
+    members = await member_resolver.resolve(guild, [uid for uid, _ in top_rows])
+    lines = [
+        _attendance_rank_line(rank, members[uid].display_name if members.get(uid) else "Unknown", key)
+        for rank, (uid, key) in enumerate(top_rows, start=1)
+    ]
+    embed.description = "\n".join(lines) if lines else "출석 데이터가 없습니다."
     if my_rank:
         embed.add_field(name="📍 내 순위", value=my_rank, inline=False)
     await interaction.followup.send(embed=embed)
@@ -3023,6 +5764,10 @@ async def attendance_edit(
         ud = normalize_attendance_record(await aget_attendance_user(uid))
         ud["total_days"] = max(0, _safe_int(total_days, 0))
         ud["streak"] = max(0, _safe_int(streak, 0))
+        # 날짜 비트는 그대로 두고, 지정한 누적값과의 차이를 base_days 로 맞춥니다.
+        # 누적값을 날짜 비트 수보다 낮게 고치면 base_days 는 음수 보정값이 됩니다. 그래야 지정한 누적값이
+        # 그대로 유지되고, 이후 출석으로 비트가 늘어도 recount_attendance_total 이 같은 차이를 지킵니다.
+        ud["base_days"] = ud["total_days"] - _attendance_bits_popcount(ud.get("days"))
 
         if last_date is not None:
             ld = last_date.strip()
@@ -3058,12 +5803,36 @@ async def attendance_edit(
 # Season Pass Commands
 # =========================
 
+# 시즌 보상은 관리자 명령어로만 바뀌므로 시즌별로 보관하고 쓰기 시점에 갱신합니다.
+_SEASON_REWARD_CACHE: dict[str, dict] = {}
+_SEASON_REWARD_VERSION = 0  # 보상 설정이 바뀔 때마다 올라가며 시즌 정보 뷰 캐시 키에 쓰입니다.
+
+
+def _invalidate_season_reward(season_id: Optional[str] = None):
+    global _SEASON_REWARD_VERSION
+    if season_id is None:
+        _SEASON_REWARD_CACHE.clear()
+    else:
+        _SEASON_REWARD_CACHE.pop(str(season_id), None)
+    _SEASON_REWARD_VERSION += 1
+
+
 async def _get_season_reward(season_id: str) -> dict:
-    return await asyncio.to_thread(lambda: _season_rewards_ref(season_id).get() or {})
+    key = str(season_id)
+    cached = _SEASON_REWARD_CACHE.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+    reward = await asyncio.to_thread(lambda: _season_rewards_ref(season_id).get() or {})
+    if not isinstance(reward, dict):
+        reward = {}
+    _SEASON_REWARD_CACHE[key] = reward
+    return copy.deepcopy(reward)
 
 
 async def _set_season_reward(season_id: str, data: dict):
     await asyncio.to_thread(lambda: _season_rewards_ref(season_id).set(data))
+    _invalidate_season_reward(season_id)
+    _SEASON_REWARD_CACHE[str(season_id)] = copy.deepcopy(data) if isinstance(data, dict) else {}
 
 
 async def _update_season_state(data: dict):
@@ -3071,6 +5840,7 @@ async def _update_season_state(data: dict):
     if not isinstance(data, dict) or not data:
         return
     await asyncio.to_thread(lambda: _season_state_ref().update(data))
+    season_state_cache.apply_patch(data)
 
 
 async def ensure_guild_member_cache_complete(guild: discord.Guild) -> tuple[bool, str]:
@@ -3093,6 +5863,7 @@ async def ensure_guild_member_cache_complete(guild: discord.Guild) -> tuple[bool
         logging.exception("[first-season] guild member chunk failed")
         return False, f"서버원 목록을 불러오지 못했습니다: {type(e).__name__}"
 
+    rebuild_human_member_ids(guild)
     expected = guild.member_count
     cached = len(guild.members)
     if not guild.chunked:
@@ -3139,6 +5910,25 @@ def first_season_preflight_errors(guild: discord.Guild) -> list[str]:
     return errors
 
 
+# 시즌 안내 임베드들이 공유하는 고정 문구입니다. 진행 기준은 상수로만 정해지므로 한 번만 만듭니다.
+SEASON_RULES_TEXT = (
+    f"최대 레벨: Lv.{SEASON_MAX_LEVEL}\n"
+    f"1레벨 필요 경험치: {SEASON_XP_PER_LEVEL:,} XP\n"
+    f"Lv.{SEASON_MAX_LEVEL} 필요 경험치: {SEASON_TOTAL_XP_TO_MAX:,} XP"
+)
+
+
+def season_period_text(cal: dict) -> str:
+    return (
+        f"정규 시즌: {cal['regular_start']} ~ {cal['regular_end']}\n"
+        f"프리시즌: {cal['preseason_start']} ~ {cal['preseason_end']}"
+    )
+
+
+def season_reward_text(reward: dict) -> str:
+    return f"[ {(reward or {}).get('title_name', '아직 설정되지 않음')} ]"
+
+
 def build_standard_season_start_embed(season_name: str, cal: dict, reward: dict) -> discord.Embed:
     embed = discord.Embed(
         title=f"🌿 {season_name} 시즌 시작",
@@ -3149,28 +5939,9 @@ def build_standard_season_start_embed(season_name: str, cal: dict, reward: dict)
         ),
         color=discord.Color.green(),
     )
-    embed.add_field(
-        name="시즌 기간",
-        value=(
-            f"정규 시즌: {cal['regular_start']} ~ {cal['regular_end']}\n"
-            f"프리시즌: {cal['preseason_start']} ~ {cal['preseason_end']}"
-        ),
-        inline=False,
-    )
-    embed.add_field(
-        name="진행 기준",
-        value=(
-            f"최대 레벨: Lv.{SEASON_MAX_LEVEL}\n"
-            f"1레벨 필요 경험치: {SEASON_XP_PER_LEVEL:,} XP\n"
-            f"Lv.{SEASON_MAX_LEVEL} 필요 경험치: {SEASON_TOTAL_XP_TO_MAX:,} XP"
-        ),
-        inline=False,
-    )
-    embed.add_field(
-        name="이번 시즌 Lv.100 보상",
-        value=f"[ {reward.get('title_name', '아직 설정되지 않음')} ]",
-        inline=False,
-    )
+    embed.add_field(name="시즌 기간", value=season_period_text(cal), inline=False)
+    embed.add_field(name="진행 기준", value=SEASON_RULES_TEXT, inline=False)
+    embed.add_field(name="이번 시즌 Lv.100 보상", value=season_reward_text(reward), inline=False)
     return embed
 
 
@@ -3191,28 +5962,9 @@ def build_first_season_start_embed(
         ),
         color=discord.Color.green(),
     )
-    embed.add_field(
-        name="시즌 기간",
-        value=(
-            f"정규 시즌: {cal['regular_start']} ~ {cal['regular_end']}\n"
-            f"프리시즌: {cal['preseason_start']} ~ {cal['preseason_end']}"
-        ),
-        inline=False,
-    )
-    embed.add_field(
-        name="진행 기준",
-        value=(
-            f"최대 레벨: Lv.{SEASON_MAX_LEVEL}\n"
-            f"1레벨 필요 경험치: {SEASON_XP_PER_LEVEL:,} XP\n"
-            f"Lv.{SEASON_MAX_LEVEL} 필요 경험치: {SEASON_TOTAL_XP_TO_MAX:,} XP"
-        ),
-        inline=False,
-    )
-    embed.add_field(
-        name="이번 시즌 Lv.100 보상",
-        value=f"[ {reward.get('title_name', '아직 설정되지 않음')} ]",
-        inline=False,
-    )
+    embed.add_field(name="시즌 기간", value=season_period_text(cal), inline=False)
+    embed.add_field(name="진행 기준", value=SEASON_RULES_TEXT, inline=False)
+    embed.add_field(name="이번 시즌 Lv.100 보상", value=season_reward_text(reward), inline=False)
     if extra_notice:
         embed.add_field(name="추가 안내", value=extra_notice[:1024], inline=False)
     embed.set_footer(text="첫 시즌은 시즌패스 전환 후 진행되는 첫 운영 시즌입니다.")
@@ -3271,16 +6023,8 @@ async def _process_season_start_if_needed_locked(guild: discord.Guild) -> dict:
     if not guild:
         return {"processed": False, "reason": "no_guild"}
 
-    def _load_state_and_calendar():
-        cal = get_calendar_season_info(datetime.now(KST))
-        ref = _season_state_ref()
-        state = ref.get()
-        if not isinstance(state, dict):
-            state = _default_season_state_from_calendar(cal)
-            ref.set(state)
-        return state, cal
-
-    state, cal = await asyncio.to_thread(_load_state_and_calendar)
+    state = await season_state_cache.aget_raw()
+    cal = get_calendar_season_info(datetime.now(KST))
     if not state.get("first_season_started"):
         await _update_season_state({
             "status": SEASON_STATUS_LOCKED,
@@ -3364,6 +6108,10 @@ async def _process_season_start_if_needed_locked(guild: discord.Guild) -> dict:
 
             role_removed_count = role_failed_count = 0
             nick_updated_count = nick_failed_count = 0
+            try:
+                await aprime_user_titles_cache()
+            except Exception as e:
+                logging.warning(f"[first-season] postprocess user title cache prime failed: {e!r}")
             for member in guild.members:
                 if member.bot:
                     continue
@@ -3836,6 +6584,9 @@ async def first_season_start(
             )
 
         logging.warning("[first-season] commit response failed, but committed state was verified")
+        # 성공 경로와 같이 미러·순위 색인·칭호 캐시에도 반영합니다.
+        _apply_root_updates_to_caches(updates)
+        await season_state_cache.load(force=True)
 
     try:
         save_json(MISSION_PATH, {})
@@ -3844,6 +6595,10 @@ async def first_season_start(
 
     role_removed_count = role_failed_count = 0
     nick_updated_count = nick_failed_count = 0
+    try:
+        await aprime_user_titles_cache()
+    except Exception as e:
+        logging.warning(f"[first-season] user title cache prime failed: {e!r}")
     for member in interaction.guild.members:
         if member.bot:
             continue
@@ -3911,6 +6666,7 @@ async def first_season_start(
         })
     except Exception as e:
         logging.warning(f"[first-season] final migration record update failed: {e!r}")
+    request_season_transition_check("first_season_start")
 
     log_channel = interaction.guild.get_channel(LOG_CHANNEL_ID)
     if log_channel:
@@ -3944,26 +6700,49 @@ async def first_season_start(
     )
     await interaction.followup.send(embed=result_embed, ephemeral=True)
 
-@app_commands.guild_only()
-@bot.tree.command(name="시즌정보", description="현재 시즌패스 정보와 내 진행도를 확인합니다.")
-async def season_info(interaction: discord.Interaction):
-    await interaction.response.defer()
+
+# 시즌 정보 중 서버 공통 부분(상태, 기간, 기준, 보상, 안내)은 시즌 상태 버전, 날짜, 보상 버전이 같으면 재사용합니다.
+_SEASON_INFO_VIEW_CACHE: dict = {"key": None, "view": None}
+
+
+def _season_info_footer(state: dict, status: str) -> Optional[str]:
+    if status == SEASON_STATUS_LOCKED:
+        if not state.get("first_season_started"):
+            return "첫 시즌 시작 전입니다. 관리자가 /시즌보상설정 후 /첫시즌시작 을 실행해야 시즌패스가 열립니다."
+        return "/현재시즌초기화, /다음시즌준비, 다음 시즌 보상 설정을 완료해야 시즌이 열립니다."
+    if status == SEASON_STATUS_PRESEASON:
+        if not state.get("settled"):
+            return "프리시즌 기간입니다. 관리자가 /현재시즌초기화 로 현재 시즌을 정산해야 합니다."
+        if not state.get("next_ready"):
+            return "현재 시즌 정산이 완료되었습니다. 관리자가 /다음시즌준비 로 다음 시즌명을 등록해야 합니다."
+        return "다음 시즌 이름과 보상을 모두 설정하면 시작일에 자동으로 시즌이 열립니다."
+    return None
+
+
+async def aget_season_info_view() -> dict:
     state = await aget_effective_season_state()
-    cal = state.get("calendar") or get_calendar_season_info(datetime.now(KST))
+    now = datetime.now(KST)
+    # 남은 기간(D-n)이 날짜에 따라 바뀌므로 날짜도 키에 넣습니다.
+    key = (season_state_cache.version, now.date().isoformat(), _SEASON_REWARD_VERSION)
+    if _SEASON_INFO_VIEW_CACHE["key"] == key:
+        return _SEASON_INFO_VIEW_CACHE["view"]
+
+    cal = state.get("calendar") or get_calendar_season_info(now)
     current_season_id = state.get("current_season_id") or cal["season_id"]
-    reward = await _get_season_reward(current_season_id)
+    next_id = state.get("next_season_id") or cal.get("next_season_id")
+
+    fetches = {"reward": _get_season_reward(current_season_id)}
+    if state.get("settled") and next_id:
+        fetches["next_reward"] = _get_season_reward(next_id)
+    # 조회 실패 시 None 으로 대체하고, 그런 결과는 캐시하지 않습니다.
+    rewards = await gather_with_deadline(
+        fetches,
+        fallbacks={name: None for name in fetches},
+        label="/시즌정보",
+    )
+    degraded = any(value is None for value in rewards.values())
 
-    uid = str(interaction.user.id)
-    user_data = await aget_user_exp(uid)
-    if state.get("first_season_started"):
-        total_xp = max(0, _safe_int(user_data.get("exp", 0), 0))
-    else:
-        # 기존 레벨 EXP는 첫 시즌 시작 전 시즌패스 진행도로 노출하지 않습니다.
-        total_xp = 0
-    level, cur_xp, need_xp, pct = get_level_progress(total_xp)
-    pct_int = int(round(pct * 100))
     status = state.get("status", cal.get("status"))
-
     if status == SEASON_STATUS_REGULAR:
         remain_label = f"D-{days_left_until(cal['regular_end'])}"
         status_desc = "경험치 획득 가능"
@@ -3983,32 +6762,59 @@ async def season_info(interaction: discord.Interaction):
             else "정산 또는 다음 시즌 준비가 완료되지 않아 경험치 획득이 중단된 상태입니다."
         )
 
-    embed = discord.Embed(
-        title=f"🌿 시즌 정보 - {state.get('current_season_name', CURRENT_SEASON_NAME)}",
-        color=discord.Color.green() if status == SEASON_STATUS_REGULAR else discord.Color.orange(),
-    )
-    embed.add_field(
-        name="상태",
-        value=f"{season_status_label(status)}\n{status_desc}\n남은 기간: {remain_label}",
-        inline=False,
-    )
-    embed.add_field(
-        name="기간",
-        value=(
-            f"정규 시즌: {cal['regular_start']} ~ {cal['regular_end']}\n"
-            f"프리시즌: {cal['preseason_start']} ~ {cal['preseason_end']}"
-        ),
-        inline=False,
-    )
-    embed.add_field(
-        name="진행 기준",
-        value=(
-            f"최대 레벨: Lv.{SEASON_MAX_LEVEL}\n"
-            f"1레벨 필요 경험치: {SEASON_XP_PER_LEVEL:,} XP\n"
-            f"Lv.{SEASON_MAX_LEVEL} 필요 경험치: {SEASON_TOTAL_XP_TO_MAX:,} XP"
-        ),
-        inline=False,
+    tail_fields = [("현재 시즌 보상", season_reward_text(rewards.get("reward")))]
+    if state.get("settled"):
+        tail_fields.append(("다음 시즌 보상", season_reward_text(rewards.get("next_reward"))))
+    tail_fields.append((
+        "정산/다음 시즌",
+        f"현재 시즌 정산: {'완료' if state.get('settled') else '미완료'}\n"
+        f"다음 시즌 준비: {'완료' if state.get('next_ready') else '미완료'}\n"
+        f"다음 시즌명: {state.get('next_season_name') or '미설정'}",
+    ))
+
+    view = {
+        "title": f"🌿 시즌 정보 - {state.get('current_season_name', CURRENT_SEASON_NAME)}",
+        "color": discord.Color.green() if status == SEASON_STATUS_REGULAR else discord.Color.orange(),
+        "first_season_started": bool(state.get("first_season_started")),
+        "head_fields": [
+            ("상태", f"{season_status_label(status)}\n{status_desc}\n남은 기간: {remain_label}"),
+            ("기간", season_period_text(cal)),
+            ("진행 기준", SEASON_RULES_TEXT),
+        ],
+        "tail_fields": tail_fields,
+        "footer": _season_info_footer(state, status),
+    }
+    if not degraded:
+        _SEASON_INFO_VIEW_CACHE["key"] = key
+        _SEASON_INFO_VIEW_CACHE["view"] = view
+    return view
+
+
+@app_commands.guild_only()
+@bot.tree.command(name="시즌정보", description="현재 시즌패스 정보와 내 진행도를 확인합니다.")
+async def season_info(interaction: discord.Interaction):
+    await interaction.response.defer()
+    uid = str(interaction.user.id)
+    gathered = await gather_with_deadline(
+        {
+            "view": aget_season_info_view(),
+            "user": aget_user_exp(uid),
+        },
+        label="/시즌정보",
     )
+    view = gathered["view"]
+    user_data = gathered["user"]
+    if view["first_season_started"]:
+        total_xp = max(0, _safe_int(user_data.get("exp", 0), 0))
+    else:
+        # 기존 레벨 EXP는 첫 시즌 시작 전 시즌패스 진행도로 노출하지 않습니다.
+        total_xp = 0
+    level, cur_xp, need_xp, pct = get_level_progress(total_xp)
+    pct_int = int(round(pct * 100))
+
+    embed = discord.Embed(title=view["title"], color=view["color"])
+    for name, value in view["head_fields"]:
+        embed.add_field(name=name, value=value, inline=False)
     embed.add_field(
         name="내 진행도",
         value=(
@@ -4018,43 +6824,10 @@ async def season_info(interaction: discord.Interaction):
         ),
         inline=False,
     )
-    embed.add_field(
-        name="현재 시즌 보상",
-        value=f"[ {reward.get('title_name', '아직 설정되지 않음')} ]",
-        inline=False,
-    )
-
-    if state.get("settled"):
-        next_id = state.get("next_season_id") or cal.get("next_season_id")
-        next_reward = await _get_season_reward(next_id) if next_id else {}
-        embed.add_field(
-            name="다음 시즌 보상",
-            value=f"[ {next_reward.get('title_name', '아직 설정되지 않음')} ]",
-            inline=False,
-        )
-
-    embed.add_field(
-        name="정산/다음 시즌",
-        value=(
-            f"현재 시즌 정산: {'완료' if state.get('settled') else '미완료'}\n"
-            f"다음 시즌 준비: {'완료' if state.get('next_ready') else '미완료'}\n"
-            f"다음 시즌명: {state.get('next_season_name') or '미설정'}"
-        ),
-        inline=False,
-    )
-
-    if status == SEASON_STATUS_LOCKED:
-        if not state.get("first_season_started"):
-            embed.set_footer(text="첫 시즌 시작 전입니다. 관리자가 /시즌보상설정 후 /첫시즌시작 을 실행해야 시즌패스가 열립니다.")
-        else:
-            embed.set_footer(text="/현재시즌초기화, /다음시즌준비, 다음 시즌 보상 설정을 완료해야 시즌이 열립니다.")
-    elif status == SEASON_STATUS_PRESEASON:
-        if not state.get("settled"):
-            embed.set_footer(text="프리시즌 기간입니다. 관리자가 /현재시즌초기화 로 현재 시즌을 정산해야 합니다.")
-        elif not state.get("next_ready"):
-            embed.set_footer(text="현재 시즌 정산이 완료되었습니다. 관리자가 /다음시즌준비 로 다음 시즌명을 등록해야 합니다.")
-        else:
-            embed.set_footer(text="다음 시즌 이름과 보상을 모두 설정하면 시작일에 자동으로 시즌이 열립니다.")
+    for name, value in view["tail_fields"]:
+        embed.add_field(name=name, value=value, inline=False)
+    if view["footer"]:
+        embed.set_footer(text=view["footer"])
 
     await interaction.followup.send(embed=embed)
 
@@ -4102,6 +6875,7 @@ async def season_reward_set(interaction: discord.Interaction, 칭호명: str, 
         "updated_at": datetime.now(KST).isoformat(),
     }
     await _set_season_reward(season_id, data)
+    request_season_transition_check("season_reward_set")
     existing_updated = await update_existing_season_title_metadata(season_id, 칭호명, 설명)
 
     awarded = checked = 0
@@ -4114,15 +6888,18 @@ async def season_reward_set(interaction: discord.Interaction, 칭호명: str, 
 
     if is_active_current:
         exp_data = await aload_exp_data()
+        humans = human_member_ids(interaction.guild)
         if isinstance(exp_data, dict):
             for uid, user_data in exp_data.items():
                 if not isinstance(user_data, dict) or not str(uid).isdigit():
                     continue
+                if int(uid) not in humans:
+                    continue
                 level = calculate_level(_safe_int(user_data.get("exp", 0), 0))
                 if level < SEASON_MAX_LEVEL:
                     continue
                 member = interaction.guild.get_member(int(uid))
-                if member and not member.bot:
+                if member:
                     result = await maybe_award_level100(member, level, reason="reward_set_retroactive")
                     checked += 1
                     if result.get("awarded"):
@@ -4188,6 +6965,7 @@ async def next_season_prepare(interaction: discord.Interaction, 시즌이름: st
         "next_prepared_by": str(interaction.user.id),
         "next_prepared_at": datetime.now(KST).isoformat(),
     })
+    request_season_transition_check("next_season_prepare")
 
     # locked 상태에서 준비가 완료되면 즉시 개방 가능한지 갱신
     await interaction.response.send_message(
@@ -4247,6 +7025,7 @@ async def current_season_reset(interaction: discord.Interaction):
     if not isinstance(exp_data, dict):
         exp_data = {}
 
+    humans = human_member_ids(interaction.guild)
     now_iso = datetime.now(KST).isoformat()
     reached: list[str] = []
     dm_success: list[str] = []
@@ -4265,12 +7044,9 @@ async def current_season_reset(interaction: discord.Interaction):
 
         if reached_100:
             reached.append(uid)
-            member = None
-            try:
-                member = interaction.guild.get_member(int(uid)) or await interaction.guild.fetch_member(int(uid))
-            except Exception:
-                pass
-            if member and not member.bot:
+            # 서버원 캐시는 위에서 완전성을 확인했으므로 떠난 유저에게 REST 조회를 보내지 않습니다.
+            member = interaction.guild.get_member(int(uid)) if uid.isdigit() and int(uid) in humans else None
+            if member:
                 await maybe_award_level100(member, level, reason="season_settlement")
                 completion = await asyncio.to_thread(
                     lambda sid=season_id, x=uid: _season_completion_ref(sid, x).get() or {}
@@ -4332,6 +7108,9 @@ async def current_season_reset(interaction: discord.Interaction):
                 ephemeral=True,
             )
         logging.warning("[season-settlement] update response failed, but committed state was verified")
+        # 성공 경로와 같이 미러·순위 색인·칭호 캐시에도 반영합니다.
+        _apply_root_updates_to_caches(settlement_updates)
+        await season_state_cache.load(force=True)
 
     try:
         save_json(MISSION_PATH, {})
@@ -4394,6 +7173,7 @@ async def current_season_reset(interaction: discord.Interaction):
         "settlement_notice_pending": not notice_sent,
         "settlement_log_sent_for": season_id if log_sent else "",
     })
+    request_season_transition_check("current_season_reset")
 
     await interaction.followup.send(embed=embed, ephemeral=True)
 
@@ -4649,6 +7429,80 @@ async def disconnect_voice(
         ephemeral=True
     )
 
+# =========================
+# Startup warm-up
+# =========================
+# 배포 직후 첫 /정보가 템플릿 디코드, 폰트 로드, 첫 저장소 조회 비용을 8초 예산 안에서 치르지 않도록
+# 웹 서버가 뜬 직후 백그라운드에서 미리 채워 둡니다. 진행 상황은 /ready 에 보고됩니다.
+
+_WARMUP_STATE = {"status": "pending", "started_at": None, "finished_at": None, "steps": {}}
+_warmup_task: Optional[asyncio.Task] = None
+
+
+async def _warmup_step(name: str, func):
+    started = time.perf_counter()
+    try:
+        result = await func()
+        step = {"ok": True, "ms": round((time.perf_counter() - started) * 1000, 1)}
+        if result is not None:
+            step["result"] = result
+    except Exception as e:
+        logging.warning(f"[warmup] {name} failed: {e!r}")
+        step = {"ok": False, "ms": round((time.perf_counter() - started) * 1000, 1), "error": repr(e)}
+    _WARMUP_STATE["steps"][name] = step
+
+
+async def _warm_render_assets():
+    # 프로세스 워커는 initializer로 따로 예열되고, 여기서는 스레드 폴백용 메인 프로세스 캐시를 채웁니다.
+    await asyncio.to_thread(rank_render.warm_worker)
+
+
+async def _warm_season_caches():
+    # 시즌 상태는 시작 시 한 번 읽고 이후 리스너로 갱신합니다. 실패하면 첫 조회 때 다시 읽습니다.
+    await _warmup_step("season_state", season_state_cache.start)
+
+    # Lv.100 지급 색인은 현재 시즌 것만 미리 읽습니다. 실패해도 첫 확인 때 다시 시도합니다.
+    async def _award_index():
+        state = await aget_effective_season_state()
+        if state.get("current_season_id"):
+            return await aload_level100_award_index(state["current_season_id"])
+        return None
+
+    await _warmup_step("level100_award_index", _award_index)
+
+
+async def _warm_guild_configs():
+    await bot.wait_until_ready()
+    for guild in bot.guilds:
+        await aget_guild_config(guild.id)
+    return len(bot.guilds)
+
+
+async def run_startup_warmup():
+    _WARMUP_STATE["status"] = "running"
+    _WARMUP_STATE["started_at"] = datetime.now(KST).isoformat()
+    logging.info("[warmup] start")
+
+    await asyncio.gather(
+        _warmup_step("render_assets", _warm_render_assets),
+        _warm_season_caches(),
+        _warmup_step("user_titles", aprime_user_titles_cache),
+        _warmup_step("exp_mirror", exp_mirror.ensure_loaded),
+        _warmup_step("attendance_mirror", attendance_mirror.ensure_loaded),
+    )
+    # 서버 목록은 로그인 이후에만 알 수 있으므로 on_ready 뒤에 채웁니다.
+    await _warmup_step("guild_config", _warm_guild_configs)
+
+    failed = [name for name, step in _WARMUP_STATE["steps"].items() if not step.get("ok")]
+    _WARMUP_STATE["status"] = "degraded" if failed else "done"
+    _WARMUP_STATE["finished_at"] = datetime.now(KST).isoformat()
+    logging.info(f"[warmup] {_WARMUP_STATE['status']} failed={failed}")
+
+
+def warmup_finished() -> bool:
+    return _WARMUP_STATE["status"] in {"done", "degraded"}
+
+
 # ---- 실행 및 웹 서버 유지 ----
 from aiohttp import web
 
@@ -4659,17 +7513,30 @@ async def health(_request):
         "process": "ok",
         "discord_ready": bool(bot.is_ready()),
         "guild_count": len(bot.guilds),
+        "jobs": background_scheduler.snapshot(),
+        "avatar_cache": avatar_cache.stats(),
+        "rank_card": rank_card_stats(),
+        "render": render_service.stats(),
+        "attachment_cache": attachment_url_cache.stats(),
+        "attendance_surge": attendance_surge.stats(),
+        "member_resolver": {
+            "gateway_queries": member_resolver.gateway_queries,
+            "rest_fallbacks": member_resolver.rest_fallbacks,
+            "known_missing": len(member_resolver._missing),
+        },
     })
 
 
 async def readiness(_request):
-    """Discord 로그인까지 완료됐는지 확인하는 준비 상태 엔드포인트입니다."""
-    ready = bool(bot.is_ready())
+    """Discord 로그인과 시작 예열까지 완료됐는지 확인하는 준비 상태 엔드포인트입니다."""
+    ready = bool(bot.is_ready()) and warmup_finished()
     return web.json_response(
         {
             "ready": ready,
+            "discord_ready": bool(bot.is_ready()),
             "discord_user": str(bot.user) if bot.user else None,
             "guild_count": len(bot.guilds),
+            "warmup": _WARMUP_STATE,
         },
         status=200 if ready else 503,
     )
@@ -4876,8 +7743,17 @@ logging.getLogger("discord.http").setLevel(logging.INFO)
 async def _main():
     # 포트 바인딩(웹 서버) 먼저 시작 → Render의 포트 스캔 통과
     await start_web_app()
+    # 렌더링 워커는 다른 스레드가 뜨기 전에 fork 해야 하므로 예열보다 먼저 시작합니다.
+    render_service.start()
+    # 캐시 예열은 로그인과 동시에 백그라운드에서 진행합니다.
+    global _warmup_task
+    _warmup_task = asyncio.create_task(run_startup_warmup())
     # 이후 디스코드 로그인 루프 진입
-    await _safe_start()
+    try:
+        await _safe_start()
+    finally:
+        await close_http_session()
+        render_service.shutdown()
 
 if __name__ == "__main__":
     asyncio.run(_main())
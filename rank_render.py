@@ -0,0 +1,465 @@
+"""
+랭크 카드 / 일일 퀘스트 배너 렌더러.
+
+디스코드, Firebase에 의존하지 않는 순수 Pillow 코드만 둡니다.
+렌더링 프로세스 풀의 워커가 이 모듈만 import 하므로 main.py를 다시 실행하지 않습니다.
+"""
+import os
+import time
+from io import BytesIO
+from threading import Lock, local
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from PIL import Image, ImageDraw, ImageFont
+
+# =========================
+# Rank card rendering (Pillow)
+# =========================
+
+_ASSET_DIR = os.path.join(os.path.dirname(__file__), "assets")
+_BG_PATH = os.path.join(_ASSET_DIR, "rank_bg.png")
+_FONT_PATH = os.path.join(_ASSET_DIR, "fonts", "Donoun Medium.ttf")  # 네가 넣은 폰트명에 맞춤
+
+_BG_TEMPLATE = None  # type: Optional[Image.Image]
+# FreeType 핸들은 스레드 간에 공유하지 않습니다. 프로세스 워커는 모듈 자체가 따로 로드됩니다.
+_FONT_LOCAL = local()  # .cache: size -> ImageFont.FreeTypeFont
+
+# (폰트 크기, 문자열) -> 폭. 폰트 파일이 하나뿐이므로 크기만으로 폰트가 정해집니다.
+_TEXT_WIDTH_CACHE = OrderedDict()
+_TEXT_WIDTH_CACHE_MAX = int(os.getenv("TEXT_WIDTH_CACHE_MAX", "8192"))
+_TEXT_WIDTH_LOCK = Lock()
+# (폰트 크기, 최대 폭, 문자열) -> 말줄임 결과. 같은 닉네임이 반복해서 그려지므로 결과째로 재사용합니다.
+_ELLIPSIZE_CACHE = OrderedDict()
+
+_QUEST_BG_PATH = os.path.join(_ASSET_DIR, "quest_banner_bg.png")
+_QUEST_BG_TEMPLATE = None  # type: Optional[Image.Image]
+
+def _get_quest_bg_template() -> Image.Image:
+    global _QUEST_BG_TEMPLATE
+    if _QUEST_BG_TEMPLATE is None:
+        try:
+            bg = Image.open(_QUEST_BG_PATH).convert("RGBA")
+        except Exception:
+            # 파일 없으면 rank_bg로 폴백
+            bg = _get_bg_template()
+        _QUEST_BG_TEMPLATE = bg
+    return _QUEST_BG_TEMPLATE
+
+
+def _get_bg_template() -> Image.Image:
+    global _BG_TEMPLATE
+    if _BG_TEMPLATE is None:
+        bg = Image.open(_BG_PATH).convert("RGBA")
+        _BG_TEMPLATE = bg
+    return _BG_TEMPLATE
+
+
+def _get_font(size: int) -> ImageFont.FreeTypeFont:
+    cache = getattr(_FONT_LOCAL, "cache", None)
+    if cache is None:
+        cache = _FONT_LOCAL.cache = {}
+    font = cache.get(size)
+    if font is None:
+        font = ImageFont.truetype(_FONT_PATH, size)
+        cache[size] = font
+    return font
+
+
+def _text_width(text: str, size: int) -> float:
+    key = (size, text)
+    with _TEXT_WIDTH_LOCK:
+        width = _TEXT_WIDTH_CACHE.get(key)
+        if width is not None:
+            _TEXT_WIDTH_CACHE.move_to_end(key)
+            return width
+    width = _get_font(size).getlength(text)
+    with _TEXT_WIDTH_LOCK:
+        _TEXT_WIDTH_CACHE[key] = width
+        while len(_TEXT_WIDTH_CACHE) > _TEXT_WIDTH_CACHE_MAX:
+            _TEXT_WIDTH_CACHE.popitem(last=False)
+    return width
+
+
+def _format_int(n: int) -> str:
+    try:
+        return f"{int(n):,}"
+    except Exception:
+        return str(n)
+
+
+def _clamp01(x: float) -> float:
+    if x < 0.0:
+        return 0.0
+    if x > 1.0:
+        return 1.0
+    return x
+
+
+def _ellipsize(text: str, font: ImageFont.FreeTypeFont, max_width: int) -> str:
+    if not text:
+        return ""
+    size = font.size
+    if _text_width(text, size) <= max_width:
+        return text
+
+    key = (size, max_width, text)
+    with _TEXT_WIDTH_LOCK:
+        cached = _ELLIPSIZE_CACHE.get(key)
+        if cached is not None:
+            _ELLIPSIZE_CACHE.move_to_end(key)
+            return cached
+
+    ell = "…"
+    ell_w = _text_width(ell, size)
+    lo, hi = 0, len(text)
+    # 이진 탐색으로 최대 길이 찾기. 중간 접두어는 다시 쓰이지 않으므로 폭 캐시에 넣지 않고 바로 잽니다.
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if font.getlength(text[:mid]) + ell_w <= max_width:
+            lo = mid + 1
+        else:
+            hi = mid
+    cut = max(0, lo - 1)
+    # 접두어 + 말줄임표 합산은 커닝을 무시하므로 실제 폭으로 한 번 더 확인합니다.
+    while cut > 0 and font.getlength(text[:cut] + ell) > max_width:
+        cut -= 1
+    result = text[:cut] + ell
+    with _TEXT_WIDTH_LOCK:
+        _ELLIPSIZE_CACHE[key] = result
+        while len(_ELLIPSIZE_CACHE) > _TEXT_WIDTH_CACHE_MAX:
+            _ELLIPSIZE_CACHE.popitem(last=False)
+    return result
+
+
+def _circle_crop(im: Image.Image, size: int) -> Image.Image:
+    # 정사각으로 맞춘 뒤 원형 마스크
+    im = im.convert("RGBA")
+    w, h = im.size
+    s = min(w, h)
+    left = (w - s) // 2
+    top = (h - s) // 2
+    im = im.crop((left, top, left + s, top + s))
+
+    resample = getattr(Image, "Resampling", None)
+    if resample is not None:
+        im = im.resize((size, size), resample=resample.LANCZOS)
+    else:
+        im = im.resize((size, size), resample=Image.LANCZOS)
+
+    mask = Image.new("L", (size, size), 0)
+    md = ImageDraw.Draw(mask)
+    md.ellipse((0, 0, size - 1, size - 1), fill=255)
+
+    out = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    out.paste(im, (0, 0), mask)
+    return out
+
+
+# 원형으로 잘라 둔 아바타. 렌더러가 스레드에서 돌기 때문에 잠금으로 보호합니다.
+_AVATAR_CIRCLE_CACHE = OrderedDict()  # (avatar_key, size) -> Image.Image
+_AVATAR_CIRCLE_CACHE_MAX = int(os.getenv("AVATAR_CIRCLE_CACHE_MAX", "256"))
+_AVATAR_CIRCLE_LOCK = Lock()
+
+
+def _get_circle_avatar(avatar_bytes: bytes, size: int, avatar_key: Optional[str] = None) -> Image.Image:
+    """아바타 키가 같으면 디코드와 원형 크롭을 다시 하지 않습니다."""
+    if avatar_key:
+        cache_key = (avatar_key, size)
+        with _AVATAR_CIRCLE_LOCK:
+            cached = _AVATAR_CIRCLE_CACHE.get(cache_key)
+            if cached is not None:
+                _AVATAR_CIRCLE_CACHE.move_to_end(cache_key)
+                return cached
+
+    av = _circle_crop(Image.open(BytesIO(avatar_bytes)), size)
+
+    if avatar_key:
+        with _AVATAR_CIRCLE_LOCK:
+            _AVATAR_CIRCLE_CACHE[cache_key] = av
+            _AVATAR_CIRCLE_CACHE.move_to_end(cache_key)
+            while len(_AVATAR_CIRCLE_CACHE) > _AVATAR_CIRCLE_CACHE_MAX:
+                _AVATAR_CIRCLE_CACHE.popitem(last=False)
+    return av
+
+
+# ===== 랭크 카드 레이아웃 (600x240 기준) =====
+_RANK_AVATAR_SIZE = 96
+_RANK_AVATAR_X, _RANK_AVATAR_Y = 36, 72
+_RANK_TEXT_X = 155
+_RANK_NAME_Y = 60
+_RANK_STAT_Y = 102
+_RANK_XP_Y = 130
+_RANK_BAR_X, _RANK_BAR_Y = 150, 180
+_RANK_BAR_W, _RANK_BAR_H = 300, 22
+_RANK_BAR_RADIUS = 11  # BAR_H//2
+
+_RANK_BASE = None  # type: Optional[Image.Image]  # 배경 + 진행도 바 배경까지 미리 그린 정적 레이어
+_RANK_BASE_LOCK = Lock()
+
+
+def _get_rank_base() -> Image.Image:
+    """유저와 무관한 정적 레이어를 한 번만 합성해 둡니다."""
+    global _RANK_BASE
+    if _RANK_BASE is None:
+        with _RANK_BASE_LOCK:
+            if _RANK_BASE is None:
+                base = _get_bg_template().copy()
+                ImageDraw.Draw(base).rounded_rectangle(
+                    (_RANK_BAR_X, _RANK_BAR_Y, _RANK_BAR_X + _RANK_BAR_W, _RANK_BAR_Y + _RANK_BAR_H),
+                    radius=_RANK_BAR_RADIUS,
+                    fill=(0xED, 0xF8, 0xFC, 255),
+                )
+                _RANK_BASE = base
+    return _RANK_BASE
+
+
+def _rank_avatar_layer(avatar_bytes: Optional[bytes], avatar_key: Optional[str]) -> Optional[Image.Image]:
+    if not avatar_bytes:
+        return None
+    try:
+        return _get_circle_avatar(avatar_bytes, _RANK_AVATAR_SIZE, avatar_key)
+    except Exception:
+        # 아바타 실패 시 회색 원으로 대체
+        fallback = Image.new("RGBA", (_RANK_AVATAR_SIZE, _RANK_AVATAR_SIZE), (0, 0, 0, 0))
+        fd = ImageDraw.Draw(fallback)
+        fd.ellipse((0, 0, _RANK_AVATAR_SIZE - 1, _RANK_AVATAR_SIZE - 1), fill=(120, 120, 120, 255))
+        return fallback
+
+
+def _draw_rank_dynamic(
+    img: Image.Image,
+    *,
+    display_name: str,
+    level: int,
+    total_xp: int,
+    cur_xp: int,
+    need_xp: int,
+    pct: float,
+):
+    """닉네임, 수치, 진행도 채움처럼 유저마다 달라지는 레이어를 그립니다."""
+    draw = ImageDraw.Draw(img)
+    font_name = _get_font(28)
+    font_stat = _get_font(22)
+    font_small = _get_font(18)
+
+    # ===== 닉네임 =====
+    name_max_w = 600 - _RANK_TEXT_X - 30
+    safe_name = _ellipsize(display_name, font_name, name_max_w)
+    draw.text((_RANK_TEXT_X, _RANK_NAME_Y), safe_name, font=font_name, fill=(0x05, 0x44, 0x6B, 255))
+
+    # ===== 레벨 / XP =====
+    draw.text((_RANK_TEXT_X, _RANK_STAT_Y), f"Lv. {int(level)}", font=font_stat, fill=(0xFF, 0xFF, 0xFF, 255))
+    draw.text((_RANK_TEXT_X, _RANK_XP_Y), f"XP  {_format_int(total_xp)}", font=font_stat, fill=(0x9E, 0x9E, 0x9E, 255))
+
+    # ===== 진행도 바 채움 =====
+    pct = _clamp01(float(pct))
+    fill_w = int(_RANK_BAR_W * pct)
+    if fill_w > 0:
+        draw.rounded_rectangle(
+            (_RANK_BAR_X, _RANK_BAR_Y, _RANK_BAR_X + fill_w, _RANK_BAR_Y + _RANK_BAR_H),
+            radius=_RANK_BAR_RADIUS,
+            fill=(0x05, 0x44, 0x6B, 255),
+        )
+
+    # 진행도 텍스트
+    # 예: "123 / 456 (27%)"
+    pct_int = int(round(pct * 100))
+    prog_text = f"{_format_int(cur_xp)} / {_format_int(need_xp)} ({pct_int}%)"
+    draw.text((_RANK_BAR_X, _RANK_BAR_Y - 22), prog_text, font=font_small, fill=(60, 60, 60, 255))
+
+
+def compose_rank_card(
+    *,
+    display_name: str,
+    level: int,
+    total_xp: int,
+    cur_xp: int,
+    need_xp: int,
+    pct: float,
+    avatar_bytes: Optional[bytes] = None,
+    avatar_key: Optional[str] = None,
+) -> Image.Image:
+    """정적 레이어(배경, 바 배경) 위에 아바타와 동적 레이어를 합성합니다."""
+    img = _get_rank_base().copy()
+
+    avatar = _rank_avatar_layer(avatar_bytes, avatar_key)
+    if avatar is not None:
+        img.paste(avatar, (_RANK_AVATAR_X, _RANK_AVATAR_Y), avatar)
+
+    _draw_rank_dynamic(
+        img,
+        display_name=display_name,
+        level=level,
+        total_xp=total_xp,
+        cur_xp=cur_xp,
+        need_xp=need_xp,
+        pct=pct,
+    )
+    return img
+
+
+def render_rank_card(*, encode_profile: str = "png", **kwargs) -> BytesIO:
+    """
+    디스코드/DB와 무관한 순수 렌더러.
+    - 입력: 가공된 수치 + 아바타 이미지 bytes
+    - 출력: 인코딩된 이미지(BytesIO). 기본은 예전과 같은 PNG입니다.
+    """
+    return BytesIO(encode_image(compose_rank_card(**kwargs), encode_profile).data)
+
+
+_BANNER_TEXT_X = 18
+_BANNER_FONT_SIZE = 16
+_BANNER_SEP = "   |   "
+_BANNER_LAYOUT_CACHE = {}  # (height, reward_pct) -> (배경, 고정 접두어, 접두어 폭, 최대 폭)
+_BANNER_LAYOUT_LOCK = Lock()
+
+
+def _banner_static_layout(height: int, reward_pct: int) -> tuple:
+    """높이와 보상 비율이 같으면 배경 잘라내기와 고정 문구 측정을 다시 하지 않습니다."""
+    key = (int(height), int(reward_pct))
+    layout = _BANNER_LAYOUT_CACHE.get(key)
+    if layout is not None:
+        return layout
+
+    bg = _get_quest_bg_template()
+    w = bg.size[0]
+    h = key[0]
+    base = bg.crop((0, 0, w, min(h, bg.size[1]))).copy()
+    if base.size[1] != h:
+        padded = Image.new("RGBA", (w, h), (245, 245, 245, 255))
+        padded.paste(base, (0, 0))
+        base = padded
+
+    title = "일일 퀘스트 성공!"
+    reward = f"경험치 {key[1]}% 지급"
+    prefix = f"{title}  {reward}{_BANNER_SEP}"
+    layout = (base, prefix, _text_width(prefix, _BANNER_FONT_SIZE), w - (_BANNER_TEXT_X * 2))
+    with _BANNER_LAYOUT_LOCK:
+        _BANNER_LAYOUT_CACHE[key] = layout
+    return layout
+
+
+def compose_daily_quest_banner(
+    *,
+    display_name: str,
+    pct_int: int,
+    height: int = 70,
+    reward_pct: int = 1,
+) -> Image.Image:
+    """
+    채팅 한 줄 체감용 초슬림 배너 (아이콘 없음, 단일 행)
+    레이아웃:
+    [일일 퀘스트 성공!  경험치 1% 지급   |   서버 닉네임 님의   |   현재 경험치 37%]
+    """
+    base, prefix, prefix_w, max_w = _banner_static_layout(height, reward_pct)
+    h = base.size[1]
+    img = base.copy()
+
+    draw = ImageDraw.Draw(img)
+    font = _get_font(_BANNER_FONT_SIZE)
+
+    nick = f"{display_name} 님의"
+    prog = f"현재 경험치 {max(0, min(100, int(pct_int)))}%"
+    rest = f"{nick}{_BANNER_SEP}{prog}"
+    line = f"{prefix}{rest}"
+
+    # 접두어는 공백으로 끝나 가변부와 커닝이 생기지 않으므로 두 폭의 합으로 판단하고, 넘칠 때만 말줄임합니다.
+    if prefix_w + _text_width(rest, _BANNER_FONT_SIZE) <= max_w:
+        safe_line = line
+    else:
+        safe_line = _ellipsize(line, font, max_w)
+
+    bbox = draw.textbbox((0, 0), safe_line, font=font)
+    text_h = bbox[3] - bbox[1]
+    y = (h - text_h) // 2 - bbox[1]
+
+    draw.text((_BANNER_TEXT_X, y), safe_line, font=font, fill=(0, 0, 0, 255))
+    return img
+
+
+def render_daily_quest_banner(*, encode_profile: str = "png", **kwargs) -> BytesIO:
+    return BytesIO(encode_image(compose_daily_quest_banner(**kwargs), encode_profile).data)
+
+
+# =========================
+# Encode profiles
+# =========================
+# png           : Pillow 기본 zlib 설정 (기존 동작)
+# fast_png      : compress_level=1, 색이 256개 이하이고 불투명하면 무손실로 팔레트 변환
+# webp_lossless : 무손실 WebP, 인코딩 노력은 낮게
+# small         : 손실 WebP, 용량 우선
+
+ENCODE_PROFILES = ("png", "fast_png", "webp_lossless", "small")
+
+
+class EncodedImage(NamedTuple):
+    data: bytes
+    ext: str
+    profile: str
+    cpu_ms: float
+
+
+def _lossless_palette(img: Image.Image) -> Optional[Image.Image]:
+    """눈으로 구분되지 않는 경우(완전 불투명 + 256색 이하)에만 팔레트 이미지로 바꿉니다."""
+    if img.mode == "RGBA":
+        alpha_min, _ = img.getchannel("A").getextrema()
+        if alpha_min < 255:
+            return None
+    rgb = img.convert("RGB")
+    if rgb.getcolors(256) is None:
+        return None
+    palette = getattr(Image, "Palette", Image)
+    return rgb.convert("P", palette=palette.ADAPTIVE, colors=256)
+
+
+def encode_image(img: Image.Image, profile: str = "png") -> EncodedImage:
+    """이미지를 프로필에 맞게 인코딩하고 이 스레드가 쓴 CPU 시간을 함께 돌려줍니다."""
+    if profile not in ENCODE_PROFILES:
+        profile = "png"
+    started = time.thread_time()
+    buf = BytesIO()
+
+    if profile == "fast_png":
+        out = _lossless_palette(img) or img
+        out.save(buf, format="PNG", compress_level=1)
+        ext = "png"
+    elif profile == "webp_lossless":
+        # method=1/quality=25: 무손실 중 PNG 기본 설정과 비슷한 CPU로 가장 작게 나오는 지점 (실측).
+        img.save(buf, format="WEBP", lossless=True, quality=25, method=1)
+        ext = "webp"
+    elif profile == "small":
+        img.save(buf, format="WEBP", quality=80, method=4)
+        ext = "webp"
+    else:
+        img.save(buf, format="PNG")
+        ext = "png"
+
+    return EncodedImage(buf.getvalue(), ext, profile, (time.thread_time() - started) * 1000)
+
+
+# =========================
+# Worker entry points
+# =========================
+
+_COMPOSERS = {
+    "rank_card": compose_rank_card,
+    "quest_banner": compose_daily_quest_banner,
+}
+
+
+def warm_worker():
+    """워커 프로세스 시작 시 템플릿과 폰트를 미리 올려 둡니다. 캐시는 워커마다 따로 유지됩니다."""
+    try:
+        _get_rank_base()
+        _get_quest_bg_template()
+        for size in (16, 18, 22, 28):
+            _get_font(size)
+    except Exception:
+        pass
+
+
+def render_to_bytes(kind: str, kwargs: dict, profile: str = "png") -> EncodedImage:
+    """프로세스 경계를 넘길 수 있도록 인코딩된 바이트와 인코딩 비용을 함께 반환합니다."""
+    img = _COMPOSERS[kind](**kwargs)
+    return encode_image(img, profile)